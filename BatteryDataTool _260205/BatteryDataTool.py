@@ -4,13 +4,20 @@ import re
 import bisect
 import warnings
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+import io
+import threading
+import hashlib
+import pickle
+import collections
+import functools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import pyodbc
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.optimize import curve_fit, root_scalar
-from scipy.stats import linregress
+from scipy.optimize import curve_fit, root_scalar, minimize
 from datetime import datetime
 from tkinter import filedialog, Tk
 from PyQt6 import QtCore, QtGui, QtWidgets
@@ -29,6 +36,33 @@ warnings.simplefilter("ignore")
 plt.rcParams["font.family"] = "Malgun gothic"
 plt.rcParams["axes.unicode_minus"] = False
 
+# 작업 취소 요청 시 발생 (background_flow에서 처리하지 않으면 해당 작업만 조용히 종료)
+class TaskCancelled(Exception):
+    pass
+
+# 협조적 취소 token - 취소 요청 후 각 작업이 폴더/묶음/반복 경계에서 check로 중단 (진행 중인 파일 읽기는 끝까지 진행)
+class CancelToken:
+    def __init__(self):
+        self.event = threading.Event()
+
+    def cancel(self):
+        self.event.set()
+
+    @property
+    def cancelled(self):
+        return self.event.is_set()
+
+    def check(self):
+        if self.event.is_set():
+            raise TaskCancelled()
+
+# 취소 시 아직 시작하지 않은 future 취소 후 TaskCancelled 발생
+def cancel_pending(cancel, futures):
+    if cancel is not None and cancel.cancelled:
+        for future in futures:
+            future.cancel()
+        cancel.check()
+
 # timestamp 변환 함수 정의
 def to_timestamp(date_str):
     # 형식 파싱 (DDMMYY HH:MM:SS.msec)
@@ -119,16 +153,43 @@ def binary_search(numbers, target):
     index = bisect.bisect_left(numbers, target)
     return index
 
-# csv의 마지막 ,를 제거하는 함수
-def remove_end_comma(file_path):
-    # 파일을 열고 내용을 확인
-    with open(file_path, 'r', newline='', encoding='ANSI') as input_file:
-        rows = input_file.read().splitlines()
-    # 각 줄에 ,가 있으면 제거
-    for i, row in enumerate(rows):
-        if row.endswith(','):
-            rows[i] = row[:-1]
-    df = pd.DataFrame(row.split(',') for row in rows)
+# Toyo 상태 파일(Chpatrn.cfg, ExperimentStatusReport.dat) 읽기 - 한 줄씩 읽으면서 필요한 column만 모아 형식 변환
+# kinds: "int", "float", "str", "num"(숫자로 변환 가능하면 숫자, 아니면 문자)
+# header=True: 첫 줄은 column 이름, 빈 줄과 column 수가 많은 줄 제외, 빈 값은 NaN (read_csv와 동일)
+def toyo_status_read(file_path, columns, kinds, encoding, header=False, strip_comma=True):
+    values = [[] for _ in columns]
+    fieldmax = None
+    with open(file_path, 'r', newline='', encoding=encoding) as input_file:
+        for row in input_file:
+            row = row.rstrip("\r\n")
+            # 줄 끝의 , 제거
+            if strip_comma and row.endswith(','):
+                row = row[:-1]
+            fields = row.split(',')
+            if header:
+                if fieldmax is None:
+                    fieldmax = len(fields)
+                    continue
+                if (row == "") or (len(fields) > fieldmax):
+                    continue
+                fields = [field if field != "" else None for field in fields]
+            for i, column in enumerate(columns):
+                values[i].append(fields[column] if column < len(fields) else None)
+    df = pd.DataFrame()
+    for column, kind, value in zip(columns, kinds, values):
+        series = pd.Series(value, dtype=object)
+        if kind == "int":
+            series = series.astype(int)
+        elif kind == "float":
+            series = series.astype(float)
+        elif kind == "num":
+            try:
+                series = pd.to_numeric(series)
+            except (ValueError, TypeError):
+                series = series.astype(str)
+        else:
+            series = series.astype(str)
+        df[column] = series
     return df
 
 # error메세지 출력
@@ -173,11 +234,18 @@ def convert_steplist(input_str):
 # list에서 같은 같의 경우 1을 더해서 계산
 def same_add(df, column_name):
     new_column_name = f"{column_name}_add"
-    df[new_column_name] = df[column_name].apply(lambda x: x)
     # 중복된 값에 대해 1씩 증가
-    df[new_column_name] = df.groupby(column_name)[new_column_name].cumcount().add(df[column_name])
-    df[new_column_name] = df[new_column_name] - df[new_column_name].min() + 1
+    added = df.groupby(column_name, sort=False).cumcount().to_numpy() + df[column_name].to_numpy()
+    if len(added) != 0:
+        added = added - added.min() + 1
+    df[new_column_name] = added
     return df
+
+# 결측이 아닌 값 중 start번째부터 step 간격의 값만 남기는 mask
+def dcir_pick_mask(series, start, step):
+    valid = series.notna().to_numpy()
+    order = np.cumsum(valid) - 1
+    return valid & (order >= start) & ((order - start) % step == 0)
     
 # 그래프 base 기본 설정 함수 (x라벨, y라벨, 그리드 양식)
 def graph_base_parameter(graph_ax, xlabel, ylabel): 
@@ -407,14 +475,6 @@ def output_fig(figsaveokchk, filename):
             os.remove('d:/'+ filename +'.png')
         plt.savefig('d:/'+ filename +'.png')
 
-# 랜덤한 값 생성 함수
-def generate_params(ca_mass_min, ca_mass_max, ca_slip_min, ca_slip_max, an_mass_min, an_mass_max, an_slip_min, an_slip_max):
-    ca_mass = np.random.uniform(ca_mass_min, ca_mass_max)
-    ca_slip = np.random.uniform(ca_slip_min, ca_slip_max)
-    an_mass = np.random.uniform(an_mass_min, an_mass_max)
-    an_slip = np.random.uniform(an_slip_min, an_slip_max)
-    return ca_mass, ca_slip, an_mass, an_slip
-
 # 전체 결과 기반 dataframe 생성 함수
 def generate_simulation_full(ca_ccv_raw, an_ccv_raw, real_raw, ca_mass, ca_slip, an_mass, an_slip,
                              full_cell_max_cap, rated_cap, full_period):
@@ -441,44 +501,401 @@ def generate_simulation_full(ca_ccv_raw, an_ccv_raw, real_raw, ca_mass, ca_slip,
     simul_full["full_dvdq"] = simul_full["ca_dvdq"] - simul_full["an_dvdq"]
     return simul_full
 
+# dVdQ fitting 한 번에 계산하는 후보 수 기준 (후보 수 x SOC 구간 point 수)
+DVDQ_BATCH_POINTS = 1000000
+
+# dVdQ fitting 기준 data 생성 (SOC 구간 내 용량 축, 미분 기준 위치, 실측 dVdQ를 미리 산정)
+def dvdq_fit_reference(ca_ccv_raw, an_ccv_raw, real_raw, full_cell_max_cap, rated_cap, full_period, start_soc, end_soc):
+    simul_full_cap = np.arange(0, full_cell_max_cap, 0.1)[:-1]
+    full_cap = simul_full_cap / rated_cap * 100
+    real_volt = np.interp(simul_full_cap, real_raw.real_cap, real_raw.real_volt)
+    # 지정 영역 위치 중 full_period 이전(미분 기준) 위치가 있는 부분만 사용, 나머지는 rms 산정 시 0으로 처리
+    window = np.flatnonzero((full_cap > start_soc) & (full_cap < end_soc))
+    base = window - full_period
+    valid = (base >= 0) & (base < len(full_cap))
+    window, base = window[valid], base[valid]
+    # 두 위치를 모두 포함하는 연속 구간에서 한 번만 전압 보간 (각 위치는 연속 구간 내 slice)
+    start = min(window.min(), base.min()) if len(window) != 0 else 0
+    end = max(window.max(), base.max()) + 1 if len(window) != 0 else 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dcap = full_cap[window] - full_cap[base]
+        real_dvdq = (real_volt[window] - real_volt[base]) / dcap
+    return {"cap": simul_full_cap[start:end], "window": slice(window.min() - start, window.max() - start + 1) if len(window) else None,
+            "base": slice(base.min() - start, base.max() - start + 1) if len(base) else None, "dcap": dcap,
+            "real_dvdq": real_dvdq, "count": int(valid.size), "ca_cap": ca_ccv_raw.ca_cap.to_numpy(dtype=float),
+            "ca_volt": ca_ccv_raw.ca_volt.to_numpy(dtype=float), "an_cap": an_ccv_raw.an_cap.to_numpy(dtype=float),
+            "an_volt": an_ccv_raw.an_volt.to_numpy(dtype=float)}
+
+# 후보 parameter (ca_mass, ca_slip, an_mass, an_slip) 여러 개의 지정 영역 rms를 2차원 배열로 일괄 산정
+def dvdq_population_rms(reference, params):
+    params = np.atleast_2d(np.asarray(params, dtype=float))
+    if reference["count"] == 0:
+        return np.full(len(params), np.nan)
+    if len(reference["dcap"]) == 0:
+        return np.zeros(len(params))
+    ca_mass, ca_slip, an_mass, an_slip = (params[:, [k]] for k in range(4))
+    cap = reference["cap"]
+    # 용량 보정 (cap * mass - slip) 대신 기준 용량 축을 역변환해서 보간
+    full_volt = np.interp((cap + ca_slip) / ca_mass, reference["ca_cap"], reference["ca_volt"])
+    full_volt -= np.interp((cap + an_slip) / an_mass, reference["an_cap"], reference["an_volt"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        simul_diff = full_volt[:, reference["window"]] - full_volt[:, reference["base"]]
+        simul_diff /= reference["dcap"]
+        simul_diff -= reference["real_dvdq"]
+    simul_diff[np.isnan(simul_diff)] = 0
+    return np.sqrt(np.einsum("ij,ij->i", simul_diff, simul_diff) / reference["count"])
+
+# 후보군을 batch 단위로 일괄 평가 후 상위 후보에서 국소 최적화 (callback: 진행 수, 최적 parameter, rms, 개선 여부)
+def dvdq_population_fit(reference, bounds, count, rng=None, refine=3, callback=None, cancel=None):
+    bounds = np.asarray(bounds, dtype=float)
+    rng = np.random.default_rng() if rng is None else rng
+    batch = max(1, DVDQ_BATCH_POINTS // max(1, len(reference["cap"])))
+    top_params, top_rms = np.empty((0, 4)), np.empty(0)
+    best_params, best_rms = None, np.inf
+    done = 0
+    while done < count:
+        if cancel is not None:
+            cancel.check()
+        size = min(batch, count - done)
+        params = rng.uniform(bounds[:, 0], bounds[:, 1], size=(size, 4))
+        rms = dvdq_population_rms(reference, params)
+        top_params = np.vstack([top_params, params])
+        top_rms = np.concatenate([top_rms, np.where(np.isnan(rms), np.inf, rms)])
+        order = np.argsort(top_rms, kind="stable")[:refine]
+        top_params, top_rms = top_params[order], top_rms[order]
+        done += size
+        improved = len(top_rms) != 0 and top_rms[0] < best_rms
+        if improved:
+            best_params, best_rms = tuple(float(x) for x in top_params[0]), float(top_rms[0])
+        if callback is not None:
+            callback(done, best_params, best_rms, improved)
+    # 고정 parameter를 제외한 나머지만 bounds 안에서 Nelder-Mead로 보정
+    free = bounds[:, 0] < bounds[:, 1]
+    if best_params is not None and free.any():
+        for start, start_rms in zip(top_params, top_rms):
+            if not np.isfinite(start_rms):
+                continue
+            if cancel is not None:
+                cancel.check()
+            def objective(x):
+                candidate = start.copy()
+                candidate[free] = x
+                return dvdq_population_rms(reference, candidate)[0]
+            result = minimize(objective, start[free], method="Nelder-Mead", bounds=bounds[free])
+            if result.fun < best_rms:
+                candidate = start.copy()
+                candidate[free] = result.x
+                best_params, best_rms = tuple(float(x) for x in candidate), float(result.fun)
+                if callback is not None:
+                    callback(done, best_params, best_rms, True)
+    return best_params, best_rms
+
+# dVdQ fitting 재시작 횟수, process 수, 재현성을 위한 기준 seed
+DVDQ_RESTART_COUNT = 8
+DVDQ_FIT_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
+DVDQ_SEED = 2602
+
+# 초기값 기준 parameter 범위 (mass ±10%, slip ±5% 용량을 fittingdegree로 축소, 고정 parameter는 초기값)
+def dvdq_fit_bounds(ini_params, fixed, full_cell_max_cap, fittingdegree):
+    bounds = []
+    for k, (ini, fix) in enumerate(zip(ini_params, fixed)):
+        if fix:
+            bounds.append((ini, ini))
+        elif k % 2 == 0:
+            bounds.append((ini * (1 - 0.1 / fittingdegree), ini * (1 + 0.1 / fittingdegree)))
+        else:
+            bounds.append((ini - (full_cell_max_cap * (0.05 / fittingdegree)),
+                           ini + (full_cell_max_cap * (0.05 / fittingdegree))))
+    return bounds
+
+# 재시작 1회 실행 (process pool에서 호출, seed 기준으로 동일 결과 재현)
+def dvdq_restart_fit(reference, bounds, count, seed, cancel=None):
+    return dvdq_population_fit(reference, bounds, count, rng=np.random.default_rng(seed), cancel=cancel)
+
+# 재시작마다 seed와 범위(fittingdegree를 1.2배씩 축소)를 달리해 process pool로 분산 후 최소 rms 결과 선택
+def dvdq_restart_population_fit(reference, ini_params, fixed, full_cell_max_cap, fittingdegree, count,
+                                restarts=DVDQ_RESTART_COUNT, workers=DVDQ_FIT_WORKERS, seed=DVDQ_SEED, callback=None,
+                                cancel=None):
+    seeds = np.random.SeedSequence(seed).spawn(restarts)
+    jobs = [(dvdq_fit_bounds(ini_params, fixed, full_cell_max_cap, fittingdegree * 1.2 ** k),
+             max(1, count // restarts), seeds[k]) for k in range(restarts)]
+    results = [None] * restarts
+    if workers > 1 and restarts > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, restarts)) as executor:
+            futures = {executor.submit(dvdq_restart_fit, reference, *job): k for k, job in enumerate(jobs)}
+            for done, future in enumerate(as_completed(futures), start=1):
+                cancel_pending(cancel, futures)
+                results[futures[future]] = future.result()
+                if callback is not None:
+                    callback(done, restarts, *results[futures[future]])
+    else:
+        for k, job in enumerate(jobs):
+            results[k] = dvdq_restart_fit(reference, *job, cancel=cancel)
+            if callback is not None:
+                callback(k + 1, restarts, *results[k])
+    # rms가 같으면 앞선 재시작 결과 선택 (완료 순서와 무관)
+    found = [(rms, k, params) for k, (params, rms) in enumerate(results) if params is not None]
+    if not found:
+        return None, np.inf
+    rms, _, params = min(found, key=lambda item: (item[0], item[1]))
+    return params, rms
+
+# 사이클 방전 Profile을 dVdQ 실측 형식(용량 mAh, 전압)으로 변환 (Profile 없으면 None)
+def dvdq_cycle_profile(raw_file_path, cycle, mincapacity, inirate):
+    if check_cycler(os.path.dirname(raw_file_path)):
+        mincapacity, df = pne_dchg_Profile_data(raw_file_path, cycle, mincapacity, 0, inirate, 0)
+    else:
+        mincapacity, df = toyo_dchg_Profile_data(raw_file_path, cycle, mincapacity, 0, inirate, 0)
+    if not hasattr(df, "Profile") or mincapacity is None:
+        return None
+    real_raw = pd.DataFrame({"real_cap": df.Profile.SOC * mincapacity, "real_volt": df.Profile.Vol}).dropna()
+    if len(real_raw) < 2:
+        return None
+    return cycle, mincapacity, real_raw.reset_index(drop=True)
+
+# 여러 사이클 방전 Profile 동시 추출 (사이클 순서 유지, Profile 없는 사이클 제외)
+def dvdq_batch_profiles(raw_file_path, cycles, mincapacity, inirate, cancel=None):
+    def cycle_profile(cycle):
+        if cancel is not None:
+            cancel.check()
+        return dvdq_cycle_profile(raw_file_path, cycle, mincapacity, inirate)
+    with ThreadPoolExecutor(max_workers=PNE_READ_WORKERS) as executor:
+        profiles = list(executor.map(cycle_profile, cycles))
+    return [profile for profile in profiles if profile is not None]
+
+# 사이클 1개 fitting (process pool에서 호출, 결과: parameter, rms, 셀 용량)
+def dvdq_cycle_fit(ca_ccv_raw, an_ccv_raw, real_raw, rated_cap, full_period, start_soc, end_soc, ini_params, fixed,
+                   fittingdegree, count, seed):
+    full_cell_max_cap = max(real_raw.real_cap)
+    reference = dvdq_fit_reference(ca_ccv_raw, an_ccv_raw, real_raw, full_cell_max_cap, rated_cap, full_period,
+                                   start_soc, end_soc)
+    bounds = dvdq_fit_bounds(ini_params, fixed, full_cell_max_cap, fittingdegree)
+    params, rms = dvdq_population_fit(reference, bounds, count, rng=np.random.default_rng(seed))
+    return params, rms, full_cell_max_cap
+
+# 사이클별 열화 mode fitting 시 동시에 fitting하는 사이클 묶음 크기 (worker 수와 무관하게 결과 동일)
+DVDQ_CYCLE_GROUP = 4
+
+# 사이클별 열화 mode fitting - 묶음 내 사이클은 동시에 fitting, 각 묶음은 직전 사이클 결과를 초기값으로 사용
+# profiles: (사이클, 기준 용량, 실측 Profile) 목록, ini_params 중 None은 첫 사이클 용량 기준 기본값 사용
+def dvdq_cycle_batch_fit(ca_ccv_raw, an_ccv_raw, profiles, full_period, start_soc, end_soc, ini_params, fixed, count,
+                         fittingdegree=1.2, workers=DVDQ_FIT_WORKERS, seed=DVDQ_SEED, callback=None, cancel=None):
+    rows = []
+    warm_params = None
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(profiles) > 1 else None
+    try:
+        for start in range(0, len(profiles), DVDQ_CYCLE_GROUP):
+            if cancel is not None:
+                cancel.check()
+            group = profiles[start:start + DVDQ_CYCLE_GROUP]
+            if warm_params is None:
+                full_cell_max_cap = max(group[0][2].real_cap)
+                default_params = (full_cell_max_cap/max(ca_ccv_raw.ca_cap), 1, full_cell_max_cap/max(an_ccv_raw.an_cap), 1)
+                warm_params = tuple(default if ini is None else ini for ini, default in zip(ini_params, default_params))
+            jobs = [(ca_ccv_raw, an_ccv_raw, real_raw, rated_cap, full_period, start_soc, end_soc, warm_params, fixed,
+                     fittingdegree, count, np.random.SeedSequence([seed, int(cycle)])) for cycle, rated_cap, real_raw in group]
+            if executor is not None:
+                results = list(executor.map(dvdq_cycle_fit, *zip(*jobs)))
+            else:
+                results = [dvdq_cycle_fit(*job) for job in jobs]
+            for (cycle, rated_cap, real_raw), (params, rms, full_cell_max_cap) in zip(group, results):
+                if params is None:
+                    continue
+                rows.append([cycle, *params, rms * 100, full_cell_max_cap, max(ca_ccv_raw.ca_cap) * params[0],
+                             max(an_ccv_raw.an_cap) * params[2]])
+                warm_params = params
+            if callback is not None:
+                callback(start + len(group), len(profiles))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return pd.DataFrame(rows, columns=["Cyc", "ca_mass", "ca_slip", "an_mass", "an_slip", "rms", "full_cap", "ca_cap",
+                                       "an_cap"])
+
+# cycler 파일 형식별 schema (usecols: 사용하는 column만 읽기, dtype: 정수 code column 형식 지정)
+# PNE Restore 파일은 header 없이 column 번호 유지, Toyo/ECT는 header 이름 기준 (형식별 이름 차이 모두 포함)
+# 측정값 column(µV, µA, µAh 정수 / Toyo 실수)은 float32 정밀도를 넘으므로 형식 추정 유지
+TOYO_PROFILE_COLUMNS = {"PassTime[Sec]", "Passed Time[Sec]", "Voltage[V]", "Current[mA]", "Condition",
+                        "Temp1[Deg]", "Temp1[deg]", "TotlCycle"}
+TOYO_CAPACITY_COLUMNS = {"TotlCycle", "Condition", "Cap[mAh]", "Ocv", "Finish", "Mode", "PeakVolt[V]", "Pow[mWh]",
+                         "PeakTemp[Deg]", "AveVolt[V]", "Total Cycle", "Capacity[mAh]", "OCV[V]", "End Factor",
+                         "Peak Volt.[V]", "Power[mWh]", "Peak Temp.[deg]", "Ave. Volt.[V]"}
+ECT_LOG_COLUMNS = {"Time", "voltage_nowmV", "CtypeEtcChargCur", "CurrentAvg", "TemperatureBA", "Level", "ectSOC",
+                   "RSOC", "SOC_RE", "Charging", "Battery_Cycle", "AnodePotential", "SC_VALUE", "SC_SCORE", "SC_Grade",
+                   "SC_V_Acc", "SC_V_Avg", "avg_I_ISC", "avg_R_ISC", "avg_R_ISC_min", "VavgmV", "LUT_VOLT0",
+                   "LUT_VOLT1", "LUT_VOLT2", "LUT_VOLT3"}
+CYCLER_SCHEMA = {
+    # PNE SaveData - 0:Index 2:StepType 7:Step 8:Voltage 9:Current 10:ChgCap 11:DchgCap 14:ChgWh 15:DchgWh
+    # 17:StepTime 18:TotTime(day) 19:TotTime(s) 21:Temp 27:TotalCycle
+    "pne_savedata": {"usecols": [0, 2, 7, 8, 9, 10, 11, 14, 15, 17, 18, 19, 21, 27],
+                     "dtype": {0: "int64", 2: "int32", 7: "int32", 27: "int32"}},
+    # PNE SaveEndData - 0:Index 2:StepType 6:EndState 8:Voltage 9:Current 10:ChgCap 11:DchgCap 15:DchgWh
+    # 17:StepTime 20:imp 24:Temp 27:TotalCycle 29:AvgV 45:voltage_max
+    "pne_saveenddata": {"usecols": [0, 2, 6, 8, 9, 10, 11, 15, 17, 20, 24, 27, 29, 45],
+                        "dtype": {0: "int64", 2: "int32", 6: "int32", 27: "int32"}},
+    # Toyo Profile (BLK3600_3000, BLK5200, 신뢰성 충방전기)
+    "toyo_profile": {"usecols": lambda column: column in TOYO_PROFILE_COLUMNS,
+                     "dtype": {"Condition": "int32", "TotlCycle": "int32"}},
+    # Toyo capacity.log (신/구 header)
+    "toyo_capacity": {"usecols": lambda column: column in TOYO_CAPACITY_COLUMNS,
+                      "dtype": {"TotlCycle": "int32", "Total Cycle": "int32", "Condition": "int32"}},
+    # ECT App log (특수문자 제거한 header 이름 기준)
+    "ect_log": {"usecols": lambda column: re.sub('[^A-Za-z0-9_]+', '', column) in ECT_LOG_COLUMNS, "dtype": None},
+    # battery_dump - 0:Time 1:Vol 2:Curr 5:SOC 6:T_bat 7:T_usb 8:T_chg 11:T_lrp 14:battery_status
+    # 15:direct_charger_status 29:sys_avg_current 38:cycle 39:ocv 40:SOCraw 41:cap_max
+    "battery_dump": {"usecols": [0, 1, 2, 5, 6, 7, 8, 11, 14, 15, 29, 38, 39, 40, 41], "dtype": None},
+}
+
+# schema 기준 csv 읽기 (형식이 다르면 dtype 추정 → 전체 읽기 후 column 선택 순서로 재시도)
+def schema_read_csv(source, schema, **kwargs):
+    usecols = schema["usecols"]
+    for options in ({"usecols": usecols, "dtype": schema["dtype"]}, {"usecols": usecols}):
+        try:
+            data = pd.read_csv(source, **options, **kwargs)
+            if len(data.columns) != 0:
+                return data
+        except ValueError:
+            pass
+        if hasattr(source, "seek"):
+            source.seek(0)
+    data = pd.read_csv(source, **kwargs)
+    if callable(usecols):
+        return data[[column for column in data.columns if usecols(column)]]
+    return data.iloc[:, [column for column in usecols if column < len(data.columns)]]
+
 # 토요 데이터 csv 확인/ 폴더, cycle 순으로 입력
 def toyo_read_csv(*args): 
     if len(args) == 1:
         filepath = args[0] + "\\capacity.log"
         skiprows = 0
+        schema = CYCLER_SCHEMA["toyo_capacity"]
     else:
         filepath = args[0] + "\\%06d" % args[1]
         skiprows = 3
+        schema = CYCLER_SCHEMA["toyo_profile"]
+    filepath = mirror_path(filepath)
     if os.path.isfile(filepath):
         # read the csv file into a pandas dataframe
-        dataraw = pd.read_csv(filepath, sep=",", skiprows=skiprows, engine="c", encoding="cp949", on_bad_lines='skip')
+        dataraw = schema_read_csv(filepath, schema, sep=",", skiprows=skiprows, engine="c", encoding="cp949",
+                                  on_bad_lines='skip')
         return dataraw
 
 # Data 처리
+# Toyo Profile 파일 column 형식 구분
+def toyo_profile_layout(columns):
+    if "PassTime[Sec]" in columns:
+        if "Temp1[Deg]" in columns:
+            # Toyo BLK 3600_3000
+            return "BLK3600_3000"
+        # 신뢰성 충방전기 (Temp 없음)
+        return "reliability"
+    # Toyo BLK5200
+    return "BLK5200"
+
 # Toyo Profile 불러오기
 def toyo_Profile_import(raw_file_path, cycle):
     df = pd.DataFrame()
-    df.dataraw = toyo_read_csv(raw_file_path, cycle)
+    df.dataraw = channel_dataset(raw_file_path).toyo_csv(cycle)
     if hasattr(df, 'dataraw') and not df.dataraw.empty:
-        if "PassTime[Sec]" in df.dataraw.columns:
-            if "Temp1[Deg]" in df.dataraw.columns:
-                # Toyo BLK 3600_3000
-                df.dataraw = df.dataraw[["PassTime[Sec]", "Voltage[V]", "Current[mA]", "Condition", "Temp1[Deg]"]]
-            else:
-            # 신뢰성 충방전기 (Temp 없음)
-                df.dataraw = df.dataraw[["PassTime[Sec]", "Voltage[V]", "Current[mA]", "Condition", "TotlCycle"]]
-                df.dataraw.columns = ["PassTime[Sec]", "Voltage[V]", "Current[mA]", "Condition", "Temp1[Deg]"]
+        df.layout = toyo_profile_layout(df.dataraw.columns)
+        if df.layout == "BLK3600_3000":
+            df.dataraw = df.dataraw[["PassTime[Sec]", "Voltage[V]", "Current[mA]", "Condition", "Temp1[Deg]"]]
+        elif df.layout == "reliability":
+            df.dataraw = df.dataraw[["PassTime[Sec]", "Voltage[V]", "Current[mA]", "Condition", "TotlCycle"]]
+            df.dataraw.columns = ["PassTime[Sec]", "Voltage[V]", "Current[mA]", "Condition", "Temp1[Deg]"]
         else:
-            # Toyo BLK5200
             df.dataraw = df.dataraw[["Passed Time[Sec]", "Voltage[V]", "Current[mA]", "Condition", "Temp1[deg]"]]
             df.dataraw.columns = ["PassTime[Sec]", "Voltage[V]", "Current[mA]", "Condition", "Temp1[Deg]"]
     return df
 
+# Toyo 채널 manifest (cycle 파일별 크기, 행 수, Condition 범위, PassTime 범위, column 형식) - 메모리 및 로컬 캐시 보관
+TOYO_MANIFEST = {}
+TOYO_MANIFEST_LOCK = threading.Lock()
+# 폴더 재조회 간격 (초)
+TOYO_MANIFEST_TTL = 5
+
+# Toyo 채널 폴더를 한 번에 조회하여 manifest 갱신 (크기/수정시간이 바뀐 파일은 요약 정보 초기화)
+def toyo_manifest(raw_file_path):
+    with TOYO_MANIFEST_LOCK:
+        manifest = TOYO_MANIFEST.get(raw_file_path)
+    if (manifest is not None) and (time.time() - manifest["time"] < TOYO_MANIFEST_TTL):
+        return manifest
+    if (manifest is None) and PNE_CACHE_ENABLE:
+        manifest = cache_load(cache_file_path(raw_file_path, ".toyo.pkl"))
+    oldfiles = manifest["files"] if manifest is not None else {}
+    files = {}
+    if os.path.isdir(raw_file_path):
+        with os.scandir(raw_file_path) as entries:
+            for entry in entries:
+                if len(entry.name) == 6 and entry.name.isdigit() and entry.is_file():
+                    filestat = entry.stat()
+                    fileinfo = oldfiles.get(int(entry.name))
+                    if (fileinfo is None) or (fileinfo["size"] != filestat.st_size) or (fileinfo["mtime"] != filestat.st_mtime_ns):
+                        fileinfo = {"size": filestat.st_size, "mtime": filestat.st_mtime_ns, "summary": None}
+                    files[int(entry.name)] = fileinfo
+    manifest = {"time": time.time(), "files": files}
+    with TOYO_MANIFEST_LOCK:
+        TOYO_MANIFEST[raw_file_path] = manifest
+    return manifest
+
+# Toyo manifest 로컬 캐시 저장
+def toyo_manifest_save(raw_file_path):
+    with TOYO_MANIFEST_LOCK:
+        manifest = TOYO_MANIFEST.get(raw_file_path)
+    if (manifest is not None) and PNE_CACHE_ENABLE:
+        cache_save(cache_file_path(raw_file_path, ".toyo.pkl"), {"time": manifest["time"], "files": dict(manifest["files"])})
+
+# Toyo cycle 파일 요약 정보 확인 (없으면 파일을 읽어 생성하고 읽은 data도 같이 반환)
+def toyo_manifest_summary(raw_file_path, cycle):
+    fileinfo = toyo_manifest(raw_file_path)["files"].get(cycle)
+    if fileinfo is None:
+        return None, None
+    if fileinfo["summary"] is not None:
+        return fileinfo["summary"], None
+    tempdata = toyo_Profile_import(raw_file_path, cycle)
+    if (tempdata.dataraw is None) or tempdata.dataraw.empty:
+        return None, None
+    dataraw = tempdata.dataraw
+    fileinfo["summary"] = {"rows": len(dataraw), "layout": tempdata.layout,
+                           "cond_min": float(dataraw["Condition"].min()), "cond_max": float(dataraw["Condition"].max()),
+                           "conditions": tuple(sorted(dataraw["Condition"].dropna().unique().tolist())),
+                           "time_first": float(dataraw["PassTime[Sec]"].iloc[0]),
+                           "time_last": float(dataraw["PassTime[Sec]"].iloc[-1])}
+    return fileinfo["summary"], dataraw
+
+# 여러 파일로 나뉜 Toyo step의 cycle 파일 목록 산정 (충전만 있는 파일이 이어지는 동안 다음 파일 포함)
+def toyo_step_cycle_plan(raw_file_path, inicycle):
+    frames = {}
+    summary, dataraw = toyo_manifest_summary(raw_file_path, inicycle)
+    if summary is None:
+        return [], frames
+    frames[inicycle] = dataraw
+    cycles = [inicycle]
+    if int(summary["cond_max"]) < 2:
+        stepcyc = inicycle
+        while True:
+            stepcyc = stepcyc + 1
+            summary, dataraw = toyo_manifest_summary(raw_file_path, stepcyc)
+            if summary is None:
+                break
+            frames[stepcyc] = dataraw
+            cycles.append(stepcyc)
+            if int(summary["cond_max"]) != 1:
+                break
+    toyo_manifest_save(raw_file_path)
+    return cycles, frames
+
+# manifest 산정 시 읽은 data가 있으면 재사용, 없으면 파일 읽기
+def toyo_plan_data(raw_file_path, cycle, frames):
+    if frames.get(cycle) is not None:
+        return frames[cycle]
+    return toyo_Profile_import(raw_file_path, cycle).dataraw
+
 # Toyo Cycle 불러오기
 
 def toyo_cycle_import(raw_file_path):
     df = pd.DataFrame()
-    df.dataraw = toyo_read_csv(raw_file_path)
+    df.dataraw = channel_dataset(raw_file_path).toyo_csv()
     if hasattr(df, 'dataraw') and not df.dataraw.empty:
         if "Cap[mAh]" in df.dataraw.columns: 
             df.dataraw = df.dataraw[["TotlCycle", "Condition", "Cap[mAh]", "Ocv", "Finish", "Mode", "PeakVolt[V]",
@@ -497,12 +914,44 @@ def toyo_min_cap(raw_file_path, mincapacity, inirate):
         if "mAh" in raw_file_path: # 파일 이름에 용량 관련 문자 있을 때
             mincap = name_capacity(raw_file_path)
         else:
-            inicapraw = toyo_read_csv(raw_file_path, 1) # 첫 사이클 기준으로 3번째 줄을 C-rate로 가정하여 용량 환산
-            mincap = int(round(inicapraw["Current[mA]"].max()/inirate))
+            # 첫 사이클 기준으로 3번째 줄을 C-rate로 가정하여 용량 환산 (최대 전류는 채널 data 묶음에 보관)
+            dataset = channel_dataset(raw_file_path)
+            inicurr = dataset.value(("inicurr", 1), [raw_file_path + "\\%06d" % 1],
+                                    lambda: dataset.toyo_csv(1)["Current[mA]"].max())
+            mincap = int(round(inicurr/inirate))
     else: # 표기된 숫자를 용량으로 지정
         mincap = mincapacity
     return mincap    
 
+# 같은 Condition으로 연속된 충전/방전 step을 구간의 마지막 행으로 병합
+# 충전: 용량 합산, Ocv는 첫 step 값 / 방전: 용량, 에너지 합산 후 평균 전압 재계산 (나머지 column은 마지막 step 값)
+def toyo_merge_steps(Cycleraw):
+    cond = Cycleraw["Condition"]
+    # 연속 구간 번호 (충전/방전이 아닌 행은 각각 별도 구간, 1부터 시작)
+    run = ((cond != cond.shift()) | ~cond.isin([1, 2])).cumsum()
+    runno = run.to_numpy() - 1
+    runsize = np.bincount(runno)[runno]
+    if (runsize == 1).all():
+        return Cycleraw
+    last = ~run.duplicated(keep="last").to_numpy()
+    merge = last & (runsize > 1)
+    chg = merge & (cond == 1).to_numpy()
+    dchg = merge & (cond == 2).to_numpy()
+    firstpos = np.flatnonzero(~run.duplicated(keep="first").to_numpy())
+    # 구간 내 누적 합 (모든 구간을 한 번에 처리하면서 구간 내 순번별로 앞 step부터 순서대로 더함)
+    rowpos = np.arange(len(Cycleraw)) - firstpos[runno]
+    cap = Cycleraw["Cap[mAh]"].to_numpy(copy=True)
+    power = Cycleraw["Pow[mWh]"].to_numpy(copy=True)
+    for k in range(1, rowpos.max() + 1):
+        pos = np.flatnonzero(rowpos == k)
+        cap[pos] = cap[pos] + cap[pos - 1]
+        power[pos] = power[pos] + power[pos - 1]
+    Cycleraw.loc[chg | dchg, "Cap[mAh]"] = cap[chg | dchg]
+    Cycleraw.loc[chg, "Ocv"] = Cycleraw["Ocv"].to_numpy()[firstpos[runno[chg]]]
+    Cycleraw.loc[dchg, "Pow[mWh]"] = power[dchg]
+    Cycleraw.loc[dchg, "AveVolt[V]"] = power[dchg] / cap[dchg]
+    return Cycleraw[last].reset_index(drop=True)
+
 # Toyo Cycle data 처리
 def toyo_cycle_data(raw_file_path, mincapacity, inirate, chkir):
     # 폴더 확인
@@ -524,28 +973,7 @@ def toyo_cycle_data(raw_file_path, mincapacity, inirate, chkir):
                 Cycleraw = Cycleraw.drop(0, axis=0)
                 Cycleraw = Cycleraw.reset_index()
         # Step 충전 용량, 방전 용량, 방전 에너지 계산
-        i = 0
-        while i < len(Cycleraw) - 1:
-                current_cond = Cycleraw.loc[i, "Condition"]
-                next_cond = Cycleraw.loc[i + 1, "Condition"]
-                if current_cond in (1, 2) and current_cond == next_cond:
-                    # 충전/방전 데이터 병합
-                    if current_cond == 1:
-                        # 충전 데이터 처리
-                        Cycleraw.loc[i + 1, "Cap[mAh]"] += Cycleraw.loc[i, "Cap[mAh]"]
-                        Cycleraw.loc[i + 1, "Ocv"] = Cycleraw.loc[i, "Ocv"]
-                    else:
-                        # 방전 데이터 처리
-                        Cycleraw.loc[i + 1, "Cap[mAh]"] += Cycleraw.loc[i, "Cap[mAh]"]
-                        Cycleraw.loc[i + 1, "Pow[mWh]"] += Cycleraw.loc[i, "Pow[mWh]"]
-                        Cycleraw.loc[i + 1, "AveVolt[V]"] = Cycleraw.loc[i + 1, "Pow[mWh]"] / Cycleraw.loc[i + 1, "Cap[mAh]"]
-                    # 병합된 행의 사이클 수 감소
-                    # Cycleraw.loc[i + 1, "TotlCycle"] -= 1
-                    # 현재 행 삭제 및 인덱스 조정
-                    Cycleraw = Cycleraw.drop(i, axis=0).reset_index(drop=True)
-                    # i += 1  # 병합된 다음 행 건너뛰기
-                else:
-                    i += 1
+        Cycleraw = toyo_merge_steps(Cycleraw)
         # 충전 용량 처리
         chgdata = Cycleraw[(Cycleraw["Condition"] == 1) & (Cycleraw["Finish"] != "                 Vol") 
                            & (Cycleraw["Finish"] != "Volt") & (Cycleraw["Cap[mAh]"] > (mincapacity/60))]
@@ -571,8 +999,7 @@ def toyo_cycle_data(raw_file_path, mincapacity, inirate, chkir):
         # dcir 기본 처리
         for cycle in cycnum:
             if os.path.isfile(raw_file_path + "\\%06d" % cycle):
-                dcirpro = pd.read_csv((raw_file_path + "\\%06d" % cycle), sep=",", skiprows=3, engine="c",
-                                      encoding="cp949", on_bad_lines='skip')
+                dcirpro = channel_dataset(raw_file_path).toyo_csv(cycle)
                 if "PassTime[Sec]" in dcirpro.columns:
                     dcirpro = dcirpro[["PassTime[Sec]", "Voltage[V]", "Current[mA]", "Condition", "Temp1[Deg]"]]
                 else:
@@ -627,27 +1054,19 @@ def toyo_step_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate
     # 용량 산정
     tempmincap = toyo_min_cap(raw_file_path, mincapacity, inirate)
     mincapacity = tempmincap
-    # data 기본 처리
-    if os.path.isfile(raw_file_path + "\\%06d" % inicycle):
-        tempdata = toyo_Profile_import(raw_file_path, inicycle)
-        stepcyc = inicycle
+    # data 기본 처리 (manifest 기준으로 이어지는 충전 파일 확인 후 읽기)
+    stepcycles, frames = toyo_step_cycle_plan(raw_file_path, inicycle)
+    if len(stepcycles) != 0:
         lasttime = 0
-        if int(tempdata.dataraw["Condition"].max()) < 2:
-            df.stepchg = tempdata.dataraw
-            df.stepchg = df.stepchg[(df.stepchg["Condition"] == 1)]
-            lasttime = df.stepchg["PassTime[Sec]"].max()
-            maxcon = 1
-            while maxcon == 1:
-                stepcyc = stepcyc + 1
-                tempdata = toyo_Profile_import(raw_file_path, stepcyc)
-                maxcon = int(tempdata.dataraw["Condition"].max())
-                tempdata.dataraw = tempdata.dataraw[(tempdata.dataraw["Condition"] == 1)]
-                tempdata.dataraw["PassTime[Sec]"] = tempdata.dataraw["PassTime[Sec]"] + lasttime
-                df.stepchg = df.stepchg._append(tempdata.dataraw)
-                lasttime = df.stepchg["PassTime[Sec]"].max()
-        else:
-            df.stepchg = tempdata.dataraw
-            df.stepchg = df.stepchg[(df.stepchg["Condition"] == 1)]
+        steplist = []
+        for stepcyc in stepcycles:
+            tempdataraw = toyo_plan_data(raw_file_path, stepcyc, frames)
+            tempdataraw = tempdataraw[(tempdataraw["Condition"] == 1)]
+            tempdataraw["PassTime[Sec]"] = tempdataraw["PassTime[Sec]"] + lasttime
+            steplist.append(tempdataraw)
+            if not tempdataraw.empty:
+                lasttime = max(lasttime, tempdataraw["PassTime[Sec]"].max())
+        df.stepchg = pd.concat(steplist)
         if not df.stepchg.empty:
             df.stepchg["Cap[mAh]"] = 0
             # cut-off
@@ -778,17 +1197,18 @@ def toyo_dchg_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate
         tempdata = toyo_Profile_import(raw_file_path, inicycle)
         df.Profile = tempdata.dataraw
         df.Profile = df.Profile[(df.Profile["Condition"] == 2)]
-        # 뒷 사이클 있는지 확인
-        if os.path.isfile(raw_file_path + "\\%06d" % (inicycle + 1)):
-            tempdata2 = toyo_Profile_import(raw_file_path, inicycle + 1)
-            df.Profile2 = tempdata2.dataraw
+        # 뒷 사이클 있는지 확인 (manifest 기준으로 충전 유무 확인 후 필요한 경우만 읽기)
+        nextsummary, nextdataraw = toyo_manifest_summary(raw_file_path, inicycle + 1)
+        if nextsummary is not None:
             # 뒷 사이클에 충전이 있는지 확인
-            if not tempdata2.dataraw["Condition"].isin([1]).any():
+            if 1 not in nextsummary["conditions"]:
+                df.Profile2 = toyo_plan_data(raw_file_path, inicycle + 1, {inicycle + 1: nextdataraw})
                 # 방전만 추출하여 기존 데이터의 시간을 합하고 기존 df에 추가
                 lasttime = df.Profile["PassTime[Sec]"].max()
                 df.Profile2 = df.Profile2[(df.Profile2["Condition"] == 2)]
                 df.Profile2["PassTime[Sec]"] = df.Profile2["PassTime[Sec]"] + lasttime
-                df.Profile = df.Profile._append(df.Profile2)
+                df.Profile = pd.concat([df.Profile, df.Profile2])
+        toyo_manifest_save(raw_file_path)
         # cut-off
         df.Profile = df.Profile[df.Profile["Voltage[V]"] >= cutoff]
         if not df.Profile.empty:
@@ -821,24 +1241,18 @@ def toyo_Profile_continue_data(raw_file_path, inicycle, endcycle, mincapacity, i
     # 용량 산정
     tempmincap = toyo_min_cap(raw_file_path, mincapacity, inirate)
     mincapacity = tempmincap
-    # data 기본 처리
-    if os.path.isfile(raw_file_path + "\\%06d" % inicycle):
-        tempdata = toyo_Profile_import(raw_file_path, inicycle)
-        stepcyc = inicycle
+    # data 기본 처리 (manifest 기준으로 이어지는 충전 파일 확인 후 읽기)
+    stepcycles, frames = toyo_step_cycle_plan(raw_file_path, inicycle)
+    if len(stepcycles) != 0:
         lasttime = 0
-        if int(tempdata.dataraw["Condition"].max()) < 2:
-            df.stepchg = tempdata.dataraw
-            lasttime = df.stepchg["PassTime[Sec]"].max()
-            maxcon = 1
-            while maxcon == 1:
-                stepcyc = stepcyc + 1
-                tempdata = toyo_Profile_import(raw_file_path, stepcyc)
-                maxcon = int(tempdata.dataraw["Condition"].max())
-                tempdata.dataraw["PassTime[Sec]"] = tempdata.dataraw["PassTime[Sec]"] + lasttime
-                df.stepchg = df.stepchg._append(tempdata.dataraw)
-                lasttime = df.stepchg["PassTime[Sec]"].max()
-        else:
-            df.stepchg = tempdata.dataraw
+        steplist = []
+        for stepcyc in stepcycles:
+            tempdataraw = toyo_plan_data(raw_file_path, stepcyc, frames)
+            tempdataraw["PassTime[Sec]"] = tempdataraw["PassTime[Sec]"] + lasttime
+            steplist.append(tempdataraw)
+            if not tempdataraw.empty:
+                lasttime = max(lasttime, tempdataraw["PassTime[Sec]"].max())
+        df.stepchg = pd.concat(steplist)
         if not df.stepchg.empty:
             df.stepchg["Cap[mAh]"] = 0
             # 충전 용량 산정
@@ -864,6 +1278,371 @@ def toyo_Profile_continue_data(raw_file_path, inicycle, endcycle, mincapacity, i
             df.stepchg.columns = ["TimeMin", "SOC", "Vol", "Crate", "Temp"]
     return [mincapacity, df]
 
+# PNE Restore csv 캐시 설정 (로컬 디스크에 파일별 pickle 저장)
+PNE_CACHE_ENABLE = True
+PNE_CACHE_DIR = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "BatteryDataTool", "cache")
+PNE_CACHE_VERSION = 4
+
+# 원본 파일 경로 기준으로 캐시 파일 경로 생성
+def cache_file_path(src_path, suffix=".pkl"):
+    key = hashlib.md5(os.path.normcase(os.path.abspath(src_path)).encode("utf-8")).hexdigest()
+    return os.path.join(PNE_CACHE_DIR, key + suffix)
+
+# 캐시 파일 읽기 (없거나 손상, 버전 불일치 시 None)
+def cache_load(cache_path):
+    if not os.path.isfile(cache_path):
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            entry = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != PNE_CACHE_VERSION:
+        return None
+    return entry
+
+# 캐시 파일 저장 (임시 파일 기록 후 교체하여 중간 실패 시 기존 캐시 유지)
+def cache_save(cache_path, entry):
+    entry["version"] = PNE_CACHE_VERSION
+    temp_path = "%s.%d.%d.tmp" % (cache_path, os.getpid(), threading.get_ident())
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+
+# 충방전기 네트워크 드라이브 로컬 mirror (선택 사용, 채널 폴더를 background에서 복사하고 최신이면 로컬 파일을 읽음)
+MIRROR_ENABLE = False
+MIRROR_DIR = os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "BatteryDataTool", "mirror")
+# 동기화 주기, 최신으로 인정하는 시간 (초)
+MIRROR_SYNC_INTERVAL = 60
+MIRROR_FRESH_TIME = 180
+# 채널 폴더 → {"local": mirror 경로, "synced": 마지막 동기화 완료 시각}
+MIRROR_FOLDERS = {}
+MIRROR_LOCK = threading.Lock()
+MIRROR_STOP = threading.Event()
+MIRROR_THREAD = None
+
+# 원본 경로에 대응하는 mirror 경로 (드라이브 문자/서버 이름을 폴더로 사용)
+def mirror_local_path(src_path):
+    drive, rest = os.path.splitdrive(os.path.abspath(src_path))
+    return os.path.join(MIRROR_DIR, drive.replace(":", "").strip("\\/"), rest.lstrip("\\/"))
+
+# 파일 1개 동기화 (크기/수정시간이 같으면 생략, 앞부분이 같으면 추가된 부분만 전송, 나머지는 전체 복사)
+def mirror_sync_file(src, dst):
+    srcstat = os.stat(src)
+    dststat = os.stat(dst) if os.path.isfile(dst) else None
+    if (dststat is not None) and (dststat.st_size == srcstat.st_size) and (dststat.st_mtime_ns == srcstat.st_mtime_ns):
+        return 0
+    start = 0
+    with open(src, "rb") as fsrc:
+        if (dststat is not None) and (0 < dststat.st_size < srcstat.st_size):
+            tail = min(256, dststat.st_size)
+            fsrc.seek(dststat.st_size - tail)
+            with open(dst, "rb") as fdst:
+                fdst.seek(dststat.st_size - tail)
+                if fsrc.read(tail) == fdst.read(tail):
+                    start = dststat.st_size
+        fsrc.seek(start)
+        # 추가 전송은 기존 파일 뒤에 기록, 전체 복사는 임시 파일 작성 후 교체 (읽는 중인 파일 보호)
+        if start > 0:
+            writepath = dst
+        else:
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            writepath = "%s.%d.%d.tmp" % (dst, os.getpid(), threading.get_ident())
+        with open(writepath, "r+b" if start > 0 else "wb") as fdst:
+            fdst.seek(start)
+            remain = srcstat.st_size - start
+            while remain > 0:
+                chunk = fsrc.read(min(remain, 1 << 20))
+                if not chunk:
+                    break
+                fdst.write(chunk)
+                remain = remain - len(chunk)
+            fdst.truncate()
+    if writepath != dst:
+        os.replace(writepath, dst)
+    os.utime(dst, ns=(srcstat.st_atime_ns, srcstat.st_mtime_ns))
+    return srcstat.st_size - start
+
+# 채널 폴더 전체 동기화 (전송한 byte 수 반환)
+def mirror_sync_folder(src_folder):
+    with MIRROR_LOCK:
+        local = MIRROR_FOLDERS[src_folder]["local"]
+    copied = 0
+    for root, directories, files in os.walk(src_folder):
+        dstroot = os.path.normpath(os.path.join(local, os.path.relpath(root, src_folder)))
+        for file in files:
+            copied = copied + mirror_sync_file(os.path.join(root, file), os.path.join(dstroot, file))
+    with MIRROR_LOCK:
+        MIRROR_FOLDERS[src_folder]["synced"] = time.time()
+    return copied
+
+# background 동기화 반복 (등록된 채널 폴더 순서대로)
+def mirror_sync_loop():
+    while not MIRROR_STOP.is_set():
+        with MIRROR_LOCK:
+            folders = list(MIRROR_FOLDERS)
+        for src_folder in folders:
+            if MIRROR_STOP.is_set():
+                break
+            try:
+                mirror_sync_folder(src_folder)
+            except OSError as e:
+                print(f"[mirror 동기화 오류] {src_folder}: {e}")
+        MIRROR_STOP.wait(MIRROR_SYNC_INTERVAL)
+
+# 채널 폴더를 mirror 대상으로 등록하고 동기화 thread 시작
+def mirror_watch(src_folder):
+    global MIRROR_THREAD
+    with MIRROR_LOCK:
+        if src_folder not in MIRROR_FOLDERS:
+            MIRROR_FOLDERS[src_folder] = {"local": mirror_local_path(src_folder), "synced": 0}
+        if (MIRROR_THREAD is None) or (not MIRROR_THREAD.is_alive()):
+            MIRROR_STOP.clear()
+            MIRROR_THREAD = threading.Thread(target=mirror_sync_loop, daemon=True)
+            MIRROR_THREAD.start()
+
+# 읽을 파일 경로 확인 (등록된 채널의 mirror가 최신이고 파일이 있으면 mirror 경로, 아니면 원본 경로)
+# 마지막 동기화 이후 원본이 바뀐 파일(크기 다름, 수정시간이 더 최근)은 원본 경로 사용, 원본 확인이 안 되면 mirror 경로 사용
+def mirror_path(filepath):
+    if not MIRROR_ENABLE:
+        return filepath
+    with MIRROR_LOCK:
+        for src_folder, mirror in MIRROR_FOLDERS.items():
+            if (filepath.startswith(src_folder) and (filepath[len(src_folder):len(src_folder) + 1] in ("\\", "/"))
+                    and (time.time() - mirror["synced"] < MIRROR_FRESH_TIME)):
+                localpath = mirror["local"] + filepath[len(src_folder):]
+                break
+        else:
+            return filepath
+    try:
+        localstat = os.stat(localpath)
+    except OSError:
+        return filepath
+    try:
+        srcstat = os.stat(filepath)
+    except OSError:
+        return localpath
+    if (srcstat.st_size == localstat.st_size) and (srcstat.st_mtime_ns <= localstat.st_mtime_ns):
+        return localpath
+    return filepath
+
+# PNE Restore 파일 schema (SaveData, SaveEndData 외에는 전체 column)
+def pne_schema(filepath):
+    filename = os.path.basename(filepath)
+    if "SaveEndData" in filename:
+        return CYCLER_SCHEMA["pne_saveenddata"]
+    if "SaveData" in filename:
+        return CYCLER_SCHEMA["pne_savedata"]
+    return None
+
+# csv byte 데이터를 DataFrame으로 변환
+def pne_parse_csv_bytes(rawbytes, schema=None):
+    if schema is None:
+        return pd.read_csv(io.BytesIO(rawbytes), sep=",", skiprows=0, engine="c", header=None, encoding="cp949",
+                           on_bad_lines='skip')
+    return schema_read_csv(io.BytesIO(rawbytes), schema, sep=",", skiprows=0, engine="c", header=None,
+                           encoding="cp949", on_bad_lines='skip')
+
+# 완성된 줄(개행 포함)과 작성 중인 마지막 줄을 분리하여 읽기
+def pne_parse_csv_lines(rawbytes, start_offset, schema=None):
+    # 마지막 개행 위치까지만 확정 데이터로 사용
+    lastline = rawbytes.rfind(b"\n") + 1
+    if lastline > 0 and rawbytes[:lastline].strip():
+        done = pne_parse_csv_bytes(rawbytes[:lastline], schema)
+    else:
+        done = pd.DataFrame()
+    # 기록 중인 마지막 줄은 별도로 보관하고 다음 갱신 시 다시 읽음
+    if rawbytes[lastline:].strip():
+        partial = pne_parse_csv_bytes(rawbytes[lastline:], schema)
+    else:
+        partial = pd.DataFrame()
+    return done, partial, start_offset + lastline
+
+# 확정 데이터와 작성 중인 줄 합치기
+def pne_join_csv_lines(done, partial):
+    if len(partial) == 0:
+        return done
+    if len(done) == 0:
+        return partial
+    return pd.concat([done, partial], ignore_index=True)
+
+# 줄 끝 byte 위치 계산 (빈 줄, 오류 줄로 개행 수와 행 수가 다르면 None)
+def pne_line_end_offsets(rawbytes, start_offset, rows):
+    line_end = np.flatnonzero(np.frombuffer(rawbytes, dtype=np.uint8) == 10) + 1 + start_offset
+    if len(line_end) != rows:
+        return None
+    return line_end.astype(np.int64)
+
+# PNE Restore csv 캐시 항목 읽기 (경로, 크기, 수정시간이 같으면 캐시 사용, 파일이 커진 경우 추가된 줄만 읽기)
+def pne_read_csv_entry(filepath):
+    readpath = mirror_path(filepath)
+    filestat = os.stat(readpath)
+    schema = pne_schema(filepath)
+    if not PNE_CACHE_ENABLE:
+        with open(readpath, "rb") as f:
+            data = pne_parse_csv_bytes(f.read(), schema)
+        return {"data": data, "partial": pd.DataFrame(), "line_end": None}
+    cache_path = cache_file_path(filepath)
+    entry = cache_load(cache_path)
+    if (entry is not None) and (entry["size"] == filestat.st_size) and (entry["mtime"] == filestat.st_mtime_ns):
+        return entry
+    data = None
+    with open(readpath, "rb") as f:
+        # 진행 중인 채널: 기존 offset 이전 내용이 같으면 뒷부분만 추가로 읽음
+        if (entry is not None) and (filestat.st_size > entry["size"]) and (entry["offset"] > 0):
+            f.seek(entry["offset"] - len(entry["tail"]))
+            if f.read(len(entry["tail"])) == entry["tail"]:
+                rawbytes = f.read()
+                tempdata, partial, offset = pne_parse_csv_lines(rawbytes, entry["offset"], schema)
+                data = pne_join_csv_lines(entry["data"], tempdata)
+                line_end = pne_line_end_offsets(rawbytes[:offset - entry["offset"]], entry["offset"], len(tempdata))
+                if (entry["line_end"] is not None) and (line_end is not None):
+                    line_end = np.concatenate((entry["line_end"], line_end))
+                else:
+                    line_end = None
+        # 캐시가 없거나 파일이 변경된 경우 전체 읽기
+        if data is None:
+            f.seek(0)
+            rawbytes = f.read()
+            data, partial, offset = pne_parse_csv_lines(rawbytes, 0, schema)
+            line_end = pne_line_end_offsets(rawbytes[:offset], 0, len(data))
+        f.seek(max(0, offset - 256))
+        tail = f.read(offset - max(0, offset - 256))
+    entry = {"path": filepath, "size": filestat.st_size, "mtime": filestat.st_mtime_ns, "data": data,
+             "partial": partial, "offset": offset, "tail": tail, "line_end": line_end}
+    cache_save(cache_path, entry)
+    return entry
+
+# PNE Restore csv 읽기 (캐시 사용)
+def pne_read_csv(filepath):
+    entry = pne_read_csv_entry(filepath)
+    return pne_join_csv_lines(entry["data"], entry["partial"])
+
+# SaveData 파일의 cycle별 byte 구간 확인 (cycle 데이터가 연속으로 기록된 경우만, 불가 시 cycles = None)
+def pne_cycle_byte_ranges(filepath):
+    filestat = os.stat(mirror_path(filepath))
+    cache_path = cache_file_path(filepath, ".ranges.pkl")
+    ranges = cache_load(cache_path)
+    if (ranges is not None) and (ranges["size"] == filestat.st_size) and (ranges["mtime"] == filestat.st_mtime_ns):
+        return ranges
+    entry = pne_read_csv_entry(filepath)
+    ranges = {"size": filestat.st_size, "mtime": filestat.st_mtime_ns, "cycles": None}
+    if (entry["line_end"] is not None) and (len(entry["data"]) != 0):
+        rowpos = pd.DataFrame({"cyc": entry["data"][27].to_numpy(), "row": np.arange(len(entry["data"]))})
+        rowpos = rowpos.groupby("cyc")["row"].agg(["min", "max", "count"])
+        if ((rowpos["max"] - rowpos["min"] + 1) == rowpos["count"]).all():
+            line_start = np.concatenate(([0], entry["line_end"][:-1]))
+            ranges["cycles"] = rowpos.index.to_numpy(dtype=np.int64)
+            ranges["start"] = line_start[rowpos["min"].to_numpy()]
+            ranges["end"] = entry["line_end"][rowpos["max"].to_numpy()]
+    cache_save(cache_path, ranges)
+    return ranges
+
+# 채널 단위 data 보관 (PNE/Toyo 공통, 채널 경로 기준으로 하나씩 생성)
+CHANNEL_DATASETS = {}
+CHANNEL_DATASETS_LOCK = threading.Lock()
+# 모든 채널이 공유하는 Profile 원본 보관 한도 (행 수, 초과 시 오래 사용하지 않은 파일부터 제거)
+CHANNEL_PROFILE_ROWS = 3000000
+CHANNEL_PROFILE_STORE = collections.OrderedDict()
+
+# 채널 data 묶음 - cycle 원본, Profile 원본, 최소 용량, 단위 환산을 처음 사용할 때 한 번만 읽어서 보관
+class ChannelDataset:
+    def __init__(self, raw_file_path):
+        self.raw_file_path = raw_file_path
+        self.rawdir = raw_file_path + "\\Restore\\"
+        # PNE21, PNE22는 용량/전류가 µ 단위로 기록됨
+        self.micro_unit = ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path)
+        self.lock = threading.Lock()
+        # 파일 경로 → (크기, 수정시간, data)
+        self.tables = {}
+        # (항목, 인자) → (원본 파일 상태, 값)
+        self.values = {}
+
+    # 파일 상태 (크기, 수정시간), 파일이 없으면 None
+    def file_state(self, filepath):
+        try:
+            filestat = os.stat(mirror_path(filepath))
+        except OSError:
+            return None
+        return (filestat.st_size, filestat.st_mtime_ns)
+
+    # 파일 상태가 같으면 보관한 data 사용, 바뀌었으면 다시 읽기 (Profile 원본은 공유 보관소 사용)
+    def read(self, filepath, loader, profile):
+        state = self.file_state(filepath)
+        if state is None:
+            return loader(filepath)
+        store = CHANNEL_PROFILE_STORE if profile else self.tables
+        with CHANNEL_DATASETS_LOCK:
+            memo = store.get(filepath)
+            if (memo is not None) and (memo[0] == state):
+                if profile:
+                    store.move_to_end(filepath)
+                return memo[1].copy(deep=False)
+        data = loader(filepath)
+        if data is None:
+            return data
+        with CHANNEL_DATASETS_LOCK:
+            store[filepath] = (state, data)
+            if profile:
+                store.move_to_end(filepath)
+                rows = sum(len(item[1]) for item in store.values())
+                while (rows > CHANNEL_PROFILE_ROWS) and (len(store) > 1):
+                    rows = rows - len(store.popitem(last=False)[1][1])
+        return data.copy(deep=False)
+
+    # PNE Restore csv (SaveEndData는 cycle 원본, 나머지는 Profile 원본으로 보관)
+    def pne_csv(self, filepath):
+        return self.read(filepath, pne_read_csv, "SaveEndData" not in os.path.basename(filepath))
+
+    # Toyo csv (cycle 없으면 capacity.log, 있으면 해당 cycle Profile 파일)
+    def toyo_csv(self, cycle=None):
+        if cycle is None:
+            return self.read(self.raw_file_path + "\\capacity.log", lambda filepath: toyo_read_csv(self.raw_file_path), False)
+        return self.read(self.raw_file_path + "\\%06d" % cycle, lambda filepath: toyo_read_csv(self.raw_file_path, cycle), True)
+
+    # 원본 파일이 바뀌지 않았으면 이전에 산정한 값 사용 (최소 용량 등)
+    def value(self, key, filepaths, loader):
+        state = tuple(self.file_state(filepath) for filepath in filepaths)
+        with self.lock:
+            memo = self.values.get(key)
+        if (memo is not None) and (memo[0] == state):
+            return memo[1]
+        result = loader()
+        with self.lock:
+            self.values[key] = (state, result)
+        return result
+
+# 채널 경로의 data 묶음 확인 (없으면 생성)
+def channel_dataset(raw_file_path):
+    with CHANNEL_DATASETS_LOCK:
+        dataset = CHANNEL_DATASETS.get(raw_file_path)
+        if dataset is None:
+            dataset = ChannelDataset(raw_file_path)
+            CHANNEL_DATASETS[raw_file_path] = dataset
+            if MIRROR_ENABLE:
+                mirror_watch(raw_file_path)
+    return dataset
+
+# SaveData 동시 읽기 worker 수
+PNE_READ_WORKERS = 4
+
+# SaveData 파일 여러 개를 동시에 읽고 파일 순서대로 한 번에 합치기 (SaveData 없으면 None)
+def pne_read_savedata(raw_file_path, rawdir, subfile):
+    filepaths = [rawdir + files for files in subfile if "SaveData" in files]
+    if len(filepaths) == 0:
+        return None
+    dataset = channel_dataset(raw_file_path)
+    if len(filepaths) == 1:
+        return dataset.pne_csv(filepaths[0])
+    with ThreadPoolExecutor(max_workers=min(PNE_READ_WORKERS, len(filepaths))) as executor:
+        frames = list(executor.map(dataset.pne_csv, filepaths))
+    return pd.concat(frames, ignore_index=True)
+
 # PNE Profile data 기본 input 처리
 def pne_data(raw_file_path, inicycle):
     df = pd.DataFrame()
@@ -876,47 +1655,98 @@ def pne_data(raw_file_path, inicycle):
             if (filepos[0] == -1):
                 filepos[0] = 0
             subfile = [f for f in os.listdir(rawdir) if f.endswith(".csv")]
-            for files in subfile[(filepos[0]):(filepos[1] + 1)]:
-                # SaveData가 있는 파일을 순서대로 확인하면 Profile 작성
-                if "SaveData" in files:
-                    df.Profilerawtemp = pd.read_csv( (rawdir + files), sep=",", skiprows=0, engine="c", header=None,
-                                                    encoding="cp949", on_bad_lines='skip')
-                    if hasattr(df, "Profileraw"):
-                        df.Profileraw = pd.concat([df.Profileraw, df.Profilerawtemp], ignore_index=True)
-                    else:
-                        df.Profileraw = df.Profilerawtemp 
+            # SaveData가 있는 파일을 순서대로 확인하면 Profile 작성
+            Profileraw = pne_read_savedata(raw_file_path, rawdir, subfile[(filepos[0]):(filepos[1] + 1)])
+            if Profileraw is not None:
+                df.Profileraw = Profileraw
     return df
 
+# PNE 채널별 cycle 위치 index 생성 및 저장 (cycle → 시작/마지막 data 번호 → SaveData 파일 순번)
+def pne_cycle_index(rawdir):
+    endfiles = [f for f in os.listdir(rawdir) if f.endswith(".csv") and ("SaveEndData" in f)]
+    if (len(endfiles) == 0) or (not os.path.isfile(rawdir + "savingFileIndex_start.csv")):
+        return None
+    endpath = rawdir + endfiles[-1]
+    idxpath = rawdir + "savingFileIndex_start.csv"
+    endstat = os.stat(mirror_path(endpath))
+    idxstat = os.stat(mirror_path(idxpath))
+    key = (endstat.st_size, endstat.st_mtime_ns, idxstat.st_size, idxstat.st_mtime_ns)
+    cache_path = cache_file_path(rawdir, ".index.pkl")
+    entry = cache_load(cache_path) if PNE_CACHE_ENABLE else None
+    if (entry is not None) and (entry["key"] == key):
+        return entry
+    # SaveEndData 기준 cycle별 마지막 data 번호
+    df = pne_read_csv(endpath)
+    last_row = df.groupby(27, sort=True)[0].last()
+    cycles = last_row.index.to_numpy(dtype=np.int64)
+    last_row = last_row.to_numpy(dtype=np.int64)
+    first_row = np.concatenate(([1], last_row[:-1] + 1))
+    # 파일별 시작 data 번호 (천 단위 , 제거)
+    df2 = pd.read_csv(mirror_path(idxpath), sep=r"\s+", skiprows=0, engine="c", header=None, encoding="cp949",
+                      on_bad_lines='skip') #pandas>=3.0.0 / 기존 2.2.1
+    file_row = np.array([int(str(element).replace(',', '')) for element in df2.loc[:,3]], dtype=np.int64)
+    entry = {"key": key, "cycles": cycles, "first_row": first_row, "last_row": last_row, "file_row": file_row,
+             "first_file": np.searchsorted(file_row, first_row, side="left") - 1,
+             "last_file": np.searchsorted(file_row, last_row, side="left") - 1}
+    if PNE_CACHE_ENABLE:
+        cache_save(cache_path, entry)
+    return entry
+
+# index에서 cycle 위치 확인 (없으면 -1)
+def pne_index_position(cycles, cycle):
+    pos = int(np.searchsorted(cycles, cycle, side="left"))
+    if pos < len(cycles) and cycles[pos] == cycle:
+        return pos
+    return -1
+
+# PNE 단일 cycle Profile data 처리 (index의 byte 구간만 읽음, 불가 시 pne_data 사용)
+def pne_cycle_profile_data(raw_file_path, inicycle):
+    rawdir = raw_file_path + "\\Restore\\"
+    if PNE_CACHE_ENABLE and os.path.isdir(rawdir):
+        index = pne_cycle_index(rawdir)
+        pos = pne_index_position(index["cycles"], inicycle) if index is not None else -1
+        if pos != -1:
+            subfile = [f for f in os.listdir(rawdir) if f.endswith(".csv")]
+            chunks = []
+            for files in subfile[max(0, index["first_file"][pos]):(max(0, index["last_file"][pos]) + 1)]:
+                if "SaveData" in files:
+                    ranges = pne_cycle_byte_ranges(rawdir + files)
+                    if ranges["cycles"] is None:
+                        return pne_data(raw_file_path, inicycle)
+                    rpos = pne_index_position(ranges["cycles"], inicycle)
+                    if rpos != -1:
+                        with open(mirror_path(rawdir + files), "rb") as f:
+                            f.seek(ranges["start"][rpos])
+                            chunks.append(f.read(ranges["end"][rpos] - ranges["start"][rpos]))
+            if len(chunks) != 0:
+                df = pd.DataFrame()
+                df.Profileraw = pne_parse_csv_bytes(b"".join(chunks), CYCLER_SCHEMA["pne_savedata"])
+                return df
+    return pne_data(raw_file_path, inicycle)
+
 # PNE에서 원하는 사이클이 들어있는 파일명을 찾는 코드
 def pne_search_cycle(rawdir, start, end):
     # Profile에 사용할 파일 선정
     if os.path.isdir(rawdir):
-        subfile = [f for f in os.listdir(rawdir) if f.endswith(".csv")]
-        for files in subfile:
-            # SaveEndData가 있는 파일 확인
-            if "SaveEndData" in files:
-                df = pd.read_csv(rawdir + files, sep=",", skiprows=0, engine="c", header=None, encoding="cp949",
-                                 on_bad_lines='skip')
-                if start != 1:
-                    index_min = df.loc[(df.loc[:,27] == (start - 1)), 0].tolist()
-                else:
-                    index_min = [0]
-                index_max = df.loc[(df.loc[:,27] == end), 0].tolist()
-                if not index_max:
-                    index_max = df.loc[(df.loc[:,27] == df.loc[:,27].max()), 0].tolist()
-                df2 = pd.read_csv(rawdir + "savingFileIndex_start.csv", sep=r"\s+", skiprows=0, engine="c",
-                                  header=None, encoding="cp949", on_bad_lines='skip') #pandas>=3.0.0 / 기존 2.2.1
-                df2 = df2.loc[:,3].tolist()
-                index2 = []
-                for element in df2:
-                    new_element = int(element.replace(',', ''))
-                    index2.append(new_element)
-                if len(index_min) != 0:
-                    file_start = binary_search(index2, index_min[-1] + 1) - 1
-                    file_end = binary_search(index2, index_max[-1]) - 1
-                else:
-                    file_start = -1
-                    file_end = -1
+        index = pne_cycle_index(rawdir)
+        if index is not None:
+            cycles = index["cycles"]
+            if start != 1:
+                pos_min = pne_index_position(cycles, start - 1)
+                index_min = [index["last_row"][pos_min]] if pos_min != -1 else []
+            else:
+                index_min = [0]
+            pos_max = pne_index_position(cycles, end)
+            if pos_max == -1:
+                pos_max = len(cycles) - 1
+            index_max = [index["last_row"][pos_max]]
+            index2 = index["file_row"]
+            if len(index_min) != 0:
+                file_start = binary_search(index2, index_min[-1] + 1) - 1
+                file_end = binary_search(index2, index_max[-1]) - 1
+            else:
+                file_start = -1
+                file_end = -1
     return [file_start, file_end]
 
 # 연속된 데이터의 Profile을 찾아서 확인
@@ -929,26 +1759,14 @@ def pne_continue_data(raw_file_path, inicycle, endcycle):
             subfile = [f for f in os.listdir(rawdir) if f.endswith(".csv")]
             filepos = pne_search_cycle(rawdir, inicycle, endcycle)
             # for files in subfile:
+            Profileraw = None
             if filepos[0] != -1:
-                for files in subfile[(filepos[0]):(filepos[1] + 1)]:
-                    # SaveData가 있는 파일을 순서대로 확인하면 Profile 작성
-                    if "SaveData" in files:
-                        df.Profilerawtemp = pd.read_csv( (rawdir + files), sep=",", skiprows=0, engine="c",
-                                                        header=None, encoding="cp949", on_bad_lines='skip')
-                        if hasattr(df, "Profileraw"):
-                            df.Profileraw = pd.concat([df.Profileraw, df.Profilerawtemp], ignore_index=True)
-                        else:
-                            df.Profileraw = df.Profilerawtemp 
+                # SaveData가 있는 파일을 순서대로 확인하면 Profile 작성
+                Profileraw = pne_read_savedata(raw_file_path, rawdir, subfile[(filepos[0]):(filepos[1] + 1)])
             elif filepos[0] == -1 and inicycle == 1:
-                for files in subfile[0:(filepos[1] + 1)]:
-                    # SaveData가 있는 파일을 순서대로 확인하면 Profile 작성
-                    if "SaveData" in files:
-                        df.Profilerawtemp = pd.read_csv( (rawdir + files), sep=",", skiprows=0, engine="c",
-                                                        header=None, encoding="cp949", on_bad_lines='skip')
-                        if hasattr(df, "Profileraw"):
-                            df.Profileraw = pd.concat([df.Profileraw, df.Profilerawtemp], ignore_index=True)
-                        else:
-                            df.Profileraw = df.Profilerawtemp 
+                Profileraw = pne_read_savedata(raw_file_path, rawdir, subfile[0:(filepos[1] + 1)])
+            if Profileraw is not None:
+                df.Profileraw = Profileraw
     return df
 
 def pne_cyc_continue_data(raw_file_path):
@@ -962,10 +1780,16 @@ def pne_cyc_continue_data(raw_file_path):
             for files in subfile:
                 # SaveData가 있는 파일을 순서대로 확인하면 Profile 작성
                 if "SaveEndData" in files:
-                    df.Cycrawtemp = pd.read_csv((rawdir + files), sep=",", skiprows=0, engine="c",
-                                                header=None, encoding="cp949", on_bad_lines='skip')
+                    df.Cycrawtemp = channel_dataset(raw_file_path).pne_csv(rawdir + files)
     return df
 
+# PNE 첫 파일의 3번째 줄 전류 (data 부족 시 None)
+def pne_initial_current(filepath):
+    inicapraw = pne_read_csv(filepath)
+    if len(inicapraw) > 2:
+        return inicapraw[9].iloc[2]
+    return None
+
 # PNE channel No., mincapacity 산정 기본 처리
 def pne_min_cap(raw_file_path, mincapacity, ini_crate):
     # 용량 산정
@@ -977,12 +1801,235 @@ def pne_min_cap(raw_file_path, mincapacity, ini_crate):
             for files in subfile:
                 if ("SaveData0001.csv" in files):
                     if os.stat(raw_file_path + "\\Restore\\" + files).st_size != 0:
-                        inicapraw = pd.read_csv(raw_file_path + "\\Restore\\" + files, sep=",", skiprows=0, engine="c",
-                                                header=None, encoding="cp949", on_bad_lines='skip')
-                        if len(inicapraw) > 2:
-                            mincapacity = int(round(abs(inicapraw.iloc[2, 9]/1000))/ini_crate)
+                        # 3번째 줄 전류 (채널 data 묶음에 보관)
+                        filepath = raw_file_path + "\\Restore\\" + files
+                        inicurr = channel_dataset(raw_file_path).value(("inicurr", files), [filepath],
+                                                                       lambda: pne_initial_current(filepath))
+                        if inicurr is not None:
+                            mincapacity = int(round(abs(inicurr/1000))/ini_crate)
     return mincapacity
 
+SIMUL_INVERSE_RANGE = 500000
+SIMUL_INVERSE_POINTS = 2048
+
+# 수명 열화식 exp(aT+b)(x*fd)^b1 + exp(cT+d)(x*fd)^(eT+f) 및 x 미분값 (par = a, b, b1, c, d, e, f)
+def simul_degradation(par, fd, temp, x, derivative=False):
+    a_par, b_par, b1_par, c_par, d_par, e_par, f_par = par
+    x = np.asarray(x, dtype=float)
+    first = np.exp(a_par * temp + b_par)
+    second = np.exp(c_par * temp + d_par)
+    power = e_par * temp + f_par
+    if not derivative:
+        return first * (x * fd) ** b1_par + second * (x * fd) ** power
+    return first * b1_par * fd * (x * fd) ** (b1_par - 1) + second * power * fd * (x * fd) ** (power - 1)
+
+# 수명 열화식 역함수 조회표 (0~SIMUL_INVERSE_RANGE log 간격, 단조 증가가 아니면 None)
+def simul_inverse_table(par, fd, temp):
+    x = np.concatenate([[0], np.geomspace(1e-6, SIMUL_INVERSE_RANGE, SIMUL_INVERSE_POINTS)])
+    with np.errstate(all="ignore"):
+        y = simul_degradation(par, fd, temp, x)
+    if not (np.all(np.isfinite(y)) and np.all(np.diff(y) > 0) and y[1] > 0):
+        return None
+    return {"par": par, "fd": fd, "temp": temp, "x": x, "y": y, "log_x": np.log(x[1:]), "log_y": np.log(y[1:])}
+
+# 조회표 보간 후 Newton 1회 보정으로 열화식 = target 인 x 산정 (범위 밖은 nan, 조회표 없으면 brentq)
+def simul_inverse(table, target, equation):
+    if table is None:
+        return root_scalar(equation, bracket=[0, SIMUL_INVERSE_RANGE], method='brentq').root
+    x, y = table["x"], table["y"]
+    if target == y[0]:
+        return x[0]
+    if not (y[0] < target <= y[-1]):
+        return np.nan
+    if target < y[1]:
+        root = x[1] * (target - y[0]) / (y[1] - y[0])
+    else:
+        root = np.exp(np.interp(np.log(target), table["log_y"], table["log_x"]))
+    with np.errstate(all="ignore"):
+        slope = simul_degradation(table["par"], table["fd"], table["temp"], root, derivative=True)
+        if np.isfinite(slope) and slope > 0:
+            root = root - (simul_degradation(table["par"], table["fd"], table["temp"], root) - target) / slope
+    return float(min(max(root, 0), SIMUL_INVERSE_RANGE))
+
+SIMUL_MC_USERS = 2000
+SIMUL_MC_PERCENTILES = (5, 50, 95)
+SIMUL_MC_POINTS = 200
+SIMUL_MC_NEWTON = 30
+SIMUL_MC_SEED = 2602
+# Monte-Carlo parameter 공분산 file (para_capparameter/para_irparameter 의 사이클/저장 column 별 1개, parameter 폴더에 저장)
+SIMUL_MC_COVARIANCE = [("cycle_cap", "para_capcovariance_cycle.txt", "사이클 용량"),
+                       ("storage_cap", "para_capcovariance_storage.txt", "저장 용량"),
+                       ("cycle_dcir", "para_ircovariance_cycle.txt", "사이클 저항"),
+                       ("storage_dcir", "para_ircovariance_storage.txt", "저장 저항")]
+
+# 사용자별 수명 열화식 계수 (par 배열 users x 7 -> exp(aT+b), b1, exp(cT+d), eT+f)
+def simul_batch_terms(par, temp):
+    a_par, b_par, b1_par, c_par, d_par, e_par, f_par = np.asarray(par, dtype=float).T
+    return np.exp(a_par * temp + b_par), b1_par, np.exp(c_par * temp + d_par), e_par * temp + f_par
+
+# 사용자별 수명 열화식 값
+def simul_batch_value(terms, fd, x):
+    first, b1_par, second, power = terms
+    with np.errstate(all="ignore"):
+        xfd = x * fd
+        return first * xfd ** b1_par + second * xfd ** power
+
+# 사용자별 역함수 산정 (log x 기준 Newton, guess로 warm start, 범위 밖/미수렴은 nan)
+def simul_inverse_batch(terms, fd, target, guess):
+    first, b1_par, second, power = terms
+    target = np.asarray(target, dtype=float)
+    root = np.full(target.shape, np.nan)
+    root[target == 0] = 0
+    with np.errstate(all="ignore"):
+        solve = (target > 0) & (target <= simul_batch_value(terms, fd, SIMUL_INVERSE_RANGE))
+        # warm start 값이 없으면 첫 항만으로 근사
+        start = np.where(guess > 0, guess, (target / first) ** (1 / b1_par) / fd)
+        log_x = np.log(np.clip(start, 1e-12, SIMUL_INVERSE_RANGE))
+        log_target = np.log(target)
+        for _ in range(SIMUL_MC_NEWTON):
+            xfd = np.exp(log_x) * fd
+            term1 = first * xfd ** b1_par
+            term2 = second * xfd ** power
+            value = term1 + term2
+            step = (np.log(value) - log_target) * value / (b1_par * term1 + power * term2)
+            step = np.where(solve & np.isfinite(step), step, 0)
+            log_x = np.clip(log_x - step, np.log(1e-12), np.log(SIMUL_INVERSE_RANGE))
+            if np.max(np.abs(step), initial=0) < 1e-12:
+                break
+        converged = np.abs(np.log(simul_batch_value(terms, fd, np.exp(log_x))) - log_target) < 1e-8
+    root[solve & converged] = np.exp(log_x[solve & converged])
+    return root
+
+# 사용자별 사용 조건 sampling (C-rate/DOD/사용 용량/휴지 시간은 log-normal 산포, SOC/온도는 정규 산포)
+def simul_mc_conditions(base, spread, soc_spread, temp_spread, users, rng):
+    conditions = {}
+    for key in ["cycle_crate", "cycle_dcrate", "cycle_dod", "usedcap", "storage_rest1", "storage_rest2"]:
+        conditions[key] = base[key] * rng.lognormal(0, spread / 100, users)
+    for key in ["cycle_soc", "storage_soc1", "storage_soc2"]:
+        conditions[key] = base[key] + rng.normal(0, soc_spread, users)
+    for key in ["cycle_temp", "storage_temp1", "storage_temp2"]:
+        conditions[key] = base[key] + rng.normal(0, temp_spread, users)
+    return conditions
+
+# 공분산 file 읽기 (EU fitting parameter 저장 시 같이 저장한 pcov, parameter 수 이상의 정사각 행렬이 아니면 None)
+def simul_mc_read_covariance(filepath, size):
+    try:
+        cov = pd.read_csv(filepath, sep="\t", engine="c", encoding="UTF-8", skiprows=1, on_bad_lines='skip').to_numpy(dtype=float)
+    except (OSError, ValueError):
+        return None
+    if (cov.ndim != 2) or (cov.shape[0] != cov.shape[1]) or (cov.shape[0] < size) or np.isnan(cov).any():
+        return None
+    return cov
+
+# 공분산 file 저장 (parameter file과 같은 형식)
+def simul_mc_write_covariance(filepath, cov):
+    with open(filepath, 'w') as f:
+        f.write('\n')
+        pd.DataFrame(cov).to_csv(f, sep='\t', index=False, header=True)
+
+# 사용자별 열화 parameter sampling (공분산 pcov가 있으면 다변량 정규, 없으면 고정)
+def simul_mc_parameters(par, cov, users, rng):
+    par = np.asarray(par, dtype=float)
+    if cov is None:
+        return np.tile(par, (users, 1))
+    return rng.multivariate_normal(par, np.asarray(cov, dtype=float)[:len(par), :len(par)], users, check_valid="ignore")
+
+# 사용자별 수명 simulation을 배열로 동시 계산 (simulation_confirm_button 과 같은 사이클 -> 저장1 -> 저장2 순서)
+# pars: cycle_cap/cycle_dcir/storage_cap/storage_dcir 별 users x 7 parameter
+# cyc_coef: (Crate 기울기, 절편, SOC 기울기, 절편, DOD 기울기, 절편, fd), stg_coef: (SOC 기울기, 절편)
+def simul_monte_carlo(pars, conditions, cyc_cap_coef, cyc_dcir_coef, stg_cap_coef, stg_dcir_coef, long_cycle,
+                      long_cycle_vol, real_cap, longlife, xscale, stgcountratio, stgcountratio2, max_steps=100000, cancel=None):
+    users = len(conditions["usedcap"])
+    long_cycle = np.asarray(long_cycle, dtype=float)
+    long_cycle_vol = np.asarray(long_cycle_vol, dtype=float)
+    real_cap = np.asarray(real_cap, dtype=float)
+    legs = []
+    for cap_key, dcir_key, temp_key, rest_key, soc_key in (("cycle_cap", "cycle_dcir", "cycle_temp", "usedcap", "cycle_soc"),
+            ("storage_cap", "storage_dcir", "storage_temp1", "storage_rest1", "storage_soc1"),
+            ("storage_cap", "storage_dcir", "storage_temp2", "storage_rest2", "storage_soc2")):
+        legs.append({"cap": simul_batch_terms(pars[cap_key], conditions[temp_key]),
+                     "dcir": simul_batch_terms(pars[dcir_key], conditions[temp_key]),
+                     "rest": conditions[rest_key], "soc": conditions[soc_key],
+                     "cap_root": np.zeros(users), "dcir_root": np.zeros(users)})
+    # 사이클 1회 (사이클 + 저장1 + 저장2) 소요 일수
+    cycle_time = (conditions["usedcap"] / conditions["cycle_crate"] / 24 + conditions["usedcap"] / conditions["cycle_dcrate"] / 24
+                  + conditions["storage_rest1"] + conditions["storage_rest2"])
+    cycle, storagecycle = np.zeros(users), np.zeros(users)
+    soh, soir = np.ones(users), np.zeros(users)
+    active = np.ones(users, dtype=bool)
+    soh_steps, rsoh_steps, soir_steps = [soh.copy()], [soh.copy()], [soir.copy()]
+    for i in range(0, max_steps):
+        if cancel is not None:
+            cancel.check()
+        # 장수명 구간 (장수명 미적용은 첫 구간 고정, 적용 시 겹치는 경계는 뒤 구간 우선)
+        segment = np.zeros(users, dtype=int)
+        if longlife:
+            complexcycle = np.maximum(storagecycle, cycle)
+            segment[:] = len(long_cycle) - 1
+            for cyc_i in range(0, len(long_cycle) - 1):
+                segment[(complexcycle >= long_cycle[cyc_i]) & (complexcycle <= long_cycle[cyc_i + 1])] = cyc_i
+        long_vol = long_cycle_vol[segment]
+        para_rsoh = real_cap[segment] / 100
+        cycle_soc_cal = legs[0]["soc"] - long_vol
+        fds = [((cyc_cap_coef[0] * conditions["cycle_crate"] + cyc_cap_coef[1]) * (cyc_cap_coef[2] * cycle_soc_cal + cyc_cap_coef[3])
+                * (cyc_cap_coef[4] * conditions["cycle_dod"] + cyc_cap_coef[5]) * cyc_cap_coef[6],
+                (cyc_dcir_coef[0] * conditions["cycle_crate"] + cyc_dcir_coef[1]) * (cyc_dcir_coef[2] * cycle_soc_cal + cyc_dcir_coef[3])
+                * (cyc_dcir_coef[4] * conditions["cycle_dod"] + cyc_dcir_coef[5]) * cyc_dcir_coef[6])]
+        for leg in legs[1:]:
+            fds.append((np.exp(stg_cap_coef[0] * (leg["soc"] - long_vol) + stg_cap_coef[1]),
+                        np.exp(stg_dcir_coef[0] * (leg["soc"] - long_vol) + stg_dcir_coef[1])))
+        cycle = cycle + np.where(active, conditions["usedcap"] / para_rsoh, 0)
+        if stgcountratio != 0:
+            storagecycle = storagecycle + np.where(active, conditions["storage_rest1"] / (stgcountratio / 24), 0)
+        if stgcountratio2 != 0:
+            storagecycle = storagecycle + np.where(active, conditions["storage_rest2"] / (stgcountratio2 / 24), 0)
+        for leg, (cap_fd, dcir_fd) in zip(legs, fds):
+            cap_root = simul_inverse_batch(leg["cap"], cap_fd, 1 - soh, leg["cap_root"])
+            dcir_root = simul_inverse_batch(leg["dcir"], dcir_fd, soir, leg["dcir_root"])
+            failed = np.isnan(cap_root)
+            cap_root[failed] = 0
+            dcir_root[failed] = 0
+            degree_cap = simul_batch_value(leg["cap"], cap_fd, cap_root + leg["rest"]) - simul_batch_value(leg["cap"], cap_fd, cap_root)
+            degree_dcir = (simul_batch_value(leg["dcir"], dcir_fd, dcir_root + leg["rest"])
+                           - simul_batch_value(leg["dcir"], dcir_fd, dcir_root))
+            soh = np.where(active, soh - degree_cap, soh)
+            soir = np.where(active, soir + degree_dcir, soir)
+            # 다음 step warm start
+            leg["cap_root"] = cap_root + leg["rest"]
+            leg["dcir_root"] = dcir_root + leg["rest"]
+        soh_steps.append(soh.copy())
+        rsoh_steps.append(soh * para_rsoh)
+        soir_steps.append(soir.copy())
+        # 수명 종료 (soh 75% 미만) 사용자는 마지막 값 유지, 모든 사용자가 수명 종료 또는 xscale 도달 시 중단
+        active = active & ~((soh < 0.75) | np.isnan(soh))
+        if (~active | (cycle > xscale)).all():
+            break
+    return {"cycle_time": cycle_time, "SOH": np.array(soh_steps), "rSOH": np.array(rsoh_steps), "SOIR": np.array(soir_steps)}
+
+# 사용자별 결과를 공통 시간축(day, 모든 사용자 결과가 있는 구간)으로 보간 후 percentile band 산정
+def simul_mc_bands(mc, percentiles=SIMUL_MC_PERCENTILES, points=SIMUL_MC_POINTS):
+    steps = len(mc["SOH"]) - 1
+    days = np.linspace(0, np.nanmin(mc["cycle_time"]) * steps, points)
+    position = days[:, None] / mc["cycle_time"][None, :]
+    lower = np.clip(np.floor(position).astype(int), 0, steps)
+    upper = np.clip(lower + 1, 0, steps)
+    frac = position - lower
+    columns = np.arange(len(mc["cycle_time"]))[None, :]
+    bands = pd.DataFrame({"time": days})
+    for key in ["SOH", "rSOH", "SOIR"]:
+        value = mc[key][lower, columns] * (1 - frac) + mc[key][upper, columns] * frac
+        for pct, band in zip(percentiles, np.nanpercentile(value, percentiles, axis=1)):
+            bands[key + "_p" + str(pct)] = band
+    return bands
+
+# 장수명 구간 검출 (충전 최고 전압 15mV 초과 감소 또는 방전 최저 전압 50mV 초과 증가, 첫/마지막 행 제외)
+def simul_long_life(df05):
+    position = np.arange(len(df05))
+    long_mask = (((df05["max_vol_diff"] < -15) | (df05["min_vol_diff"] > 50)).to_numpy()
+                 & (position > 0) & (position < len(df05) - 1))
+    long = df05["Dchg_Diff"].where(long_mask, 0)
+    return long, long.cumsum(), df05.index[long_mask].tolist(), df05["Dchg_Diff"][long_mask].tolist()
+
 # PNE Cycle data 처리
 def pne_simul_cycle_data(raw_file_path, min_capacity, ini_crate):
     '''0:Index 1: 2:StepType(1:충전,2:방전,3:휴지,8:loop) 3:ChgDchg 4: 5:충전
@@ -1008,8 +2055,7 @@ def pne_simul_cycle_data(raw_file_path, min_capacity, ini_crate):
             for files in subfile:
                 if "SaveEndData.csv" in files:
                     if os.stat(raw_file_path + "\\Restore\\" + files).st_size != 0:
-                        Cycleraw = pd.read_csv(raw_file_path + "\\Restore\\" + files, sep=",", skiprows=0, engine="c",
-                                               header=None, encoding="cp949", on_bad_lines='skip')
+                        Cycleraw = channel_dataset(raw_file_path).pne_csv(raw_file_path + "\\Restore\\" + files)
                         Cycleraw = Cycleraw[[27, 2, 11, 9, 24, 6, 8]]
                         Cycleraw.columns = ["TotlCycle", "Condition", "DchgCap", "Curr", "Temp", "EndState", "Vol"]
         # Cycleraw["OriCycle"] = Cycleraw["TotlCycle"]
@@ -1042,14 +2088,8 @@ def pne_simul_cycle_data(raw_file_path, min_capacity, ini_crate):
             df05 = df05.loc[df05["Dchg"].idxmax():]
             df05_cap_max = df05["Dchg"].iloc[0] - df05["Dchg_Diff"].iloc[0:30].mean() * float(df05.index[0])
             df05["Dchg"] = df05["Dchg"] / df05_cap_max
-            df05["long"] = 0
         # 장수명 부분 제거 관련 코드
-            for i in range(len(df05) - 1):
-                if((df05["max_vol_diff"].iloc[i] < -15) | (df05["min_vol_diff"].iloc[i] > 50)) & ( i > 0):
-                    df05["long"].iloc[i] =  df05["Dchg_Diff"].iloc[i]
-                    df05_long_cycle.append(df05.index[i])
-                    df05_long_value.append(df05["Dchg_Diff"].iloc[i])
-            df05["long_acc"] = df05["long"].cumsum()
+            df05["long"], df05["long_acc"], df05_long_cycle, df05_long_value = simul_long_life(df05)
         df02 = df_all.query('0.190 < Curr < 0.210')
         df02_max_vol = df_all["max_vol"].max()
         df02 = df02[df02["max_vol"] > (df02_max_vol - 10)]
@@ -1092,14 +2132,8 @@ def pne_simul_cycle_data_file(df_all, raw_file_path, min_capacity, ini_crate):
         df05 = df05.loc[df05["Dchg"].idxmax():]
         df05_cap_max = df05["Dchg"].iloc[0] - df05["Dchg_Diff"].iloc[0:30].mean() * float(df05.index[0])
         df05["Dchg"] = df05["Dchg"] / df05_cap_max
-        df05["long"] = 0
     # 장수명 부분 제거 관련 코드
-        for i in range(len(df05) - 1):
-            if((df05["max_vol_diff"].iloc[i] < -15) | (df05["min_vol_diff"].iloc[i] > 50)) & ( i > 0):
-                df05["long"].iloc[i] =  df05["Dchg_Diff"].iloc[i]
-                df05_long_cycle.append(df05.index[i])
-                df05_long_value.append(df05["Dchg_Diff"].iloc[i])
-        df05["long_acc"] = df05["long"].cumsum()
+        df05["long"], df05["long_acc"], df05_long_cycle, df05_long_value = simul_long_life(df05)
     df02 = df_all.query('0.190 < Curr < 0.210')
     df02_max_vol = df_all["max_vol"].max()
     df02 = df02[df02["max_vol"] > (df02_max_vol - 10)]
@@ -1133,13 +2167,12 @@ def pne_cycle_data(raw_file_path, mincapacity, ini_crate, chkir, chkir2, mkdcir)
             for files in subfile:
                 if "SaveEndData.csv" in files:
                     if os.stat(raw_file_path + "\\Restore\\" + files).st_size > 0 and mincapacity is not None:
-                        Cycleraw = pd.read_csv(raw_file_path + "\\Restore\\" + files, sep=",", skiprows=0, engine="c",
-                                               header=None, encoding="cp949", on_bad_lines='skip')
+                        Cycleraw = channel_dataset(raw_file_path).pne_csv(raw_file_path + "\\Restore\\" + files)
                         Cycleraw = Cycleraw[[27, 2, 10, 11, 8, 20, 45, 15, 17, 9, 24, 29, 6]]
                         Cycleraw.columns = ["TotlCycle", "Condition", "chgCap", "DchgCap", "Ocv", "imp", "volmax",
                                             "DchgEngD", "steptime", "Curr", "Temp", "AvgV", "EndState"]
                         # PNE 기본 DCIR (연속 기준 10s pulse, 10s 이내 시간의 경우 단순 pulse 기준 끝나는 시간 기준)
-                        if ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path):
+                        if channel_dataset(raw_file_path).micro_unit:
                             Cycleraw.DchgCap = Cycleraw.DchgCap/1000
                             Cycleraw.chgCap = Cycleraw.chgCap/1000
                             Cycleraw.Curr = Cycleraw.Curr/1000
@@ -1173,15 +2206,19 @@ def pne_cycle_data(raw_file_path, mincapacity, ini_crate, chkir, chkir2, mkdcir)
                             dcirtemp3[dcirtemp3.columns[5]] = dcirtemp3.iloc[:, 5].astype(float)
 
                             if (len(dcirtemp3) != 0) and (len(dcirtemp1) != 0) and (len(dcirtemp2) != 0):
-                                for i in range(0, min_dcir_count):
-                                    current1 = dcirtemp1.iloc[i, 9]
-                                    current2 = dcirtemp2.iloc[i, 9]
-                                    if current1 != 0 and (current1 - current2) != 0:  # 0으로 나누는 것 방지
-                                        dcirtemp1.iloc[i, 5] = abs((dcirtemp3.iloc[i, 4] - dcirtemp1.iloc[i, 4]) / current1 * 1000)
-                                        dcirtemp2.iloc[i, 5] = abs((dcirtemp2.iloc[i, 4] - dcirtemp1.iloc[i, 4]) / (current1 - current2) * 1000)
-                                    else:
-                                        dcirtemp1.iloc[i, 5] = None  # 또는 다른 기본값 설정
-                                        dcirtemp2.iloc[i, 5] = None
+                                # 세 step 표를 같은 순서로 정렬된 배열로 한 번에 계산
+                                ccv = dcirtemp1["Ocv"].to_numpy(dtype=float)
+                                pulse = dcirtemp2["Ocv"].to_numpy(dtype=float)
+                                rest = dcirtemp3["Ocv"].to_numpy(dtype=float)
+                                current1 = dcirtemp1["Curr"].to_numpy(dtype=float)
+                                current2 = dcirtemp2["Curr"].to_numpy(dtype=float)
+                                # 0으로 나누는 것 방지
+                                valid = (current1 != 0) & ((current1 - current2) != 0)
+                                with np.errstate(divide="ignore", invalid="ignore"):
+                                    rss = np.abs((rest - ccv) / current1 * 1000)
+                                    pulse_dcir = np.abs((pulse - ccv) / (current1 - current2) * 1000)
+                                dcirtemp1[dcirtemp1.columns[5]] = np.where(valid, rss, np.nan)
+                                dcirtemp2[dcirtemp2.columns[5]] = np.where(valid, pulse_dcir, np.nan)
                         # SOC5,50 10s pulse DCIR
                         else:
                             # pulse 기준, 1분 이하 pulse 기준으로 산정
@@ -1249,19 +2286,17 @@ def pne_cycle_data(raw_file_path, mincapacity, ini_crate, chkir, chkir2, mkdcir)
                                     df.NewData.loc[0, "dcir2"] = 0
                                     df.NewData.loc[0, "rssocv"] = 0
                                     df.NewData.loc[0, "rssccv"] = 0
-                                soc70_dcir = df.NewData.dcir2.dropna(axis=0)
-                                soc70_rss_dcir = df.NewData.dcir.dropna(axis=0)
                                 # SOC70의 데이터만 그래프 표기
-                                if (len(soc70_dcir) // 6)  > (len(df.NewData.index) // 100):
+                                if (df.NewData.dcir2.count() // 6)  > (len(df.NewData.index) // 100):
                                     # 6개 중에 4번째 것만 추출
-                                    soc70_dcir = soc70_dcir[3:][::6]
-                                    soc70_rss_dcir = soc70_rss_dcir[3:][::6]
+                                    soc70_start, soc70_step = 3, 6
                                 else:
                                     # 4개 중에 1번째 것만 추출
-                                    soc70_dcir = soc70_dcir[::4]
-                                    soc70_rss_dcir = soc70_rss_dcir[::4]
-                                df.NewData["soc70_dcir"] = soc70_dcir
-                                df.NewData["soc70_rss_dcir"] = soc70_rss_dcir
+                                    soc70_start, soc70_step = 0, 4
+                                df.NewData["soc70_dcir"] = df.NewData.dcir2.where(
+                                    dcir_pick_mask(df.NewData.dcir2, soc70_start, soc70_step))
+                                df.NewData["soc70_rss_dcir"] = df.NewData.dcir.where(
+                                    dcir_pick_mask(df.NewData.dcir, soc70_start, soc70_step))
                         else:
                             if ('dcirtemp' in locals()):
                                 if not chkir2:
@@ -1291,6 +2326,98 @@ def pne_cycle_data(raw_file_path, mincapacity, ini_crate, chkir, chkir2, mkdcir)
                                 df.NewData.loc[0, "dcir"] = 0
     return [mincapacity, df]
 
+# 사이클 data 병렬 로딩 방식 ("thread" 또는 "process") 및 worker 수 (0이면 물리 core 수)
+CYCLE_LOAD_MODE = "thread"
+CYCLE_LOAD_WORKERS = 0
+# process 1개에 한 번에 넘기는 폴더 묶음 수 (worker 당)
+CYCLE_LOAD_CHUNKS = 4
+# 로딩 끝난 폴더부터 바로 그래프/저장 (False면 전체 로딩 후 한 번에)
+CYCLE_LOAD_STREAM = True
+
+# 물리 core 수 (psutil 없으면 논리 core 수)
+def physical_cpu_count():
+    try:
+        import psutil
+        count = psutil.cpu_count(logical=False)
+    except ImportError:
+        count = None
+    return count or os.cpu_count() or 1
+
+# 단일 폴더 사이클 data 로딩 (task_info = 경로, 용량, C-rate, dcir 옵션 3개, PNE 여부, 폴더/하위폴더 번호, 실패 시 None)
+def cycle_data_load(task_info):
+    folder_path, mincapacity, firstCrate, dcirchk, dcirchk_2, mkdcir, is_pne = task_info[:7]
+    try:
+        if is_pne:
+            return pne_cycle_data(folder_path, mincapacity, firstCrate, dcirchk, dcirchk_2, mkdcir)
+        return toyo_cycle_data(folder_path, mincapacity, firstCrate, dcirchk_2)
+    except Exception as e:
+        print(f"[병렬 로딩 오류] {folder_path}: {e}")
+        return None
+
+# 사이클 data → process 간 전달용 payload (mincapacity, NewData index/열 이름/열별 배열, df 없으면 None, NewData 없으면 {})
+def cycle_data_payload(cyctemp):
+    if cyctemp is None:
+        return None
+    if cyctemp[1] is None:
+        return (cyctemp[0], None)
+    if not hasattr(cyctemp[1], "NewData"):
+        return (cyctemp[0], {})
+    newdata = cyctemp[1].NewData
+    return (cyctemp[0], {"index": newdata.index, "columns": list(newdata.columns),
+                         "values": [newdata.iloc[:, col].to_numpy() for col in range(newdata.shape[1])]})
+
+# payload → 사이클 data ([mincapacity, df], df.NewData 복원)
+def cycle_data_restore(payload):
+    if payload is None:
+        return None
+    mincapacity, frame = payload
+    if frame is None:
+        return [mincapacity, None]
+    df = pd.DataFrame()
+    if frame:
+        df.NewData = pd.DataFrame(dict(enumerate(frame["values"])), index=frame["index"])
+        df.NewData.columns = frame["columns"]
+    return [mincapacity, df]
+
+# process worker - 폴더 묶음을 차례로 로딩해서 (폴더 번호, 하위폴더 번호, 경로, payload) 목록 반환
+def cycle_data_chunk(tasks):
+    return [(task[7], task[8], task[0], cycle_data_payload(cycle_data_load(task))) for task in tasks]
+
+# Profile 추출 병렬 worker 수 (0이면 물리 core 수, 파일 대기가 대부분이라 최소 4)
+PROFILE_LOAD_WORKERS = 0
+
+# (채널, cycle) Profile 추출 병렬 처리 - jobs = [(추출 함수, (채널 경로, cycle, 나머지 인자))], 결과는 jobs 순서
+# 채널별 첫 job이 끝난 뒤 같은 채널의 나머지 cycle을 넘김 (최소 용량, cycle index 등 채널 공용 파일은 한 번만 읽음)
+# callback(완료 수, 전체 수), cancel 시 남은 job은 시작하지 않고 TaskCancelled 발생
+def profile_batch_extract(jobs, max_workers=None, callback=None, cancel=None):
+    if max_workers is None:
+        max_workers = PROFILE_LOAD_WORKERS
+    if max_workers <= 0:
+        max_workers = max(4, physical_cpu_count())
+    results = [None] * len(jobs)
+    channel_jobs = {}
+    for no, (extract, args) in enumerate(jobs):
+        channel_jobs.setdefault(args[0], []).append(no)
+    completed = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for nos in channel_jobs.values():
+            futures[executor.submit(jobs[nos[0]][0], *jobs[nos[0]][1])] = nos[0]
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            cancel_pending(cancel, futures)
+            for future in done:
+                no = futures.pop(future)
+                results[no] = future.result()
+                nos = channel_jobs[jobs[no][1][0]]
+                if no == nos[0]:
+                    for rest in nos[1:]:
+                        futures[executor.submit(jobs[rest][0], *jobs[rest][1])] = rest
+                completed = completed + 1
+                if callback is not None:
+                    callback(completed, len(jobs))
+    return results
+
 # PNE Step charge Profile data 처리 class
 def pne_step_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate):
     df = pd.DataFrame()
@@ -1299,7 +2426,7 @@ def pne_step_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate)
         tempcap = pne_min_cap(raw_file_path, mincapacity, inirate)
         mincapacity = tempcap
         # data 기본 처리
-        profile_raw = pne_data(raw_file_path, inicycle)
+        profile_raw = pne_cycle_profile_data(raw_file_path, inicycle)
         # 충전 부분만 별도로 산정
         if hasattr(profile_raw, "Profileraw"):
             profile_raw.Profileraw = profile_raw.Profileraw[(profile_raw.Profileraw[27] == inicycle) 
@@ -1309,7 +2436,7 @@ def pne_step_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate)
             # 충전 단위 변환
             profile_raw.Profileraw["PassTime[Sec]"] = profile_raw.Profileraw["PassTime[Sec]"]/100/60
             profile_raw.Profileraw["Voltage[V]"] = profile_raw.Profileraw["Voltage[V]"]/1000000
-            if ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path):
+            if channel_dataset(raw_file_path).micro_unit:
                 profile_raw.Profileraw["Current[mA]"] = profile_raw.Profileraw["Current[mA]"]/mincapacity/1000000
                 profile_raw.Profileraw["Chgcap"] = profile_raw.Profileraw["Chgcap"]/mincapacity/1000000
             else:
@@ -1345,7 +2472,7 @@ def pne_rate_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate)
         tempcap = pne_min_cap(raw_file_path, mincapacity, inirate)
         mincapacity = tempcap
         # data 기본 처리
-        pnetempdata = pne_data(raw_file_path, inicycle)
+        pnetempdata = pne_cycle_profile_data(raw_file_path, inicycle)
         if hasattr(pnetempdata, 'Profileraw'):
             Profileraw = pnetempdata.Profileraw
             Profileraw = Profileraw.loc[(Profileraw[27] == inicycle) & (Profileraw[2].isin([9, 1]))]
@@ -1354,7 +2481,7 @@ def pne_rate_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate)
             # 충전 단위 변환
             Profileraw["PassTime[Sec]"] = Profileraw["PassTime[Sec]"]/100/60
             Profileraw["Voltage[V]"] = Profileraw["Voltage[V]"]/1000000
-            if ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path):
+            if channel_dataset(raw_file_path).micro_unit:
                 Profileraw["Current[mA]"] = Profileraw["Current[mA]"]/mincapacity/1000000
                 Profileraw["Chgcap"] = Profileraw["Chgcap"]/mincapacity/1000000
             else:
@@ -1377,7 +2504,7 @@ def pne_chg_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate,
         tempcap = pne_min_cap(raw_file_path, mincapacity, inirate)
         mincapacity = tempcap
         # data 기본 처리
-        df = pne_data(raw_file_path, inicycle)
+        df = pne_cycle_profile_data(raw_file_path, inicycle)
         if hasattr(df, 'Profileraw'):
             df.Profileraw = df.Profileraw.loc[(df.Profileraw[27] == inicycle) & (df.Profileraw[2].isin([9, 1]))]
             df.Profileraw = df.Profileraw[[17, 8, 9, 10, 14, 21, 7]]
@@ -1385,7 +2512,7 @@ def pne_chg_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate,
             # 충전 단위 변환
             df.Profileraw["PassTime[Sec]"] = df.Profileraw["PassTime[Sec]"]/100/60
             df.Profileraw["Voltage[V]"] = df.Profileraw["Voltage[V]"]/1000000
-            if ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path):
+            if channel_dataset(raw_file_path).micro_unit:
                 df.Profileraw["Current[mA]"] = df.Profileraw["Current[mA]"]/mincapacity/1000000
                 df.Profileraw["Chgcap"] = df.Profileraw["Chgcap"]/mincapacity/1000000
             else:
@@ -1433,7 +2560,7 @@ def pne_dchg_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate,
         tempcap = pne_min_cap(raw_file_path, mincapacity, inirate)
         mincapacity = tempcap
         # data 기본 처리
-        pnetempdata = pne_data(raw_file_path, inicycle)
+        pnetempdata = pne_cycle_profile_data(raw_file_path, inicycle)
         if hasattr(pnetempdata, 'Profileraw'):
             Profileraw = pnetempdata.Profileraw
             Profileraw = Profileraw.loc[(Profileraw[27] == inicycle) & (Profileraw[2].isin([9, 2]))]
@@ -1442,7 +2569,7 @@ def pne_dchg_Profile_data(raw_file_path, inicycle, mincapacity, cutoff, inirate,
             # 충전 단위 변환
             Profileraw["PassTime[Sec]"] = Profileraw["PassTime[Sec]"]/100/60
             Profileraw["Voltage[V]"] = Profileraw["Voltage[V]"]/1000000
-            if ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path):
+            if channel_dataset(raw_file_path).micro_unit:
                 Profileraw["Current[mA]"] = Profileraw["Current[mA]"]/mincapacity/1000000 * (-1)
                 Profileraw["Dchgcap"] = Profileraw["Dchgcap"]/mincapacity/1000000
             else:
@@ -1493,7 +2620,7 @@ def pne_continue_profile_scale_change(raw_file_path, df, mincapacity):
     df["TotTime[Sec]"] = (df["TotTime[Sec]"] - df.loc[0, "TotTime[Sec]"])
     df["TotTime[Min]"] = (df["TotTime[Sec]"]/60)
     df["Voltage[V]"] = df["Voltage[V]"]/1000000
-    if ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path):
+    if channel_dataset(raw_file_path).micro_unit:
         df["Crate"] = (df["Current[mA]"]/mincapacity/1000000).round(2)
         df["Current[mA]"] = (df["Current[mA]"]/1000000000)
         df["ChgCap"] = df["ChgCap"]/mincapacity/1000000
@@ -1623,6 +2750,29 @@ def pne_dcir_chk_cycle(raw_file_path):
         return result
 
 # PNE DCIR data 처리 class
+# 행별 최소제곱 직선 일괄 산정 (NaN 위치는 제외, 유효 점 2개 미만 또는 x가 모두 같으면 NaN) - slope, 절편, r² 반환
+def batch_linregress(x, y):
+    mask = ~(np.isnan(x) | np.isnan(y))
+    n = mask.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_x = np.where(mask, x, 0).sum(axis=-1) / n
+        mean_y = np.where(mask, y, 0).sum(axis=-1) / n
+        dx = np.where(mask, x - mean_x[..., None], 0)
+        dy = np.where(mask, y - mean_y[..., None], 0)
+        sxx = (dx * dx).sum(axis=-1)
+        syy = (dy * dy).sum(axis=-1)
+        sxy = (dx * dy).sum(axis=-1)
+        slope = sxy / sxx
+        intercept = mean_y - slope * mean_x
+        # 상관계수 (scipy linregress와 같이 분산이 0이면 0)
+        r = np.where((sxx > 0) & (syy > 0), sxy / np.sqrt(sxx * syy), 0.0)
+    invalid = (n < 2) | (sxx == 0)
+    slope[invalid] = np.nan
+    intercept[invalid] = np.nan
+    rsq = np.clip(r, -1.0, 1.0) ** 2
+    rsq[invalid] = np.nan
+    return slope, intercept, rsq
+
 def pne_dcir_Profile_data(raw_file_path, inicycle, endcycle, mincapacity, inirate):
     '''0:Index 1:Stepmode(1:CC-CV, 2:CC, 3:CV, 4:OCV) 2:StepType(1:충전,2:방전,3:휴지,4: OCV, 5: Impedance, 6: End, 8:loop)
     3:ChgDchg 4:State 5:Loop(Loop:1)
@@ -1651,7 +2801,7 @@ def pne_dcir_Profile_data(raw_file_path, inicycle, endcycle, mincapacity, inirat
             dcir_base.reset_index(drop=True, inplace=True)
             dcir_step = list(set(dcir_base["step"].tolist()))
             # 율별 pulse C-rate 확인
-            if ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path):
+            if channel_dataset(raw_file_path).micro_unit:
                 dcir_crate = [((dcir_base.loc[i, "Current[mA]"] / 1000000)/mincapacity).round(2) for i in range(0,4)]
             else:
                 dcir_crate = [((dcir_base.loc[i, "Current[mA]"] / 1000)/mincapacity).round(2) for i in range(0,4)]
@@ -1684,7 +2834,7 @@ def pne_dcir_Profile_data(raw_file_path, inicycle, endcycle, mincapacity, inirat
                 CycfileCap["AccCap"] = (CycfileCap.loc[:,10].cumsum() - CycfileCap[11].cumsum())
                 CycfileCap = CycfileCap.reset_index()
                 CycfileCap["AccCap"] = abs((CycfileCap.loc[:,"AccCap"] - CycfileCap.loc[0,"AccCap"])/1000)
-                if ('PNE21' in raw_file_path) or ('PNE22' in raw_file_path):
+                if channel_dataset(raw_file_path).micro_unit:
                     CycfileCap["AccCap"] = CycfileCap["AccCap"]/1000
                 if dcir_crate[-2] < 0:
                     CycfileCap["SOC"] = (1 - CycfileCap["AccCap"]/mincapacity) * 100
@@ -1702,45 +2852,53 @@ def pne_dcir_Profile_data(raw_file_path, inicycle, endcycle, mincapacity, inirat
                 full_length = len(CycfileCap)
                 RSSfileCap = CycfileCap.copy()
                 # sloep base DCIR 계산
-                for time in dcir_time:
+                # Step 시간, cycle별 pvt table (C-rate별 전압/전류)을 한 번에 생성하고 전체 행의 직선 식을 일괄 산정
+                fit_dcir = Profileraw[Profileraw["StepTime"].isin(dcir_time[1:])]
+                profile_pvt = fit_dcir.pivot_table(index=["StepTime", "Cyc"], columns="Crate", values=["Vol", "Curr"])
+                if len(profile_pvt) != 0:
+                    fit_curr = profile_pvt["Curr"].reindex(columns=profile_pvt["Vol"].columns)
+                    fit_slope, fit_intercept, fit_rsq = batch_linregress(fit_curr.to_numpy() / 1000,
+                                                                         profile_pvt["Vol"].to_numpy())
+                    fit_time = profile_pvt.index.get_level_values("StepTime").to_numpy()
+                else:
+                    fit_slope = fit_intercept = fit_rsq = fit_time = np.array([])
+                for dcir_t in dcir_time:
                     temp_dcir_slope = []
                     temp_dcir_rsq = []
                     temp_dcir_est_ocv = []
                     dcir_slope = []
                     dcir_est_ocv = []
-                    # Step 시간별로 pvt table 생성
-                    time_dcir = Profileraw[Profileraw["StepTime"] == time]
-                    profile_pvt = time_dcir.pivot_table(index="Cyc", columns="Crate", values = "Vol")
-                    profile_pvt_curr = time_dcir.pivot_table(index="Cyc", columns="Crate", values = "Curr")
-                    if time != 0:
-                        for row in range(len(profile_pvt)):
-                            pvt_row_vol = profile_pvt.iloc[row].tolist()
-                            pvt_row_curr = (profile_pvt_curr.iloc[row] / 1000).tolist()
-                            # slope를 DCIR로 산정
-                            slope = linregress(pvt_row_curr, pvt_row_vol)[0]
-                            # 상관계수 확인
-                            rsq = (linregress(pvt_row_curr, pvt_row_vol)[2]) ** 2 * 100
-                            if slope > 0:
-                                # slope를 DCIR로 산정
-                                temp_dcir_slope.append(slope)
-                                # rsq를 DCIR로 산정
-                                temp_dcir_rsq.append(rsq)
-                            if time == dcir_time[1]:
-                                # 절편을 OCV로 산정
-                                ocv = linregress(pvt_row_curr, pvt_row_vol)[1]
-                                temp_dcir_est_ocv.append(ocv)
-                        if time == dcir_time[1]:
+                    if dcir_t != 0:
+                        slope = fit_slope[fit_time == dcir_t]
+                        # slope를 DCIR로 산정 (양수만), 상관계수 확인
+                        temp_dcir_slope = slope[slope > 0].tolist()
+                        temp_dcir_rsq = (fit_rsq[fit_time == dcir_t][slope > 0] * 100).tolist()
+                        if dcir_t == dcir_time[1]:
+                            # 절편을 OCV로 산정
+                            temp_dcir_est_ocv = fit_intercept[fit_time == dcir_t].tolist()
                             dcir_est_ocv = temp_dcir_est_ocv + [np.nan] * (full_length - len(temp_dcir_est_ocv))
                             CycfileCap["OCV"] = dcir_est_ocv[:len(CycfileCap)]
                             RSSfileCap["OCV"] = dcir_est_ocv[:len(RSSfileCap)]
                         dcir_slope = temp_dcir_slope + [np.nan] * (full_length - len(temp_dcir_slope))
                         dcir_rsq = temp_dcir_rsq + [np.nan] * (full_length - len(temp_dcir_rsq))
-                        CycfileCap[str(time)] = dcir_slope[:len(CycfileCap)]
-                        RSSfileCap[str(time) + "_rsq"] = dcir_rsq[:len(RSSfileCap)]
+                        CycfileCap[str(dcir_t)] = dcir_slope[:len(CycfileCap)]
+                        RSSfileCap[str(dcir_t) + "_rsq"] = dcir_rsq[:len(RSSfileCap)]
                     else:
                         pass
                 return [mincapacity, CycfileCap, RSSfileCap]
 
+# Set log 충전기 연결 상태 구분 (realcyc 미사용 시 cycle 재산정 기준)
+SET_UNPLUGGED = ["Unplugged", " NONE"]
+SET_PLUGGED = ["AC", " PDIC_APDO"]
+
+# 미연결 -> 연결 전환 지점(연결 상태가 hold 행 이상 유지)의 누적합으로 cycle 번호 산정, 앞쪽 skip 행은 전환 제외
+def plug_cycle_count(plugtype, cycmin, unplugged, plugged, hold=1, skip=1):
+    plug_change = plugtype.shift(1).isin(unplugged)
+    for k in range(hold):
+        plug_change &= plugtype.shift(-k).isin(plugged)
+    plug_change.iloc[:skip] = False
+    return cycmin + plug_change.cumsum()
+
 def set_log_cycle(filename, realcyc, recentno, allcycle, manualcycle, manualcycleno):
     '''
     Set log
@@ -1789,19 +2947,10 @@ def set_log_cycle(filename, realcyc, recentno, allcycle, manualcycle, manualcycl
         
     if realcyc == 0:
         if cycmin != cycmax:
-            n = cycmin
-            df.Profile['Battery_Cycle'] = n
-            for m in range(1, len(df.Profile) - 3):
-                if (df.Profile.loc[m, 'PlugType'] == "Unplugged" or df.Profile.loc[m, 'PlugType'] == " NONE") and (
-                        df.Profile.loc[m + 1, 'PlugType'] == "AC" or df.Profile.loc[m + 1, 'PlugType'] == " PDIC_APDO") and (
-                        df.Profile.loc[m + 2, 'PlugType'] == "AC" or df.Profile.loc[m + 2, 'PlugType'] == " PDIC_APDO") and (
-                        df.Profile.loc[m + 3, 'PlugType'] == "AC" or df.Profile.loc[m + 3, 'PlugType'] == " PDIC_APDO"):
-                    n = n + 1
-                    # df.Profile.loc[m + 1, 'Battery_Cycle'] = n
-                df.Profile.loc[m + 1, 'Battery_Cycle'] = n
-            df.Profile.loc[len(df.Profile)-2, 'Battery_Cycle'] = n
-            df.Profile.loc[len(df.Profile)-1, 'Battery_Cycle'] = n
-    cycmax = int(df.Profile.Battery_Cycle.max())
+            # 'Unplugged' 또는 ' NONE'에서 'AC' 또는 ' PDIC_APDO'가 3회 연속 이어지는 지점마다 cycle 증가
+            df.Profile['Battery_Cycle'] = plug_cycle_count(df.Profile['PlugType'], cycmin, SET_UNPLUGGED, SET_PLUGGED,
+                                                           hold=3, skip=2)
+    cycmax = int(df.Profile.Battery_Cycle.max()) if not df.Profile.empty else cycmin
     return [cycmin, cycmax, df]
 
 def set_act_ect_battery_status_cycle(filename, realcyc, recentno, allcycle, manualcycle, manualcycleno):
@@ -1908,19 +3057,10 @@ def set_act_ect_battery_status_cycle(filename, realcyc, recentno, allcycle, manu
         df.Profile.reset_index(drop=True, inplace=True)
     if realcyc == 0:
         if cycmin != cycmax:
-            n = cycmin
-            df.Profile['Battery_Cycle'] = n
-            for m in range(1, len(df.Profile) - 3):
-                if (df.Profile.loc[m, 'PlugType'] == "Unplugged" or df.Profile.loc[m, 'PlugType'] == " NONE") and (
-                        df.Profile.loc[m + 1, 'PlugType'] == "AC" or df.Profile.loc[m + 1, 'PlugType'] == " PDIC_APDO") and (
-                        df.Profile.loc[m + 2, 'PlugType'] == "AC" or df.Profile.loc[m + 2, 'PlugType'] == " PDIC_APDO") and (
-                        df.Profile.loc[m + 3, 'PlugType'] == "AC" or df.Profile.loc[m + 3, 'PlugType'] == " PDIC_APDO"):
-                    n = n + 1
-                    # df.Profile.loc[m + 1, 'Battery_Cycle'] = n
-                df.Profile.loc[m + 1, 'Battery_Cycle'] = n
-            df.Profile.loc[len(df.Profile)-2, 'Battery_Cycle'] = n
-            df.Profile.loc[len(df.Profile)-1, 'Battery_Cycle'] = n
-    cycmax = int(df.Profile.Battery_Cycle.max())
+            # 'Unplugged' 또는 ' NONE'에서 'AC' 또는 ' PDIC_APDO'가 3회 연속 이어지는 지점마다 cycle 증가
+            df.Profile['Battery_Cycle'] = plug_cycle_count(df.Profile['PlugType'], cycmin, SET_UNPLUGGED, SET_PLUGGED,
+                                                           hold=3, skip=2)
+    cycmax = int(df.Profile.Battery_Cycle.max()) if not df.Profile.empty else cycmin
     return [cycmin, cycmax, df]
 
 def set_act_log_Profile(rawdatafile, mincapacity, selectcyc):
@@ -2024,6 +3164,59 @@ def set_battery_status_log_Profile(rawdatafile, mincapacity, selectcyc, setcond)
             df.ChgProfile.SOC2 = df.ChgProfile.delCap.cumsum() * 100
     return df
 
+# 백그라운드 작업 결과 signal (완료 값 / 발생 예외)
+class TaskSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+
+# QThreadPool에서 인자 없는 함수를 실행하고 결과를 signal로 전달 (연결된 slot은 GUI thread에서 실행)
+class TaskWorker(QtCore.QRunnable):
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            result = self.task()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
+
+# background_flow 시작 시점의 저장 writer(global)와 pyplot figure 번호
+def flow_snapshot():
+    return globals().get("writer"), set(plt.get_fignums())
+
+# 취소/오류로 중단된 작업이 연 writer 닫기(그때까지 쓴 sheet만 저장)와 새로 만든 figure 닫기
+def discard_flow_output(snapshot):
+    start_writer, start_figs = snapshot
+    flow_writer = globals().get("writer")
+    if (flow_writer is not None) and (flow_writer is not start_writer):
+        if not getattr(getattr(flow_writer, "book", None), "fileclosed", False):
+            try:
+                flow_writer.close()
+            except Exception:
+                pass
+    for fignum in set(plt.get_fignums()) - start_figs:
+        plt.close(fignum)
+
+# 버튼 method를 GUI 단계/백그라운드 단계로 나누는 decorator (작업마다 새 취소 token 사용)
+# method 안에서 yield 한 함수(functools.partial, 인자는 GUI thread에서 미리 평가)는 백그라운드 thread에서 실행되고, 반환값(또는 예외)이 yield 자리로 돌아와 GUI thread에서 이어서 실행
+# 저장 writer(global)와 pyplot 현재 figure를 같이 쓰므로 작업은 한 번에 하나만 실행 (진행 중에는 다른 버튼 무시)
+def background_flow(method):
+    def button(self):
+        if self.running_flows:
+            err_msg("작업 진행 중", "진행 중인 작업이 끝난 뒤 다시 실행해 주세요.")
+            return
+        self.cancel_token = CancelToken()
+        self.flow_snapshots[method.__name__] = flow_snapshot()
+        self.running_flows.add(method.__name__)
+        self.resume_flow(method.__name__, method(self), self.cancel_token, None, None)
+    button.__name__ = method.__name__
+    button.__doc__ = method.__doc__
+    return button
+
 class Ui_sitool(object):
     def setupUi(self, sitool):
         sitool.setObjectName("sitool")
@@ -4704,6 +5897,42 @@ class Ui_sitool(object):
         self.dvdq_rms.setObjectName("dvdq_rms")
         self.horizontalLayout_151.addWidget(self.dvdq_rms)
         self.verticalLayout_22.addLayout(self.horizontalLayout_151)
+        self.horizontalLayout_191 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_191.setObjectName("horizontalLayout_191")
+        self.cycxlabel_63 = QtWidgets.QLabel(parent=self.dvdq)
+        self.cycxlabel_63.setMinimumSize(QtCore.QSize(150, 34))
+        self.cycxlabel_63.setMaximumSize(QtCore.QSize(150, 34))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.cycxlabel_63.setFont(font)
+        self.cycxlabel_63.setObjectName("cycxlabel_63")
+        self.horizontalLayout_191.addWidget(self.cycxlabel_63)
+        self.dvdq_batch_cycle = QtWidgets.QLineEdit(parent=self.dvdq)
+        self.dvdq_batch_cycle.setMinimumSize(QtCore.QSize(180, 34))
+        self.dvdq_batch_cycle.setMaximumSize(QtCore.QSize(180, 34))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.dvdq_batch_cycle.setFont(font)
+        self.dvdq_batch_cycle.setObjectName("dvdq_batch_cycle")
+        self.horizontalLayout_191.addWidget(self.dvdq_batch_cycle)
+        self.dvdq_batch = QtWidgets.QPushButton(parent=self.dvdq)
+        self.dvdq_batch.setMinimumSize(QtCore.QSize(310, 34))
+        self.dvdq_batch.setMaximumSize(QtCore.QSize(310, 34))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.dvdq_batch.setFont(font)
+        self.dvdq_batch.setObjectName("dvdq_batch")
+        self.horizontalLayout_191.addWidget(self.dvdq_batch)
+        self.verticalLayout_22.addLayout(self.horizontalLayout_191)
         self.line_15 = QtWidgets.QFrame(parent=self.dvdq)
         self.line_15.setMinimumSize(QtCore.QSize(656, 3))
         self.line_15.setMaximumSize(QtCore.QSize(656, 3))
@@ -6207,6 +7436,87 @@ class Ui_sitool(object):
         self.txt_storageratio2.setObjectName("txt_storageratio2")
         self.horizontalLayout_62.addWidget(self.txt_storageratio2)
         self.verticalLayout_37.addLayout(self.horizontalLayout_62)
+        self.horizontalLayout_192 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_192.setObjectName("horizontalLayout_192")
+        self.chk_montecarlo = QtWidgets.QCheckBox(parent=self.FitTab)
+        self.chk_montecarlo.setMinimumSize(QtCore.QSize(100, 20))
+        self.chk_montecarlo.setMaximumSize(QtCore.QSize(100, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.chk_montecarlo.setFont(font)
+        self.chk_montecarlo.setObjectName("chk_montecarlo")
+        self.horizontalLayout_192.addWidget(self.chk_montecarlo)
+        self.label_17 = QtWidgets.QLabel(parent=self.FitTab)
+        self.label_17.setMinimumSize(QtCore.QSize(60, 20))
+        self.label_17.setMaximumSize(QtCore.QSize(60, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.label_17.setFont(font)
+        self.label_17.setObjectName("label_17")
+        self.horizontalLayout_192.addWidget(self.label_17)
+        self.txt_mc_users = QtWidgets.QLineEdit(parent=self.FitTab)
+        self.txt_mc_users.setMinimumSize(QtCore.QSize(45, 20))
+        self.txt_mc_users.setMaximumSize(QtCore.QSize(45, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.txt_mc_users.setFont(font)
+        self.txt_mc_users.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.txt_mc_users.setObjectName("txt_mc_users")
+        self.horizontalLayout_192.addWidget(self.txt_mc_users)
+        self.label_18 = QtWidgets.QLabel(parent=self.FitTab)
+        self.label_18.setMinimumSize(QtCore.QSize(55, 20))
+        self.label_18.setMaximumSize(QtCore.QSize(55, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.label_18.setFont(font)
+        self.label_18.setObjectName("label_18")
+        self.horizontalLayout_192.addWidget(self.label_18)
+        self.txt_mc_spread = QtWidgets.QLineEdit(parent=self.FitTab)
+        self.txt_mc_spread.setMinimumSize(QtCore.QSize(30, 20))
+        self.txt_mc_spread.setMaximumSize(QtCore.QSize(30, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.txt_mc_spread.setFont(font)
+        self.txt_mc_spread.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.txt_mc_spread.setObjectName("txt_mc_spread")
+        self.horizontalLayout_192.addWidget(self.txt_mc_spread)
+        self.label_19 = QtWidgets.QLabel(parent=self.FitTab)
+        self.label_19.setMinimumSize(QtCore.QSize(100, 20))
+        self.label_19.setMaximumSize(QtCore.QSize(100, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.label_19.setFont(font)
+        self.label_19.setObjectName("label_19")
+        self.horizontalLayout_192.addWidget(self.label_19)
+        self.txt_mc_soc = QtWidgets.QLineEdit(parent=self.FitTab)
+        self.txt_mc_soc.setMinimumSize(QtCore.QSize(40, 20))
+        self.txt_mc_soc.setMaximumSize(QtCore.QSize(40, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.txt_mc_soc.setFont(font)
+        self.txt_mc_soc.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.txt_mc_soc.setObjectName("txt_mc_soc")
+        self.horizontalLayout_192.addWidget(self.txt_mc_soc)
+        self.txt_mc_temp = QtWidgets.QLineEdit(parent=self.FitTab)
+        self.txt_mc_temp.setMinimumSize(QtCore.QSize(30, 20))
+        self.txt_mc_temp.setMaximumSize(QtCore.QSize(30, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.txt_mc_temp.setFont(font)
+        self.txt_mc_temp.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.txt_mc_temp.setObjectName("txt_mc_temp")
+        self.horizontalLayout_192.addWidget(self.txt_mc_temp)
+        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_192.addItem(spacerItem13)
+        self.verticalLayout_37.addLayout(self.horizontalLayout_192)
         self.horizontalLayout_21 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_21.setObjectName("horizontalLayout_21")
         self.cycxlabel_53 = QtWidgets.QLabel(parent=self.FitTab)
@@ -7093,8 +8403,8 @@ class Ui_sitool(object):
         self.DODTextEdit.setObjectName("DODTextEdit")
         self.horizontalLayout_20.addWidget(self.DODTextEdit)
         self.verticalLayout_24.addLayout(self.horizontalLayout_20)
-        spacerItem13 = QtWidgets.QSpacerItem(143, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_24.addItem(spacerItem13)
+        spacerItem14 = QtWidgets.QSpacerItem(143, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_24.addItem(spacerItem14)
         self.horizontalLayout_25.addLayout(self.verticalLayout_24)
         self.verticalLayout_25 = QtWidgets.QVBoxLayout()
         self.verticalLayout_25.setObjectName("verticalLayout_25")
@@ -7248,8 +8558,8 @@ class Ui_sitool(object):
         self.RestTextEdit_2.setObjectName("RestTextEdit_2")
         self.horizontalLayout_22.addWidget(self.RestTextEdit_2)
         self.verticalLayout_26.addLayout(self.horizontalLayout_22)
-        spacerItem14 = QtWidgets.QSpacerItem(143, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_26.addItem(spacerItem14)
+        spacerItem15 = QtWidgets.QSpacerItem(143, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_26.addItem(spacerItem15)
         self.horizontalLayout_25.addLayout(self.verticalLayout_26)
         self.verticalLayout_28 = QtWidgets.QVBoxLayout()
         self.verticalLayout_28.setObjectName("verticalLayout_28")
@@ -7316,8 +8626,8 @@ class Ui_sitool(object):
         self.RestTextEdit.setObjectName("RestTextEdit")
         self.horizontalLayout_24.addWidget(self.RestTextEdit)
         self.verticalLayout_28.addLayout(self.horizontalLayout_24)
-        spacerItem15 = QtWidgets.QSpacerItem(142, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_28.addItem(spacerItem15)
+        spacerItem16 = QtWidgets.QSpacerItem(142, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_28.addItem(spacerItem16)
         self.horizontalLayout_25.addLayout(self.verticalLayout_28)
         self.verticalLayout_10.addLayout(self.horizontalLayout_25)
         self.line_2 = QtWidgets.QFrame(parent=self.SimGroupConst)
@@ -7626,9 +8936,18 @@ class Ui_sitool(object):
         self.figsaveok.setFont(font)
         self.figsaveok.setObjectName("figsaveok")
         self.horizontalLayout_13.addWidget(self.figsaveok)
+        self.task_cancel = QtWidgets.QPushButton(parent=self.layoutWidget)
+        self.task_cancel.setMinimumSize(QtCore.QSize(80, 30))
+        self.task_cancel.setMaximumSize(QtCore.QSize(80, 30))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.task_cancel.setFont(font)
+        self.task_cancel.setObjectName("task_cancel")
+        self.horizontalLayout_13.addWidget(self.task_cancel)
         self.progressBar = QtWidgets.QProgressBar(parent=self.layoutWidget)
-        self.progressBar.setMinimumSize(QtCore.QSize(1400, 30))
-        self.progressBar.setMaximumSize(QtCore.QSize(1400, 30))
+        self.progressBar.setMinimumSize(QtCore.QSize(1314, 30))
+        self.progressBar.setMaximumSize(QtCore.QSize(1314, 30))
         font = QtGui.QFont()
         font.setFamily("맑은 고딕")
         font.setPointSize(9)
@@ -7887,6 +9206,9 @@ class Ui_sitool(object):
         self.cycxlabel_15.setText(_translate("sitool", "실행 횟수"))
         self.dvdq_test_no.setText(_translate("sitool", "100"))
         self.cycxlabel_26.setText(_translate("sitool", "RMS (%)"))
+        self.cycxlabel_63.setText(_translate("sitool", "사이클 (시작 끝 간격)"))
+        self.dvdq_batch_cycle.setText(_translate("sitool", "1 1000 100"))
+        self.dvdq_batch.setText(_translate("sitool", "사이클별 dVdQ Batch Fitting"))
         self.dvdq_ini_reset.setText(_translate("sitool", "초기치 Reset"))
         self.mat_dvdq_btn.setText(_translate("sitool", "1) 소재 결과 Load"))
         self.pro_dvdq_btn.setText(_translate("sitool", "2) 실험 결과 Load"))
@@ -7973,6 +9295,14 @@ class Ui_sitool(object):
         self.txt_storageratio.setText(_translate("sitool", "0"))
         self.label_16.setText(_translate("sitool", "저장 Count2 (hr/cycle) (>32도)"))
         self.txt_storageratio2.setText(_translate("sitool", "0"))
+        self.chk_montecarlo.setText(_translate("sitool", "Monte-Carlo"))
+        self.label_17.setText(_translate("sitool", "사용자 수"))
+        self.txt_mc_users.setText(_translate("sitool", "2000"))
+        self.label_18.setText(_translate("sitool", "조건 산포(%)"))
+        self.txt_mc_spread.setText(_translate("sitool", "10"))
+        self.label_19.setText(_translate("sitool", "SOC/온도 산포"))
+        self.txt_mc_soc.setText(_translate("sitool", "0.02"))
+        self.txt_mc_temp.setText(_translate("sitool", "3"))
         self.cycxlabel_53.setText(_translate("sitool", "Parameter 경로"))
         self.chk_cell_cycle.setText(_translate("sitool", "Cell수명"))
         self.chk_set_cycle.setText(_translate("sitool", "Set수명"))
@@ -8064,13 +9394,27 @@ class Ui_sitool(object):
         self.saveok.setText(_translate("sitool", "데이터 저장"))
         self.ect_saveok.setText(_translate("sitool", "ECT용 데이터 저장"))
         self.figsaveok.setText(_translate("sitool", "그림 저장"))
+        self.task_cancel.setText(_translate("sitool", "취소"))
 
 class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
+    # 백그라운드 thread에서 GUI thread로 넘기는 호출
+    gui_signal = QtCore.pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         self.setupUi(self)
+        # 백그라운드 작업 관련 (실행 중 flow 이름, 실행 중 worker 보관)
+        self.running_flows = set()
+        self.task_workers = set()
+        self.locked_buttons = []
+        self.flow_snapshots = {}
+        self.cancel_token = CancelToken()
+        self.gui_signal.connect(lambda call: call())
+        self.task_cancel.clicked.connect(self.task_cancel_button)
         self.chnlnow = "default"
         self.tab_no = 0
+        # 마지막 EU fitting 결과 (popt, pcov) - parameter 저장 시 공분산 같이 저장 (parameter 불러오기/초기화 시 None)
+        self.eu_fit = None
         # 충방전기 세팅 관련
         self.toyo_blk_list = ['BLK1', 'BLK2', 'BLK3', 'BLK4', 'BLK5']
         self.toyo_column_list = ['chno', 'use', 'testname', 'folder', 'day', 'part', 'name', 'temp', 'cyc', 'vol', 'path']
@@ -8209,6 +9553,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         self.dvdq_ini_reset.clicked.connect(self.dvdq_ini_reset_button)
         self.dvdq_fitting.clicked.connect(self.dvdq_fitting_button)
         self.dvdq_fitting_2.clicked.connect(self.dvdq_fitting2_button)
+        self.dvdq_batch.clicked.connect(self.dvdq_batch_button)
         self.fittingdegree = 1
         # cycle 초기 a변수 설정
         parini1 = [0.03, -18, 0.7, 2.3, -782, -0.28, 96, 1]
@@ -8253,7 +9598,84 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
     # ========================================
     # 함수 정의
     # ========================================
-    
+
+    def run_in_gui(self, func, *args):
+        """
+        GUI thread에서 실행 (백그라운드 thread에서 부르면 signal로 넘김)
+        """
+        if threading.current_thread() is threading.main_thread():
+            func(*args)
+        else:
+            self.gui_signal.emit(lambda: func(*args))
+
+    def set_progress(self, value):
+        """
+        어느 thread에서든 progressBar 갱신
+        """
+        self.run_in_gui(self.progressBar.setValue, int(value))
+
+    def lock_buttons(self, locked):
+        """
+        백그라운드 작업 중 다른 버튼 잠금 (취소 버튼 제외, 작업 전에 꺼져 있던 버튼은 그대로 유지)
+        """
+        if locked:
+            self.locked_buttons = [button for button in self.findChildren(QtWidgets.QPushButton)
+                                   if button.isEnabled() and (button is not self.task_cancel)]
+            for button in self.locked_buttons:
+                button.setEnabled(False)
+        else:
+            for button in self.locked_buttons:
+                button.setEnabled(True)
+            self.locked_buttons = []
+
+    def end_flow(self, name, stopped=False):
+        """
+        background_flow 종료 처리 (버튼 잠금 해제)
+        취소/오류로 중단된 경우 작업이 열어 둔 writer, figure 정리
+        """
+        snapshot = self.flow_snapshots.pop(name, None)
+        if stopped and (snapshot is not None):
+            discard_flow_output(snapshot)
+        self.running_flows.discard(name)
+        if not self.running_flows:
+            self.lock_buttons(False)
+
+    def resume_flow(self, name, flow, token, result, error):
+        """
+        background_flow 진행 - 다음 yield까지 GUI thread에서 실행 후 yield 한 함수를 QThreadPool에 넘김
+        취소된 token이면 다음 단계(그래프/저장)로 넘어가지 않도록 yield 자리에 TaskCancelled 전달
+        """
+        if error is None and token.cancelled:
+            error = TaskCancelled()
+        try:
+            if error is not None:
+                task = flow.throw(error)
+            else:
+                task = flow.send(result)
+        except StopIteration:
+            self.end_flow(name)
+            return
+        except TaskCancelled:
+            self.end_flow(name, stopped=True)
+            self.progressBar.setValue(0)
+            return
+        except BaseException:
+            self.end_flow(name, stopped=True)
+            raise
+        if not self.locked_buttons:
+            self.lock_buttons(True)
+        worker = TaskWorker(task)
+        self.task_workers.add(worker)
+        def finished(value):
+            self.task_workers.discard(worker)
+            self.resume_flow(name, flow, token, value, None)
+        def failed(e):
+            self.task_workers.discard(worker)
+            self.resume_flow(name, flow, token, None, e)
+        worker.signals.finished.connect(finished)
+        worker.signals.failed.connect(failed)
+        QtCore.QThreadPool.globalInstance().start(worker)
+
     def _init_confirm_button(self, button_widget):
         """
         공통 초기화 로직
@@ -8305,6 +9727,24 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         
         return writer, save_file_name
     
+    def _profile_jobs(self, all_data_folder, CycleNo, by_channel, toyo_extract, pne_extract, *args):
+        """
+        Profile 추출 job 목록 (그래프 그리는 순서 - by_channel이면 폴더→채널→cycle, 아니면 폴더→cycle→채널)
+        job = (추출 함수, (채널 경로, cycle, *args)), levels = 완료 job 수별 progress() 인자
+        """
+        jobs, levels = [], []
+        folders = [cyclefolder for cyclefolder in all_data_folder if os.path.isdir(cyclefolder)]
+        for foldercount, cyclefolder in enumerate(folders, 1):
+            subfolder = [f.path for f in os.scandir(cyclefolder) if f.is_dir() and ("Pattern" not in f.path)]
+            extract = pne_extract if check_cycler(cyclefolder) else toyo_extract
+            outermax, innermax = (len(subfolder), len(CycleNo)) if by_channel else (len(CycleNo), len(subfolder))
+            for outer in range(outermax):
+                for inner in range(innermax):
+                    chnl, cyc = (outer, inner) if by_channel else (inner, outer)
+                    jobs.append((extract, (subfolder[chnl], CycleNo[cyc]) + args))
+                    levels.append((foldercount, len(folders), outer + 1, outermax, inner + 1, innermax))
+        return jobs, levels
+    
     def _create_plot_tab(self, fig, tab_no):
         """
         탭 생성 공통 로직
@@ -8341,22 +9781,25 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         """
         단일 폴더의 사이클 데이터 로딩(ThreadPoolExecutor용)
         """
-        folder_path, mincapacity, firstCrate, dcirchk, dcirchk_2, mkdcir, is_pne, folder_idx, subfolder_idx = task_info
-        try:
-            if is_pne:
-                cyctemp = pne_cycle_data(folder_path, mincapacity, firstCrate, dcirchk, dcirchk_2, mkdcir)
-            else:
-                cyctemp = toyo_cycle_data(folder_path, mincapacity, firstCrate, dcirchk_2)
-            return (folder_idx, subfolder_idx, folder_path, cyctemp)
-        except Exception as e:
-            print(f"[병렬 로딩 오류] {folder_path}: {e}")
-            return (folder_idx, subfolder_idx, folder_path, None)
-    
-    def _load_all_cycle_data_parallel(self, all_data_folder, mincapacity, firstCrate, 
-                                       dcirchk, dcirchk_2, mkdcir, max_workers=4):
+        folder_path, folder_idx, subfolder_idx = task_info[0], task_info[7], task_info[8]
+        return (folder_idx, subfolder_idx, folder_path, cycle_data_load(task_info))
+
+    def _load_all_cycle_data_parallel(self, all_data_folder, mincapacity, firstCrate,
+                                       dcirchk, dcirchk_2, mkdcir, max_workers=None, mode=None, cancel=None,
+                                       on_result=None):
         """
         모든 폴더의 사이클 데이터를 병렬로 로딩
+        mode: "thread" / "process" (None이면 CYCLE_LOAD_MODE), max_workers: None이면 CYCLE_LOAD_WORKERS (0은 물리 core 수)
+        process 방식은 폴더를 묶어서 넘기고 결과는 payload로 받아 NewData를 복원
+        cancel: 취소 시 남은 폴더(묶음)는 시작하지 않고, 진행 중인 것은 끝난 뒤 TaskCancelled 발생
+        on_result: (폴더 번호, 하위폴더 번호), 경로, 사이클 data를 폴더 순서대로 전달 (완료 순서와 무관하게 색상/범례 순서 유지)
+                   CYCLE_LOAD_STREAM이면 앞 폴더가 모두 끝나는 대로 바로 전달하고 진행률은 0~100%로 표시
         """
+        mode = CYCLE_LOAD_MODE if mode is None else mode
+        if max_workers is None:
+            max_workers = CYCLE_LOAD_WORKERS
+        if max_workers <= 0:
+            max_workers = physical_cpu_count()
         tasks = []
         for i, cyclefolder in enumerate(all_data_folder):
             if os.path.exists(cyclefolder):
@@ -8371,18 +9814,50 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         results = {}
         total_tasks = len(tasks)
         completed = 0
-        
+        delivered = 0
+        # 그래프를 따로 그리지 않으면 로딩은 50%까지만 (나머지 50%는 그래프 생성)
+        progress_span = 100 if on_result is not None and CYCLE_LOAD_STREAM else 50
+
+        def deliver(finished):
+            # 완료된 앞쪽 폴더를 순서대로 on_result에 넘김
+            nonlocal delivered
+            if on_result is None or not (CYCLE_LOAD_STREAM or finished):
+                return
+            while delivered < total_tasks and (tasks[delivered][7], tasks[delivered][8]) in results:
+                key = (tasks[delivered][7], tasks[delivered][8])
+                on_result(key, *results[key])
+                delivered += 1
+
+        if mode == "process" and max_workers > 1 and total_tasks > 1:
+            # process 시작 비용을 나누도록 worker 당 CYCLE_LOAD_CHUNKS 묶음으로 분할
+            workers = min(max_workers, total_tasks)
+            chunk_size = -(-total_tasks // (workers * CYCLE_LOAD_CHUNKS))
+            chunks = [tasks[start:start + chunk_size] for start in range(0, total_tasks, chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(cycle_data_chunk, chunk): chunk for chunk in chunks}
+                for future in as_completed(futures):
+                    cancel_pending(cancel, futures)
+                    for folder_idx, subfolder_idx, folder_path, payload in future.result():
+                        results[(folder_idx, subfolder_idx)] = (folder_path, cycle_data_restore(payload))
+                    completed += len(futures[future])
+                    self.set_progress(completed / total_tasks * progress_span)
+                    deliver(False)
+            deliver(True)
+            return results
+
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = {executor.submit(self._load_cycle_data_task, task): task for task in tasks}
             for future in as_completed(futures):
+                cancel_pending(cancel, futures)
                 result = future.result()
                 if result:
                     folder_idx, subfolder_idx, folder_path, cyctemp = result
                     results[(folder_idx, subfolder_idx)] = (folder_path, cyctemp)
                 completed += 1
-                # 진행률 업데이트 (50%까지만 - 나머지 50%는 그래프 생성)
-                self.progressBar.setValue(int(completed / total_tasks * 50))
-        
+                self.set_progress(completed / total_tasks * progress_span)
+                deliver(False)
+
+        deliver(True)
         return results
     
     def cyc_ini_set(self):
@@ -8419,8 +9894,16 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         while tab.count() > 0:
             tab.removeTab(0)
 
-    #종료이벤트 발생시 종료
+    def task_cancel_button(self):
+        """
+        실행 중인 백그라운드 작업 취소 요청 (남은 폴더/묶음은 시작하지 않고 진행 중인 것은 끝난 뒤 중단)
+        """
+        self.cancel_token.cancel()
+
+    #종료이벤트 발생시 실행 중인 작업 취소 후 종료
     def closeEvent(self, QCloseEvent):
+        self.cancel_token.cancel()
+        MIRROR_STOP.set()
         sys.exit()
 
     def inicaprate_on(self):
@@ -8564,6 +10047,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         plt.tight_layout(pad=1, w_pad=1, h_pad=1)
         plt.close()
 
+    @background_flow
     def indiv_cyc_confirm_button(self):
    
         firstCrate, mincapacity, xscale, ylimithigh, ylimitlow, irscale = self.cyc_ini_set()
@@ -8589,10 +10073,10 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         
         # 데이터 로딩 (병렬 처리)
         self.progressBar.setValue(0)
-        loaded_data = self._load_all_cycle_data_parallel(
-            all_data_folder, mincapacity, firstCrate,
+        loaded_data = yield functools.partial(
+            self._load_all_cycle_data_parallel, all_data_folder, mincapacity, firstCrate,
             self.dcirchk.isChecked(), self.dcirchk_2.isChecked(), self.mkdcir.isChecked(),
-            max_workers=4
+            cancel=self.cancel_token
         )
         
 
@@ -8718,6 +10202,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         self.progressBar.setValue(100)
         plt.close()
 
+    @background_flow
     def overall_cyc_confirm_button(self):
         # 데이터 로딩 병렬 처리 적용
         firstCrate, mincapacity, xscale, ylimithigh, ylimitlow, irscale = self.cyc_ini_set()
@@ -8744,17 +10229,12 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         
         graphcolor = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
         
-        # 데이터 로딩 (병렬 처리)
-        self.progressBar.setValue(0)
-        loaded_data = self._load_all_cycle_data_parallel(
-            all_data_folder, mincapacity, firstCrate,
-            self.dcirchk.isChecked(), self.dcirchk_2.isChecked(), self.mkdcir.isChecked(),
-            max_workers=4
-        )
-        
         # Cycle 관련 (그래프통합) - 모든 데이터를 하나의 figure에 그림
         fig, ((ax1, ax2, ax3), (ax4, ax5, ax6)) = plt.subplots(nrows=2, ncols=3, figsize=(14, 8))
+        axes_list = [ax1, ax2, ax3, ax4, ax5, ax6]
         colorno, j, overall_xlimit = 0, 0, 0
+        folder_no = 0
+        folder_isdir = [os.path.isdir(cyclefolder) for cyclefolder in all_data_folder]
         tab_no = 0
         
         # 탭 초기화
@@ -8762,91 +10242,107 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         tab_layout = None
         canvas = None
         toolbar = None
-        has_valid_data = False
-        total_folders = len(all_data_folder)
         
-        for i, cyclefolder in enumerate(all_data_folder):
-            if os.path.isdir(cyclefolder):
-                subfolder = [f.path for f in os.scandir(cyclefolder) if f.is_dir()]
+        def toggle_legend(state):
+            for ax in axes_list:
+                legend = ax.get_legend()
+                if legend:
+                    legend.set_visible(state == QtCore.Qt.CheckState.Checked.value)
+            canvas.draw()
+        
+        def plot_channel(key, FolderBase, cyctemp):
+            # 로딩 끝난 채널 그래프/저장 (폴더 순서대로 호출)
+            nonlocal colorno, j, overall_xlimit, folder_no, tab, tab_layout, canvas, toolbar, irscale, writecolno
+            i = key[0]
+            # 지나간 폴더 수만큼 색상 변경 (없는 폴더는 제외)
+            while folder_no < i:
+                if folder_isdir[folder_no]:
+                    colorno = colorno % 9 + 1
+                folder_no = folder_no + 1
+            if cyctemp is None or cyctemp[1] is None:
+                return
+            
+            # 첫 유효 데이터에서 탭 생성 (나머지 채널은 로딩되는 대로 추가)
+            if tab is None:
+                tab = QtWidgets.QWidget()
+                tab_layout = QtWidgets.QVBoxLayout(tab)
+                canvas = FigureCanvas(fig)
+                toolbar = NavigationToolbar(canvas, None)
+                # 레전드 온/오프 체크박스 추가
+                legend_checkbox = QtWidgets.QCheckBox("Legend ON/OFF")
+                legend_checkbox.setChecked(True)
+                legend_checkbox.stateChanged.connect(toggle_legend)
+                tab_layout.addWidget(legend_checkbox)
+                tab_layout.addWidget(toolbar)
+                tab_layout.addWidget(canvas)
+                self.cycle_tab.addTab(tab, str(tab_no))
+                self.cycle_tab.setCurrentWidget(tab)
+            
+            cycnamelist = FolderBase.split("\\")
+            headername = [cycnamelist[-2] + ", " + cycnamelist[-1]]
+            
+            # 중복없이 같은 LOT끼리에서만 legend 추가
+            if len(all_data_name) != 0 and j == i:
+                temp_lgnd = all_data_name[i]
+                j = j + 1
+            elif len(all_data_name) == 0 and j == i:
+                temp_lgnd = cycnamelist[-2].split('_')[-1]
+                j = j + 1
+            else:
+                temp_lgnd = ""
+            
+            # 레전드 글자수 제한 (최대 20자)
+            if len(temp_lgnd) > 20:
+                temp_lgnd = temp_lgnd[:20] + "..."
+            
+            if hasattr(cyctemp[1], "NewData"):
+                self.capacitytext.setText(str(cyctemp[0]))
+                if float(self.dcirscale.text()) == 0:
+                    irscale_new = int(1/(cyctemp[0]/5000) + 1)//2 * 2
+                    irscale = max(irscale, irscale_new)
+                if len(cyctemp[1].NewData.index) > overall_xlimit:
+                    overall_xlimit = len(cyctemp[1].NewData.index)
                 
-                for sub_idx, FolderBase in enumerate(subfolder):
-                    # 병렬 로딩된 데이터 검색
-                    if (i, sub_idx) not in loaded_data:
-                        continue
-                    
-                    folder_path, cyctemp = loaded_data[(i, sub_idx)]
-                    if cyctemp is None or cyctemp[1] is None:
-                        continue
-                    
-                    # 첫 유효 데이터에서 탭 생성
-                    if tab is None:
-                        tab = QtWidgets.QWidget()
-                        tab_layout = QtWidgets.QVBoxLayout(tab)
-                        canvas = FigureCanvas(fig)
-                        toolbar = NavigationToolbar(canvas, None)
-                    
-                    has_valid_data = True
-                    
-                    # 진행률 업데이트 (50% ~ 100%)
-                    progress_val = 50 + int((i + 1) / total_folders * 50)
-                    self.progressBar.setValue(progress_val)
-                    
-                    cycnamelist = FolderBase.split("\\")
-                    headername = [cycnamelist[-2] + ", " + cycnamelist[-1]]
-                    
-                    # 중복없이 같은 LOT끼리에서만 legend 추가
-                    if len(all_data_name) != 0 and j == i:
-                        temp_lgnd = all_data_name[i]
-                        j = j + 1
-                    elif len(all_data_name) == 0 and j == i:
-                        temp_lgnd = cycnamelist[-2].split('_')[-1]
-                        j = j + 1
+                # dcir2, mkdcir 중복 제거
+                graph_output_cycle(cyctemp[1], xscale, ylimitlow, ylimithigh, irscale, temp_lgnd, temp_lgnd,
+                                   colorno, graphcolor, self.mkdcir, ax1, ax2, ax3, ax4, ax5, ax6)
+                canvas.draw_idle()
+                
+                # Data output option
+                if self.saveok.isChecked() and save_file_name:
+                    output_data(cyctemp[1].NewData, "방전용량", writecolno, writerowno, "Dchg", headername)
+                    output_data(cyctemp[1].NewData, "Rest End", writecolno, writerowno, "RndV", headername)
+                    output_data(cyctemp[1].NewData, "평균 전압", writecolno, writerowno, "AvgV", headername)
+                    output_data(cyctemp[1].NewData, "충방효율", writecolno, writerowno, "Eff", headername)
+                    output_data(cyctemp[1].NewData, "충전용량", writecolno, writerowno, "Chg", headername)
+                    output_data(cyctemp[1].NewData, "방충효율", writecolno, writerowno, "Eff2", headername)
+                    output_data(cyctemp[1].NewData, "방전Energy", writecolno, writerowno, "DchgEng", headername)
+                    cyctempdcir = cyctemp[1].NewData.dcir.dropna(axis=0)
+                    if self.mkdcir.isChecked() and hasattr(cyctemp[1].NewData, "dcir2"):
+                        cyctempdcir2 = cyctemp[1].NewData.dcir2.dropna(axis=0)
+                        cyctemprssocv = cyctemp[1].NewData.rssocv.dropna(axis=0)
+                        cyctemprssccv = cyctemp[1].NewData.rssccv.dropna(axis=0)
+                        cyctempsoc70dcir = cyctemp[1].NewData.soc70_dcir.dropna(axis=0)
+                        cyctempsoc70rssdcir = cyctemp[1].NewData.soc70_rss_dcir.dropna(axis=0)
+                        output_data(cyctempsoc70dcir, "SOC70_DCIR", writecolno, 0, "soc70_dcir", headername)
+                        output_data(cyctempsoc70rssdcir, "SOC70_RSS", writecolno, 0, "soc70_rss_dcir", headername)
+                        output_data(cyctempdcir, "RSS", writecolno, 0, "dcir", headername)
+                        output_data(cyctempdcir2, "DCIR", writecolno, 0, "dcir2", headername)
+                        output_data(cyctempdcir, "RSS", writecolno, 0, "dcir", headername)
+                        output_data(cyctemprssocv, "RSS_OCV", writecolno, 0, "rssocv", headername)
+                        output_data(cyctemprssccv, "RSS_CCV", writecolno, 0, "rssccv", headername)
                     else:
-                        temp_lgnd = ""
-                    
-                    # 레전드 글자수 제한 (최대 20자)
-                    if len(temp_lgnd) > 20:
-                        temp_lgnd = temp_lgnd[:20] + "..."
-                    
-                    if hasattr(cyctemp[1], "NewData"):
-                        self.capacitytext.setText(str(cyctemp[0]))
-                        if float(self.dcirscale.text()) == 0:
-                            irscale_new = int(1/(cyctemp[0]/5000) + 1)//2 * 2
-                            irscale = max(irscale, irscale_new)
-                        if len(cyctemp[1].NewData.index) > overall_xlimit:
-                            overall_xlimit = len(cyctemp[1].NewData.index)
-                        
-                        # dcir2, mkdcir 중복 제거
-                        graph_output_cycle(cyctemp[1], xscale, ylimitlow, ylimithigh, irscale, temp_lgnd, temp_lgnd,
-                                           colorno, graphcolor, self.mkdcir, ax1, ax2, ax3, ax4, ax5, ax6)
-                        
-                        # Data output option
-                        if self.saveok.isChecked() and save_file_name:
-                            output_data(cyctemp[1].NewData, "방전용량", writecolno, writerowno, "Dchg", headername)
-                            output_data(cyctemp[1].NewData, "Rest End", writecolno, writerowno, "RndV", headername)
-                            output_data(cyctemp[1].NewData, "평균 전압", writecolno, writerowno, "AvgV", headername)
-                            output_data(cyctemp[1].NewData, "충방효율", writecolno, writerowno, "Eff", headername)
-                            output_data(cyctemp[1].NewData, "충전용량", writecolno, writerowno, "Chg", headername)
-                            output_data(cyctemp[1].NewData, "방충효율", writecolno, writerowno, "Eff2", headername)
-                            output_data(cyctemp[1].NewData, "방전Energy", writecolno, writerowno, "DchgEng", headername)
-                            cyctempdcir = cyctemp[1].NewData.dcir.dropna(axis=0)
-                            if self.mkdcir.isChecked() and hasattr(cyctemp[1].NewData, "dcir2"):
-                                cyctempdcir2 = cyctemp[1].NewData.dcir2.dropna(axis=0)
-                                cyctemprssocv = cyctemp[1].NewData.rssocv.dropna(axis=0)
-                                cyctemprssccv = cyctemp[1].NewData.rssccv.dropna(axis=0)
-                                cyctempsoc70dcir = cyctemp[1].NewData.soc70_dcir.dropna(axis=0)
-                                cyctempsoc70rssdcir = cyctemp[1].NewData.soc70_rss_dcir.dropna(axis=0)
-                                output_data(cyctempsoc70dcir, "SOC70_DCIR", writecolno, 0, "soc70_dcir", headername)
-                                output_data(cyctempsoc70rssdcir, "SOC70_RSS", writecolno, 0, "soc70_rss_dcir", headername)
-                                output_data(cyctempdcir, "RSS", writecolno, 0, "dcir", headername)
-                                output_data(cyctempdcir2, "DCIR", writecolno, 0, "dcir2", headername)
-                                output_data(cyctempdcir, "RSS", writecolno, 0, "dcir", headername)
-                                output_data(cyctemprssocv, "RSS_OCV", writecolno, 0, "rssocv", headername)
-                                output_data(cyctemprssccv, "RSS_CCV", writecolno, 0, "rssccv", headername)
-                            else:
-                                output_data(cyctempdcir, "DCIR", writecolno, 0, "dcir", headername)
-                            writecolno = writecolno + 1
-                colorno = colorno % 9 + 1
+                        output_data(cyctempdcir, "DCIR", writecolno, 0, "dcir", headername)
+                    writecolno = writecolno + 1
+        
+        # 데이터 로딩 (병렬 처리) - 로딩 끝난 채널부터 GUI thread에서 그래프/저장
+        self.progressBar.setValue(0)
+        yield functools.partial(
+            self._load_all_cycle_data_parallel, all_data_folder, mincapacity, firstCrate,
+            self.dcirchk.isChecked(), self.dcirchk_2.isChecked(), self.mkdcir.isChecked(),
+            cancel=self.cancel_token,
+            on_result=lambda key, folder_path, cyctemp: self.run_in_gui(plot_channel, key, folder_path, cyctemp)
+        )
         
         # 범례 설정
         if len(all_data_name) != 0:
@@ -8866,37 +10362,19 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
             else:
                 output_fig(self.figsaveok, str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
         
-        # 탭 추가 (유효 데이터가 있는 경우에만)
-        if has_valid_data and tab_layout is not None:
-            # 레전드 온/오프 체크박스 추가
-            legend_checkbox = QtWidgets.QCheckBox("Legend ON/OFF")
-            legend_checkbox.setChecked(True)
-            axes_list = [ax1, ax2, ax3, ax4, ax5, ax6]
-            
-            def toggle_legend(state):
-                for ax in axes_list:
-                    legend = ax.get_legend()
-                    if legend:
-                        legend.set_visible(state == QtCore.Qt.CheckState.Checked.value)
-                canvas.draw()
-            
-            legend_checkbox.stateChanged.connect(toggle_legend)
-            
-            tab_layout.addWidget(legend_checkbox)
-            tab_layout.addWidget(toolbar)
-            tab_layout.addWidget(canvas)
-            self.cycle_tab.addTab(tab, str(tab_no))
-            self.cycle_tab.setCurrentWidget(tab)
-            tab_no = tab_no + 1
-        else:
+        # 유효 데이터가 없으면 figure 정리
+        if tab is None:
             plt.close(fig)
         
         if self.saveok.isChecked() and save_file_name:
             writer.close()
         plt.tight_layout(pad=1, w_pad=1, h_pad=1)
+        if canvas is not None:
+            canvas.draw_idle()
         self.progressBar.setValue(100)
         plt.close()
 
+    @background_flow
     def link_cyc_confirm_button(self):
         # 데이터 로딩 병렬 처리 적용
         firstCrate, mincapacity, xscale, ylimithigh, ylimitlow, irscale = self.cyc_ini_set()
@@ -8921,18 +10399,13 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         
         graphcolor = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
         
-        # 데이터 로딩 (병렬 처리)
-        self.progressBar.setValue(0)
-        loaded_data = self._load_all_cycle_data_parallel(
-            all_data_folder, mincapacity, firstCrate,
-            self.dcirchk.isChecked(), self.dcirchk_2.isChecked(), self.mkdcir.isChecked(),
-            max_workers=4
-        )
-        
         # Cycle 관련 (그래프 연결) - 모든 데이터를 연결하여 하나의 figure에 그림
         fig, ((ax1, ax2, ax3), (ax4, ax5, ax6)) = plt.subplots(nrows=2, ncols=3, figsize=(14, 8))
         colorno, j = 0, 0
+        folder_no = -1
+        Chnl_num = 0
         tab_no = 0
+        total_folders = len(all_data_folder)
         
         # 탭 초기화
         tab = None
@@ -8940,88 +10413,92 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         canvas = None
         toolbar = None
         cycnamelist = None
-        has_valid_data = False
-        total_folders = len(all_data_folder)
         
-        for i, cyclefolder in enumerate(all_data_folder):
-            if os.path.exists(cyclefolder):
-                subfolder = [f.path for f in os.scandir(cyclefolder) if f.is_dir()]
+        def plot_channel(key, FolderBase, cyctemp):
+            # 로딩 끝난 채널을 앞 폴더 뒤에 이어서 그래프/저장 (폴더 순서대로 호출)
+            nonlocal colorno, j, folder_no, Chnl_num, tab, tab_layout, canvas, toolbar, cycnamelist
+            nonlocal xscale, irscale, writecolno, writerowno
+            i = key[0]
+            # 새 폴더는 색상/열/채널 번호를 처음부터
+            if folder_no != i:
                 colorno, writecolno, Chnl_num = 0, 0, 0
+                folder_no = i
+            if cyctemp is None or cyctemp[1] is None:
+                return
+            
+            # 첫 유효 데이터에서 탭 생성 (나머지 채널은 로딩되는 대로 추가)
+            if tab is None:
+                tab = QtWidgets.QWidget()
+                tab_layout = QtWidgets.QVBoxLayout(tab)
+                canvas = FigureCanvas(fig)
+                toolbar = NavigationToolbar(canvas, None)
+                tab_layout.addWidget(toolbar)
+                tab_layout.addWidget(canvas)
+                self.cycle_tab.addTab(tab, str(tab_no))
+                self.cycle_tab.setCurrentWidget(tab)
+            
+            cycnamelist = FolderBase.split("\\")
+            headername = [cycnamelist[-2] + ", " + cycnamelist[-1]]
+            
+            if len(all_data_name) != 0 and j == i:
+                lgnd = all_data_name[i]
+                j = j + 1
+            elif len(all_data_name) != 0 and j != i:
+                lgnd = ""
+            else:
+                lgnd = cycnamelist[-1]
+            
+            if hasattr(cyctemp[1], "NewData") and (len(link_writerownum) > Chnl_num):
+                writerowno = link_writerownum[Chnl_num] + CycleMax[Chnl_num]
+                cyctemp[1].NewData.index = cyctemp[1].NewData.index + writerowno
+                if xscale == 0:
+                    xscale = len(cyctemp[1].NewData) * (total_folders + 1)
+                self.capacitytext.setText(str(cyctemp[0]))
+                if irscale == 0:
+                    irscale = int(1/(cyctemp[0]/5000) + 1)//2 * 2
+                if len(all_data_name) == 0:
+                    temp_lgnd = ""
+                else:
+                    temp_lgnd = lgnd
                 
-                for sub_idx, FolderBase in enumerate(subfolder):
-                    # 병렬 로딩된 데이터 검색
-                    if (i, sub_idx) not in loaded_data:
-                        continue
-                    
-                    folder_path, cyctemp = loaded_data[(i, sub_idx)]
-                    if cyctemp is None or cyctemp[1] is None:
-                        continue
-                    
-                    # 첫 유효 데이터에서 탭 생성
-                    if tab is None:
-                        tab = QtWidgets.QWidget()
-                        tab_layout = QtWidgets.QVBoxLayout(tab)
-                        canvas = FigureCanvas(fig)
-                        toolbar = NavigationToolbar(canvas, None)
-                    
-                    has_valid_data = True
-                    
-                    # 진행률 업데이트 (50% ~ 100%)
-                    progress_val = 50 + int((i + 1) / total_folders * 50)
-                    self.progressBar.setValue(progress_val)
-                    
-                    cycnamelist = FolderBase.split("\\")
-                    headername = [cycnamelist[-2] + ", " + cycnamelist[-1]]
-                    
-                    if len(all_data_name) != 0 and j == i:
-                        lgnd = all_data_name[i]
-                        j = j + 1
-                    elif len(all_data_name) != 0 and j != i:
-                        lgnd = ""
+                graph_output_cycle(cyctemp[1], xscale, ylimitlow, ylimithigh, irscale, lgnd, temp_lgnd, colorno,
+                                   graphcolor, self.mkdcir, ax1, ax2, ax3, ax4, ax5, ax6)
+                canvas.draw_idle()
+                
+                # Data output option
+                if self.saveok.isChecked() and save_file_name:
+                    output_data(cyctemp[1].NewData, "방전용량", writecolno, writerowno, "Dchg", headername)
+                    output_data(cyctemp[1].NewData, "Rest End", writecolno, writerowno, "RndV", headername)
+                    output_data(cyctemp[1].NewData, "평균 전압", writecolno, writerowno, "AvgV", headername)
+                    output_data(cyctemp[1].NewData, "충방효율", writecolno, writerowno, "Eff", headername)
+                    output_data(cyctemp[1].NewData, "충전용량", writecolno, writerowno, "Chg", headername)
+                    output_data(cyctemp[1].NewData, "방충효율", writecolno, writerowno, "Eff2", headername)
+                    output_data(cyctemp[1].NewData, "방전Energy", writecolno, writerowno, "DchgEng", headername)
+                    cyctempdcir = cyctemp[1].NewData.dcir.dropna(axis=0)
+                    if self.mkdcir.isChecked() and hasattr(cyctemp[1].NewData, "dcir2"):
+                        cyctempdcir2 = cyctemp[1].NewData.dcir2.dropna(axis=0)
+                        cyctemprssocv = cyctemp[1].NewData.rssocv.dropna(axis=0)
+                        cyctemprssccv = cyctemp[1].NewData.rssccv.dropna(axis=0)
+                        output_data(cyctempdcir2, "DCIR", writecolno, 0, "dcir2", headername)
+                        output_data(cyctempdcir, "RSS", writecolno, 0, "dcir", headername)
+                        output_data(cyctemprssocv, "RSS_OCV", writecolno, 0, "rssocv", headername)
+                        output_data(cyctemprssccv, "RSS_CCV", writecolno, 0, "rssccv", headername)
                     else:
-                        lgnd = cycnamelist[-1]
-                    
-                    if hasattr(cyctemp[1], "NewData") and (len(link_writerownum) > Chnl_num):
-                        writerowno = link_writerownum[Chnl_num] + CycleMax[Chnl_num]
-                        cyctemp[1].NewData.index = cyctemp[1].NewData.index + writerowno
-                        if xscale == 0:
-                            xscale = len(cyctemp[1].NewData) * (total_folders + 1)
-                        self.capacitytext.setText(str(cyctemp[0]))
-                        if irscale == 0:
-                            irscale = int(1/(cyctemp[0]/5000) + 1)//2 * 2
-                        if len(all_data_name) == 0:
-                            temp_lgnd = ""
-                        else:
-                            temp_lgnd = lgnd
-                        
-                        graph_output_cycle(cyctemp[1], xscale, ylimitlow, ylimithigh, irscale, lgnd, temp_lgnd, colorno,
-                                           graphcolor, self.mkdcir, ax1, ax2, ax3, ax4, ax5, ax6)
-                        
-                        # Data output option
-                        if self.saveok.isChecked() and save_file_name:
-                            output_data(cyctemp[1].NewData, "방전용량", writecolno, writerowno, "Dchg", headername)
-                            output_data(cyctemp[1].NewData, "Rest End", writecolno, writerowno, "RndV", headername)
-                            output_data(cyctemp[1].NewData, "평균 전압", writecolno, writerowno, "AvgV", headername)
-                            output_data(cyctemp[1].NewData, "충방효율", writecolno, writerowno, "Eff", headername)
-                            output_data(cyctemp[1].NewData, "충전용량", writecolno, writerowno, "Chg", headername)
-                            output_data(cyctemp[1].NewData, "방충효율", writecolno, writerowno, "Eff2", headername)
-                            output_data(cyctemp[1].NewData, "방전Energy", writecolno, writerowno, "DchgEng", headername)
-                            cyctempdcir = cyctemp[1].NewData.dcir.dropna(axis=0)
-                            if self.mkdcir.isChecked() and hasattr(cyctemp[1].NewData, "dcir2"):
-                                cyctempdcir2 = cyctemp[1].NewData.dcir2.dropna(axis=0)
-                                cyctemprssocv = cyctemp[1].NewData.rssocv.dropna(axis=0)
-                                cyctemprssccv = cyctemp[1].NewData.rssccv.dropna(axis=0)
-                                output_data(cyctempdcir2, "DCIR", writecolno, 0, "dcir2", headername)
-                                output_data(cyctempdcir, "RSS", writecolno, 0, "dcir", headername)
-                                output_data(cyctemprssocv, "RSS_OCV", writecolno, 0, "rssocv", headername)
-                                output_data(cyctemprssccv, "RSS_CCV", writecolno, 0, "rssccv", headername)
-                            else:
-                                output_data(cyctempdcir, "DCIR", writecolno, 0, "dcir", headername)
-                        colorno = colorno + 1
-                        writecolno = writecolno + 1
-                        CycleMax[Chnl_num] = len(cyctemp[1].NewData)
-                        link_writerownum[Chnl_num] = writerowno
-                        Chnl_num = Chnl_num + 1
+                        output_data(cyctempdcir, "DCIR", writecolno, 0, "dcir", headername)
+                colorno = colorno + 1
+                writecolno = writecolno + 1
+                CycleMax[Chnl_num] = len(cyctemp[1].NewData)
+                link_writerownum[Chnl_num] = writerowno
+                Chnl_num = Chnl_num + 1
+        
+        # 데이터 로딩 (병렬 처리) - 로딩 끝난 채널부터 GUI thread에서 그래프/저장
+        self.progressBar.setValue(0)
+        yield functools.partial(
+            self._load_all_cycle_data_parallel, all_data_folder, mincapacity, firstCrate,
+            self.dcirchk.isChecked(), self.dcirchk_2.isChecked(), self.mkdcir.isChecked(),
+            cancel=self.cancel_token,
+            on_result=lambda key, folder_path, cyctemp: self.run_in_gui(plot_channel, key, folder_path, cyctemp)
+        )
         
         # 범례 설정
         if cycnamelist:
@@ -9037,13 +10514,8 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 plt.suptitle(cycnamelist[-2], fontsize=15, fontweight='bold')
                 plt.legend(loc="center left", bbox_to_anchor=(1, 0.5))
         
-        # 탭 추가 (유효 데이터가 있는 경우에만)
-        if has_valid_data and tab_layout is not None:
-            tab_layout.addWidget(toolbar)
-            tab_layout.addWidget(canvas)
-            self.cycle_tab.addTab(tab, str(tab_no))
-            self.cycle_tab.setCurrentWidget(tab)
-            tab_no = tab_no + 1
+        # 그림 저장 (유효 데이터가 없으면 figure 정리)
+        if tab is not None:
             if cycnamelist:
                 output_fig(self.figsaveok, cycnamelist[-2])
         else:
@@ -9052,9 +10524,12 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         if self.saveok.isChecked() and save_file_name:
             writer.close()
         plt.tight_layout(pad=1, w_pad=1, h_pad=1)
+        if canvas is not None:
+            canvas.draw_idle()
         self.progressBar.setValue(100)
         plt.close()
 
+    @background_flow
     def link_cyc_indiv_confirm_button(self):
         # 데이터 로딩 병렬 처리 적용
         
@@ -9099,10 +10574,10 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 self.capacitytext.setText(str(self.mincapacity))
             
             # 병렬 데이터 로딩 (현재 파일의 모든 폴더)
-            loaded_data = self._load_all_cycle_data_parallel(
-                all_data_folder, mincapacity, firstCrate,
+            loaded_data = yield functools.partial(
+                self._load_all_cycle_data_parallel, all_data_folder, mincapacity, firstCrate,
                 self.dcirchk.isChecked(), self.dcirchk_2.isChecked(), self.mkdcir.isChecked(),
-                max_workers=4
+                cancel=self.cancel_token
             )
             
             # 탭 초기화
@@ -9229,6 +10704,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         self.progressBar.setValue(100)
         plt.close()
 
+    @background_flow
     def link_cyc_overall_confirm_button(self):
         # 데이터 로딩 병렬 처리 적용
         
@@ -9282,10 +10758,10 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 self.capacitytext.setText(str(self.mincapacity))
             
             # 병렬 데이터 로딩 (현재 파일의 모든 폴더)
-            loaded_data = self._load_all_cycle_data_parallel(
-                all_data_folder, mincapacity, firstCrate,
+            loaded_data = yield functools.partial(
+                self._load_all_cycle_data_parallel, all_data_folder, mincapacity, firstCrate,
                 self.dcirchk.isChecked(), self.dcirchk_2.isChecked(), self.mkdcir.isChecked(),
-                max_workers=4
+                cancel=self.cancel_token
             )
             
             total_folders = len(all_data_folder)
@@ -9406,6 +10882,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         self.progressBar.setValue(100)
         plt.close()
 
+    @background_flow
     def step_confirm_button(self):
         # 함수 사용으로 변경
         init_data = self._init_confirm_button(self.StepConfirm)
@@ -9415,37 +10892,34 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         
         # 용량 선정 관련
         global writer
-        write_column_num, folder_count, chnlcount, cyccount = 0, 0, 0, 0
+        write_column_num = 0
         
         # 함수 사용으로 변경
         writer, save_file_name = self._setup_file_writer()
+        
+        # Profile 추출 (병렬 처리) - 결과는 그래프 그리는 순서, 진행률은 완료된 job 기준
+        by_channel = self.CycProfile.isChecked()
+        jobs, levels = self._profile_jobs(all_data_folder, CycleNo, by_channel, toyo_step_Profile_data, pne_step_Profile_data,
+                                          mincapacity, mincrate, firstCrate)
+        profiles = yield functools.partial(profile_batch_extract, jobs, cancel=self.cancel_token,
+                                           callback=lambda done, total: self.set_progress(progress(*levels[done - 1])))
+        profiles = iter(profiles)
         tab_no = 0
         for i, cyclefolder in enumerate(all_data_folder):
             if os.path.isdir(cyclefolder):
                 subfolder = [f.path for f in os.scandir(cyclefolder) if f.is_dir()]
-                foldercountmax = len(all_data_folder)
-                folder_count = folder_count + 1
-                if self.CycProfile.isChecked():
+                if by_channel:
                     for FolderBase in subfolder:
                         fig, ((step_ax1, step_ax2, step_ax3) ,(step_ax4, step_ax5, step_ax6)) = plt.subplots(
                             nrows=2, ncols=3, figsize=(14, 10))
                         # 함수 사용으로 변경
                         tab, tab_layout, canvas, toolbar = self._create_plot_tab(fig, tab_no)
-                        chnlcount = chnlcount + 1
-                        chnlcountmax = len(subfolder)
                         if "Pattern" not in FolderBase:
                             for Step_CycNo in CycleNo:
-                                cyccountmax = len(CycleNo)
-                                cyccount = cyccount + 1
-                                progressdata = progress(folder_count, foldercountmax, chnlcount, chnlcountmax, cyccount, cyccountmax)
-                                self.progressBar.setValue(int(progressdata))
                                 step_namelist = FolderBase.split("\\")
                                 headername = step_namelist[-2] + ", " + step_namelist[-1] + ", " + str(Step_CycNo) + "cy, "
                                 lgnd = "%04d" % Step_CycNo
-                                if not check_cycler(cyclefolder):
-                                    temp = toyo_step_Profile_data( FolderBase, Step_CycNo, mincapacity, mincrate, firstCrate)
-                                else:
-                                    temp = pne_step_Profile_data( FolderBase, Step_CycNo, mincapacity, mincrate, firstCrate)
+                                temp = next(profiles)
                                 if len(all_data_name) == 0:
                                     temp_lgnd = ""
                                 else:
@@ -9503,21 +10977,12 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                             nrows=2, ncols=3, figsize=(14, 10))
                         # 함수 사용으로 변경
                         tab, tab_layout, canvas, toolbar = self._create_plot_tab(fig, tab_no)
-                        chnlcount = chnlcount + 1
-                        chnlcountmax = len(subfolder)
                         for FolderBase in subfolder:
                             if "Pattern" not in FolderBase:
-                                cyccountmax = len(CycleNo)
-                                cyccount = cyccount + 1
-                                progressdata = progress(folder_count, foldercountmax, cyccount, cyccountmax, chnlcount, chnlcountmax)
-                                self.progressBar.setValue(int(progressdata))
                                 step_namelist = FolderBase.split("\\")
                                 headername = step_namelist[-2] + ", " + step_namelist[-1] + ", " + str(Step_CycNo) + "cy, "
                                 lgnd = step_namelist[-1]
-                                if not check_cycler(cyclefolder):
-                                    temp = toyo_step_Profile_data( FolderBase, Step_CycNo, mincapacity, mincrate, firstCrate)
-                                else:
-                                    temp = pne_step_Profile_data( FolderBase, Step_CycNo, mincapacity, mincrate, firstCrate)
+                                temp = next(profiles)
                                 if len(all_data_name) == 0:
                                     temp_lgnd = ""
                                 else:
@@ -9561,6 +11026,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         self.progressBar.setValue(100)
         plt.close()
 
+    @background_flow
     def rate_confirm_button(self):
         # 함수 사용으로 변경
         init_data = self._init_confirm_button(self.RateConfirm)
@@ -9570,36 +11036,33 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         
         # 용량 선정 관련
         global writer
-        writecolno, foldercount, chnlcount, cyccount = 0, 0, 0, 0
+        writecolno = 0
         
         # 함수 사용으로 변경
         writer, save_file_name = self._setup_file_writer()
+        
+        # Profile 추출 (병렬 처리) - 결과는 그래프 그리는 순서, 진행률은 완료된 job 기준
+        by_channel = self.CycProfile.isChecked()
+        jobs, levels = self._profile_jobs(all_data_folder, CycleNo, by_channel, toyo_rate_Profile_data, pne_rate_Profile_data,
+                                          mincapacity, mincrate, firstCrate)
+        profiles = yield functools.partial(profile_batch_extract, jobs, cancel=self.cancel_token,
+                                           callback=lambda done, total: self.set_progress(progress(*levels[done - 1])))
+        profiles = iter(profiles)
         tab_no = 0
         for i, cyclefolder in enumerate(all_data_folder):
             subfolder = [f.path for f in os.scandir(cyclefolder) if f.is_dir()]
-            foldercountmax = len(all_data_folder)
-            foldercount = foldercount + 1
-            if self.CycProfile.isChecked():
+            if by_channel:
                 for FolderBase in subfolder:
                     fig, ((rate_ax1, rate_ax2, rate_ax3) ,(rate_ax4, rate_ax5, rate_ax6)) = plt.subplots(
                         nrows=2, ncols=3, figsize=(14, 10))
                     # 함수 사용으로 변경
                     tab, tab_layout, canvas, toolbar = self._create_plot_tab(fig, tab_no)
-                    chnlcount = chnlcount + 1
-                    chnlcountmax = len(subfolder)
                     if "Pattern" not in FolderBase:
                         for CycNo in CycleNo:
-                            cyccountmax = len(CycleNo)
-                            cyccount = cyccount + 1
-                            progressdata = progress(foldercount, foldercountmax, chnlcount, chnlcountmax, cyccount, cyccountmax)
-                            self.progressBar.setValue(int(progressdata))
                             Ratenamelist = FolderBase.split("\\")
                             headername = Ratenamelist[-2] + ", " + Ratenamelist[-1] + ", " + str(CycNo) + "cy, "
                             lgnd = "%04d" % CycNo
-                            if not check_cycler(cyclefolder):
-                                Ratetemp = toyo_rate_Profile_data( FolderBase, CycNo, mincapacity, mincrate, firstCrate)
-                            else:
-                                Ratetemp = pne_rate_Profile_data( FolderBase, CycNo, mincapacity, mincrate, firstCrate)
+                            Ratetemp = next(profiles)
                             if len(all_data_name) == 0:
                                 temp_lgnd = ""
                             else:	
@@ -9663,21 +11126,12 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                         nrows=2, ncols=3, figsize=(14, 10))
                     # 함수 사용으로 변경
                     tab, tab_layout, canvas, toolbar = self._create_plot_tab(fig, tab_no)
-                    chnlcount = chnlcount + 1
-                    chnlcountmax = len(subfolder)
                     for FolderBase in subfolder:
                         if "Pattern" not in FolderBase:
-                            cyccountmax = len(CycleNo)
-                            cyccount = cyccount + 1
-                            progressdata = progress(foldercount, foldercountmax, cyccount, cyccountmax, chnlcount, chnlcountmax)
-                            self.progressBar.setValue(int(progressdata))
                             Ratenamelist = FolderBase.split("\\")
                             headername = Ratenamelist[-2] + ", " + Ratenamelist[-1] + ", " + str(CycNo) + "cy, "
                             lgnd = Ratenamelist[-1]
-                            if not check_cycler(cyclefolder):
-                                Ratetemp = toyo_rate_Profile_data( FolderBase, CycNo, mincapacity, mincrate, firstCrate)
-                            else:
-                                Ratetemp = pne_rate_Profile_data( FolderBase, CycNo, mincapacity, mincrate, firstCrate)
+                            Ratetemp = next(profiles)
                             if len(all_data_name) == 0:
                                 temp_lgnd = ""
                             else:	
@@ -9735,6 +11189,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         self.progressBar.setValue(100)
         plt.close()
 
+    @background_flow
     def chg_confirm_button(self):
         # 함수 사용으로 변경
         init_data = self._init_confirm_button(self.ChgConfirm)
@@ -9744,39 +11199,34 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         
         # 용량 선정 관련
         global writer
-        foldercount, chnlcount, cyccount, writecolno = 0, 0, 0, 0
+        writecolno = 0
         
         # 함수 사용으로 변경
         writer, save_file_name = self._setup_file_writer()
+        
+        # Profile 추출 (병렬 처리) - 결과는 그래프 그리는 순서, 진행률은 완료된 job 기준
+        by_channel = self.CycProfile.isChecked()
+        jobs, levels = self._profile_jobs(all_data_folder, CycleNo, by_channel, toyo_chg_Profile_data, pne_chg_Profile_data,
+                                          mincapacity, mincrate, firstCrate, smoothdegree)
+        profiles = yield functools.partial(profile_batch_extract, jobs, cancel=self.cancel_token,
+                                           callback=lambda done, total: self.set_progress(progress(*levels[done - 1])))
+        profiles = iter(profiles)
         tab_no = 0
         for i, cyclefolder in enumerate(all_data_folder):
             if os.path.isdir(cyclefolder):
                 subfolder = [f.path for f in os.scandir(cyclefolder) if f.is_dir()]
-                foldercountmax = len(all_data_folder)
-                foldercount = foldercount + 1
-                if self.CycProfile.isChecked():
+                if by_channel:
                     for FolderBase in subfolder:
-                        chnlcount = chnlcount + 1
-                        chnlcountmax = len(subfolder)
                         if "Pattern" not in FolderBase:
                             fig, ((Chg_ax1, Chg_ax2, Chg_ax3) ,(Chg_ax4, Chg_ax5, Chg_ax6)) = plt.subplots(
                                 nrows=2, ncols=3, figsize=(14, 10))
                             # 함수 사용으로 변경
                             tab, tab_layout, canvas, toolbar = self._create_plot_tab(fig, tab_no)
                             for CycNo in CycleNo:
-                                cyccountmax = len(CycleNo)
-                                cyccount = cyccount + 1
-                                progressdata = progress(foldercount, foldercountmax, chnlcount, chnlcountmax, cyccount, cyccountmax)
-                                self.progressBar.setValue(int(progressdata))
                                 Chgnamelist = FolderBase.split("\\")
                                 headername = Chgnamelist[-2] + ", " + Chgnamelist[-1] + ", " + str(CycNo) + "cy, "
                                 lgnd = "%04d" % CycNo
-                                if not check_cycler(cyclefolder):
-                                    Chgtemp = toyo_chg_Profile_data( FolderBase, CycNo, mincapacity, mincrate, firstCrate,
-                                                                    smoothdegree)
-                                else:
-                                    Chgtemp = pne_chg_Profile_data( FolderBase, CycNo, mincapacity, mincrate, firstCrate,
-                                                                   smoothdegree)
+                                Chgtemp = next(profiles)
                                 if len(all_data_name) == 0:
                                     temp_lgnd = ""
                                 else:	
@@ -9853,8 +11303,6 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                             output_fig(self.figsaveok, title)
                 else:
                     for CycNo in CycleNo:
-                        chnlcount = chnlcount + 1
-                        chnlcountmax = len(subfolder)
                         fig, ((Chg_ax1, Chg_ax2, Chg_ax3) ,(Chg_ax4, Chg_ax5, Chg_ax6)) = plt.subplots(
                             nrows=2, ncols=3, figsize=(14, 10))
                         tab = QtWidgets.QWidget()
@@ -9863,19 +11311,10 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                         toolbar = NavigationToolbar(canvas, None)
                         for FolderBase in subfolder:
                             if "Pattern" not in FolderBase:
-                                cyccountmax = len(CycleNo)
-                                cyccount = cyccount + 1
-                                progressdata = progress(foldercount, foldercountmax, cyccount, cyccountmax, chnlcount, chnlcountmax)
-                                self.progressBar.setValue(int(progressdata))
                                 Chgnamelist = FolderBase.split("\\")
                                 headername = Chgnamelist[-2] + ", " + Chgnamelist[-1] + ", " + str(CycNo) + "cy, "
                                 lgnd = Chgnamelist[-1]
-                                if not check_cycler(cyclefolder):
-                                    Chgtemp = toyo_chg_Profile_data( FolderBase, CycNo, mincapacity, mincrate, firstCrate,
-                                                                    smoothdegree)
-                                else:
-                                    Chgtemp = pne_chg_Profile_data( FolderBase, CycNo, mincapacity, mincrate, firstCrate,
-                                                                   smoothdegree)
+                                Chgtemp = next(profiles)
                                 if len(all_data_name) == 0:
                                     temp_lgnd = ""
                                 else:	
@@ -9944,6 +11383,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         self.progressBar.setValue(100)
         plt.close()
 
+    @background_flow
     def dchg_confirm_button(self):
         # 함수 사용으로 변경
         init_data = self._init_confirm_button(self.DchgConfirm)
@@ -9953,39 +11393,34 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         
         # 용량 선정 관련
         global writer
-        foldercount, chnlcount, cyccount, writecolno = 0, 0, 0, 0
+        writecolno = 0
         
         # 함수 사용으로 변경    
         writer, save_file_name = self._setup_file_writer()
+        
+        # Profile 추출 (병렬 처리) - 결과는 그래프 그리는 순서, 진행률은 완료된 job 기준
+        by_channel = self.CycProfile.isChecked()
+        jobs, levels = self._profile_jobs(all_data_folder, CycleNo, by_channel, toyo_dchg_Profile_data, pne_dchg_Profile_data,
+                                          mincapacity, mincrate, firstCrate, smoothdegree)
+        profiles = yield functools.partial(profile_batch_extract, jobs, cancel=self.cancel_token,
+                                           callback=lambda done, total: self.set_progress(progress(*levels[done - 1])))
+        profiles = iter(profiles)
         tab_no = 0
         for i, cyclefolder in enumerate(all_data_folder):
             if os.path.isdir(cyclefolder):
                 subfolder = [f.path for f in os.scandir(cyclefolder) if f.is_dir()]
-                foldercountmax = len(all_data_folder)
-                foldercount = foldercount + 1
-                if self.CycProfile.isChecked():
+                if by_channel:
                     for FolderBase in subfolder:
-                        chnlcount = chnlcount + 1
-                        chnlcountmax = len(subfolder)
                         if "Pattern" not in FolderBase:
                             fig, ((Chg_ax1, Chg_ax2, Chg_ax3) ,(Chg_ax4, Chg_ax5, Chg_ax6)) = plt.subplots(
                                 nrows=2, ncols=3, figsize=(14, 10))
                             # 함수 사용으로 변경
                             tab, tab_layout, canvas, toolbar = self._create_plot_tab(fig, tab_no)
                             for CycNo in CycleNo:
-                                cyccountmax = len(CycleNo)
-                                cyccount = cyccount + 1
-                                progressdata = progress(foldercount, foldercountmax, chnlcount, chnlcountmax, cyccount, cyccountmax)
-                                self.progressBar.setValue(int(progressdata))
                                 Dchgnamelist = FolderBase.split("\\")
                                 headername = Dchgnamelist[-2] + ", " + Dchgnamelist[-1] + ", " + str(CycNo) + "cy, "
                                 lgnd = "%04d" % CycNo
-                                if not check_cycler(cyclefolder):
-                                    Dchgtemp = toyo_dchg_Profile_data(FolderBase, CycNo, mincapacity, mincrate, firstCrate,
-                                                                      smoothdegree)
-                                else:
-                                    Dchgtemp = pne_dchg_Profile_data(FolderBase, CycNo, mincapacity, mincrate, firstCrate,
-                                                                     smoothdegree)
+                                Dchgtemp = next(profiles)
                                 if len(all_data_name) == 0:
                                     temp_lgnd = ""
                                 else:	
@@ -10058,8 +11493,6 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                             output_fig(self.figsaveok, title)
                 else:
                     for CycNo in CycleNo:
-                        chnlcount = chnlcount + 1
-                        chnlcountmax = len(subfolder)
                         fig, ((Chg_ax1, Chg_ax2, Chg_ax3) ,(Chg_ax4, Chg_ax5, Chg_ax6)) = plt.subplots(
                             nrows=2, ncols=3, figsize=(14, 10))
                         tab = QtWidgets.QWidget()
@@ -10068,17 +11501,10 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                         toolbar = NavigationToolbar(canvas, None)
                         for FolderBase in subfolder:
                             if "Pattern" not in FolderBase:
-                                cyccountmax = len(CycleNo)
-                                cyccount = cyccount + 1
-                                progressdata = progress(foldercount, foldercountmax, cyccount, cyccountmax, chnlcount, chnlcountmax)
-                                self.progressBar.setValue(int(progressdata))
                                 Dchgnamelist = FolderBase.split("\\")
                                 headername = Dchgnamelist[-2] + ", " + Dchgnamelist[-1] + ", " + str(CycNo) + "cy, "
                                 lgnd = Dchgnamelist[-1]
-                                if not check_cycler(cyclefolder):
-                                    Dchgtemp = toyo_dchg_Profile_data(FolderBase, CycNo, mincapacity, mincrate, firstCrate, smoothdegree)
-                                else:
-                                    Dchgtemp = pne_dchg_Profile_data(FolderBase, CycNo, mincapacity, mincrate, firstCrate, smoothdegree)
+                                Dchgtemp = next(profiles)
                                 if len(all_data_name) == 0:
                                     temp_lgnd = ""
                                 else:	
@@ -10412,6 +11838,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
             err_msg('Step 에러','Step에 3-5 같은 연속 형식으로 넣어주세요!')
             self.ContinueConfirm.setEnabled(True)
 
+    @background_flow
     def dcir_confirm_button(self):
         firstCrate, mincapacity, CycleNo, smoothdegree, mincrate, dqscale, dvscale = self.Profile_ini_set()
         # 용량 선정 관련
@@ -10419,7 +11846,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         root.withdraw()
         global writer
         # if "-" in self.stepnum.toPlainText():
-        write_column_num, folder_count, chnlcount, cyccount = 0, 0, 0, 0
+        write_column_num = 0
         self.DCIRConfirm.setDisabled(True)
         pne_path = self.pne_path_setting()
         all_data_folder = pne_path[0]
@@ -10429,111 +11856,125 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
             if save_file_name:
                 writer = pd.ExcelWriter(save_file_name, engine="xlsxwriter")
         self.DCIRConfirm.setEnabled(True)
-        # chg_dchg_dcir_no = list((self.stepnum.toPlainText().split(" ")))
-        chg_tab_no, dchg_tab_no = 0, 0
+        by_channel = self.CycProfile.isChecked()
+        # 채널별 DCIR 측정 구간 확인 (병렬 처리)
+        channels = []
         for i, cyclefolder in enumerate(all_data_folder):
             if os.path.isdir(cyclefolder):
                 subfolder = [f.path for f in os.scandir(cyclefolder) if f.is_dir()]
-                foldercountmax = len(all_data_folder)
-                folder_count = folder_count + 1
                 for FolderBase in subfolder:
-                    chg_dchg_dcir_no = pne_dcir_chk_cycle(FolderBase)
-                    chnlcount = chnlcount + 1
-                    chnlcountmax = len(subfolder)
-                    if chg_dchg_dcir_no is not None:
-                        for dcir_continue_step in chg_dchg_dcir_no:
-                            if "-" in dcir_continue_step:
-                                Step_CycNo, Step_CycEnd = map(int, dcir_continue_step.split("-"))
-                                CycleNo = range(Step_CycNo, Step_CycEnd + 1)
-                                if "Pattern" not in FolderBase:
-                                    fig, ((step_ax1, step_ax3), (step_ax2, step_ax4)) = plt.subplots(
-                                        nrows=2, ncols=2, figsize=(14, 8))
-                                    tab = QtWidgets.QWidget()
-                                    tab_layout = QtWidgets.QVBoxLayout(tab)
-                                    canvas = FigureCanvas(fig)
-                                    toolbar = NavigationToolbar(canvas, None)
-                                    cyccountmax = len(CycleNo)
-                                    cyccount = cyccount + 1
-                                    progressdata = progress(folder_count, foldercountmax, chnlcount, chnlcountmax, cyccount, cyccountmax)
-                                    self.progressBar.setValue(int(progressdata))
-                                    step_namelist = FolderBase.split("\\")
-                                    headername = step_namelist[-2] + ", " + step_namelist[-1]
-                                    if self.CycProfile.isChecked():
-                                        lgnd = "%04d" % Step_CycNo
-                                    else:
-                                        lgnd = step_namelist[-1]
-                                    if not check_cycler(cyclefolder):
-                                        err_msg("PNE 충방전기 사용 요청", "DCIR은 PNE 충방전기를 사용하여 측정 부탁 드립니다.")
-                                    else:
-                                        temp = pne_dcir_Profile_data(FolderBase, Step_CycNo, Step_CycEnd, mincapacity, firstCrate)
-                                        if (temp is not None) and hasattr(temp[1], "AccCap"):
-                                            if len(temp[1]) > 2:
-                                                self.capacitytext.setText(str(temp[0]))
-                                                graph_soc_continue(temp[1].SOC, temp[1].OCV, step_ax1, 2.0, 4.8, 0.2, "SOC", "OCV/CCV", "OCV", "o")
-                                                graph_soc_continue(temp[1].SOC, temp[1].rOCV, step_ax1, 2.0, 4.8, 0.2, "SOC", "OCV/CCV", "rOCV", "o")
-                                                graph_soc_continue(temp[1].SOC, temp[1].CCV, step_ax1, 2.0, 4.8, 0.2, "SOC", "OCV/CCV","CCV", "o")
-                                                graph_soc_dcir(temp[1].SOC, temp[1].iloc[:, 7], step_ax2, "SOC", "DCIR(mΩ)", " 0.1s DCIR", "o")
-                                                graph_soc_dcir(temp[1].SOC, temp[1].iloc[:, 8], step_ax2, "SOC", "DCIR(mΩ)", " 1.0s DCIR", "o")
-                                                graph_soc_dcir(temp[1].SOC, temp[1].iloc[:, 9], step_ax2, "SOC", "DCIR(mΩ)", "10.0s DCIR", "o")
-                                                graph_soc_dcir(temp[1].SOC, temp[1].iloc[:, 10], step_ax2, "SOC", "DCIR(mΩ)", "20.0s DCIR", "o")
-                                                graph_soc_dcir(temp[1].SOC, temp[1].RSS, step_ax2, "SOC", "DCIR(mΩ)", "RSS DCIR", "o")
-                                                graph_continue(temp[1].OCV, temp[1].SOC, step_ax3, -20, 120, 10, "Voltage (V)", "SOC","OCV", "o")
-                                                graph_continue(temp[1].CCV, temp[1].SOC, step_ax3, -20, 120, 10, "Voltage (V)", "SOC","CCV", "o")
-                                                graph_dcir(temp[1].OCV, temp[1].iloc[:, 7], step_ax4, "OCV", "DCIR(mΩ)", " 0.1s DCIR", "o")
-                                                graph_dcir(temp[1].OCV, temp[1].iloc[:, 8], step_ax4, "OCV", "DCIR(mΩ)", " 1.0s DCIR", "o")
-                                                graph_dcir(temp[1].OCV, temp[1].iloc[:, 9], step_ax4, "OCV", "DCIR(mΩ)", "10.0s DCIR", "o")
-                                                graph_dcir(temp[1].OCV, temp[1].iloc[:, 10], step_ax4, "OCV", "DCIR(mΩ)", "20.0s DCIR", "o")
-                                                graph_dcir(temp[1].OCV, temp[1].RSS, step_ax4, "OCV", "DCIR(mΩ)", "RSS DCIR", "o")
-                                                # Data output option
-                                                if self.saveok.isChecked() and save_file_name:
-                                                    # temp[1] = temp[1].iloc[:,[1, 2, 4, 6, 7, 8, 9, 10, 5, 3]]
-                                                    temp[1] = temp[1].iloc[:,[1, 2, 4, 7, 8, 9, 10, 5, 3]]
-                                                    temp[1].to_excel(writer, sheet_name="DCIR", startcol=write_column_num, index=False,
-                                                                        header=[headername + " Capacity(mAh)",
-                                                                                headername + " SOC",
-                                                                                headername + " OCV",
-                                                                                # headername + " OCV_est",
-                                                                                headername + "  0.1s DCIR",
-                                                                                headername + "  1.0s DCIR",
-                                                                                headername + " 10.0s DCIR",
-                                                                                headername + " 20.0s DCIR",
-                                                                                headername + " RSS",
-                                                                                headername + " CCV"])
-                                                    temp[2] = temp[2].iloc[:,[1, 2, 4, 7, 8, 9, 10, 5, 3]]
-                                                    temp[2].to_excel(writer, sheet_name="RSQ", startcol=write_column_num, index=False,
-                                                                        header=[headername + " Capacity(mAh)",
-                                                                                headername + " SOC",
-                                                                                headername + " OCV",
-                                                                                # headername + " OCV_est",
-                                                                                headername + "  0.1s DCIR RSQ",
-                                                                                headername + "  1.0s DCIR RSQ",
-                                                                                headername + " 10.0s DCIR RSQ",
-                                                                                headername + " 20.0s DCIR RSQ",
-                                                                                headername + " RSS",
-                                                                                headername + " CCV"])
-                                                    write_column_num = write_column_num + 9
-                                                if self.CycProfile.isChecked():
-                                                    title = step_namelist[-2] + "=" + step_namelist[-1]
-                                                else:
-                                                    title = step_namelist[-2] + "=" + "%04d" % Step_CycNo
-                                                plt.suptitle(title, fontsize= 15, fontweight='bold')
-                                                step_ax1.legend(loc="lower right")
-                                                step_ax2.legend(loc="upper right")
-                                                step_ax3.legend(loc="lower right")
-                                                step_ax4.legend(loc="upper right")
-                                                tab_layout.addWidget(toolbar)
-                                                tab_layout.addWidget(canvas)
-                                                if temp[1].iloc[0,2] == 100:
-                                                    self.cycle_tab.addTab(tab, "dchg" + str(dchg_tab_no))
-                                                    dchg_tab_no = dchg_tab_no + 1
-                                                else:
-                                                    self.cycle_tab.addTab(tab, "chg" + str(chg_tab_no))
-                                                    chg_tab_no = chg_tab_no + 1
-                                                self.cycle_tab.setCurrentWidget(tab)
-                                                plt.tight_layout(pad=1, w_pad=1, h_pad=1)
-                                                output_fig(self.figsaveok, title)
-                                plt.tight_layout(pad=1, w_pad=1, h_pad=1)
-                                plt.close()
+                    channels.append((cyclefolder, FolderBase))
+        self.progressBar.setValue(0)
+        dcir_cycles = yield functools.partial(profile_batch_extract,
+                                              [(pne_dcir_chk_cycle, (FolderBase,)) for cyclefolder, FolderBase in channels],
+                                              cancel=self.cancel_token)
+        # 구간별 DCIR Profile 추출 (병렬 처리) - 결과는 그래프 그리는 순서, 진행률은 완료된 job 기준
+        jobs, levels = [], []
+        folders = [cyclefolder for cyclefolder in all_data_folder if os.path.isdir(cyclefolder)]
+        for (cyclefolder, FolderBase), chg_dchg_dcir_no in zip(channels, dcir_cycles):
+            if (chg_dchg_dcir_no is not None) and ("Pattern" not in FolderBase) and check_cycler(cyclefolder):
+                subfolder = [chnl for folder, chnl in channels if folder == cyclefolder]
+                steps = [step for step in chg_dchg_dcir_no if "-" in step]
+                for cyccount, dcir_continue_step in enumerate(steps, 1):
+                    Step_CycNo, Step_CycEnd = map(int, dcir_continue_step.split("-"))
+                    jobs.append((pne_dcir_Profile_data, (FolderBase, Step_CycNo, Step_CycEnd, mincapacity, firstCrate)))
+                    levels.append((folders.index(cyclefolder) + 1, len(folders), subfolder.index(FolderBase) + 1, len(subfolder),
+                                   cyccount, len(steps)))
+        profiles = yield functools.partial(profile_batch_extract, jobs, cancel=self.cancel_token,
+                                           callback=lambda done, total: self.set_progress(progress(*levels[done - 1])))
+        profiles = iter(profiles)
+        # chg_dchg_dcir_no = list((self.stepnum.toPlainText().split(" ")))
+        chg_tab_no, dchg_tab_no = 0, 0
+        for (cyclefolder, FolderBase), chg_dchg_dcir_no in zip(channels, dcir_cycles):
+            if chg_dchg_dcir_no is not None:
+                for dcir_continue_step in chg_dchg_dcir_no:
+                    if "-" in dcir_continue_step:
+                        Step_CycNo, Step_CycEnd = map(int, dcir_continue_step.split("-"))
+                        if "Pattern" not in FolderBase:
+                            fig, ((step_ax1, step_ax3), (step_ax2, step_ax4)) = plt.subplots(
+                                nrows=2, ncols=2, figsize=(14, 8))
+                            tab = QtWidgets.QWidget()
+                            tab_layout = QtWidgets.QVBoxLayout(tab)
+                            canvas = FigureCanvas(fig)
+                            toolbar = NavigationToolbar(canvas, None)
+                            step_namelist = FolderBase.split("\\")
+                            headername = step_namelist[-2] + ", " + step_namelist[-1]
+                            if by_channel:
+                                lgnd = "%04d" % Step_CycNo
+                            else:
+                                lgnd = step_namelist[-1]
+                            if not check_cycler(cyclefolder):
+                                err_msg("PNE 충방전기 사용 요청", "DCIR은 PNE 충방전기를 사용하여 측정 부탁 드립니다.")
+                            else:
+                                temp = next(profiles)
+                                if (temp is not None) and hasattr(temp[1], "AccCap"):
+                                    if len(temp[1]) > 2:
+                                        self.capacitytext.setText(str(temp[0]))
+                                        graph_soc_continue(temp[1].SOC, temp[1].OCV, step_ax1, 2.0, 4.8, 0.2, "SOC", "OCV/CCV", "OCV", "o")
+                                        graph_soc_continue(temp[1].SOC, temp[1].rOCV, step_ax1, 2.0, 4.8, 0.2, "SOC", "OCV/CCV", "rOCV", "o")
+                                        graph_soc_continue(temp[1].SOC, temp[1].CCV, step_ax1, 2.0, 4.8, 0.2, "SOC", "OCV/CCV","CCV", "o")
+                                        graph_soc_dcir(temp[1].SOC, temp[1].iloc[:, 7], step_ax2, "SOC", "DCIR(mΩ)", " 0.1s DCIR", "o")
+                                        graph_soc_dcir(temp[1].SOC, temp[1].iloc[:, 8], step_ax2, "SOC", "DCIR(mΩ)", " 1.0s DCIR", "o")
+                                        graph_soc_dcir(temp[1].SOC, temp[1].iloc[:, 9], step_ax2, "SOC", "DCIR(mΩ)", "10.0s DCIR", "o")
+                                        graph_soc_dcir(temp[1].SOC, temp[1].iloc[:, 10], step_ax2, "SOC", "DCIR(mΩ)", "20.0s DCIR", "o")
+                                        graph_soc_dcir(temp[1].SOC, temp[1].RSS, step_ax2, "SOC", "DCIR(mΩ)", "RSS DCIR", "o")
+                                        graph_continue(temp[1].OCV, temp[1].SOC, step_ax3, -20, 120, 10, "Voltage (V)", "SOC","OCV", "o")
+                                        graph_continue(temp[1].CCV, temp[1].SOC, step_ax3, -20, 120, 10, "Voltage (V)", "SOC","CCV", "o")
+                                        graph_dcir(temp[1].OCV, temp[1].iloc[:, 7], step_ax4, "OCV", "DCIR(mΩ)", " 0.1s DCIR", "o")
+                                        graph_dcir(temp[1].OCV, temp[1].iloc[:, 8], step_ax4, "OCV", "DCIR(mΩ)", " 1.0s DCIR", "o")
+                                        graph_dcir(temp[1].OCV, temp[1].iloc[:, 9], step_ax4, "OCV", "DCIR(mΩ)", "10.0s DCIR", "o")
+                                        graph_dcir(temp[1].OCV, temp[1].iloc[:, 10], step_ax4, "OCV", "DCIR(mΩ)", "20.0s DCIR", "o")
+                                        graph_dcir(temp[1].OCV, temp[1].RSS, step_ax4, "OCV", "DCIR(mΩ)", "RSS DCIR", "o")
+                                        # Data output option
+                                        if self.saveok.isChecked() and save_file_name:
+                                            # temp[1] = temp[1].iloc[:,[1, 2, 4, 6, 7, 8, 9, 10, 5, 3]]
+                                            temp[1] = temp[1].iloc[:,[1, 2, 4, 7, 8, 9, 10, 5, 3]]
+                                            temp[1].to_excel(writer, sheet_name="DCIR", startcol=write_column_num, index=False,
+                                                                header=[headername + " Capacity(mAh)",
+                                                                        headername + " SOC",
+                                                                        headername + " OCV",
+                                                                        # headername + " OCV_est",
+                                                                        headername + "  0.1s DCIR",
+                                                                        headername + "  1.0s DCIR",
+                                                                        headername + " 10.0s DCIR",
+                                                                        headername + " 20.0s DCIR",
+                                                                        headername + " RSS",
+                                                                        headername + " CCV"])
+                                            temp[2] = temp[2].iloc[:,[1, 2, 4, 7, 8, 9, 10, 5, 3]]
+                                            temp[2].to_excel(writer, sheet_name="RSQ", startcol=write_column_num, index=False,
+                                                                header=[headername + " Capacity(mAh)",
+                                                                        headername + " SOC",
+                                                                        headername + " OCV",
+                                                                        # headername + " OCV_est",
+                                                                        headername + "  0.1s DCIR RSQ",
+                                                                        headername + "  1.0s DCIR RSQ",
+                                                                        headername + " 10.0s DCIR RSQ",
+                                                                        headername + " 20.0s DCIR RSQ",
+                                                                        headername + " RSS",
+                                                                        headername + " CCV"])
+                                            write_column_num = write_column_num + 9
+                                        if by_channel:
+                                            title = step_namelist[-2] + "=" + step_namelist[-1]
+                                        else:
+                                            title = step_namelist[-2] + "=" + "%04d" % Step_CycNo
+                                        plt.suptitle(title, fontsize= 15, fontweight='bold')
+                                        step_ax1.legend(loc="lower right")
+                                        step_ax2.legend(loc="upper right")
+                                        step_ax3.legend(loc="lower right")
+                                        step_ax4.legend(loc="upper right")
+                                        tab_layout.addWidget(toolbar)
+                                        tab_layout.addWidget(canvas)
+                                        if temp[1].iloc[0,2] == 100:
+                                            self.cycle_tab.addTab(tab, "dchg" + str(dchg_tab_no))
+                                            dchg_tab_no = dchg_tab_no + 1
+                                        else:
+                                            self.cycle_tab.addTab(tab, "chg" + str(chg_tab_no))
+                                            chg_tab_no = chg_tab_no + 1
+                                        self.cycle_tab.setCurrentWidget(tab)
+                                        plt.tight_layout(pad=1, w_pad=1, h_pad=1)
+                                        output_fig(self.figsaveok, title)
+                        plt.tight_layout(pad=1, w_pad=1, h_pad=1)
+                        plt.close()
         if self.saveok.isChecked() and save_file_name:
             writer.close()
         self.progressBar.setValue(100)
@@ -10677,18 +12118,16 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         # 경로 확인
         toyoworkpath = "z:\\Working\\"+self.toyo_blk_list[toyo_num]+"\\Chpatrn.cfg"
         if os.path.isfile(toyoworkpath):
-            toyo_data = remove_end_comma(toyoworkpath)
-            toyo_data = toyo_data[[7, 1, 5, 9]]
+            toyo_data = toyo_status_read(toyoworkpath, [7, 1, 5, 9], ["int", "int", "str", "str"], 'ANSI')
             toyo_data.columns = self.toyo_column_list[0:4]
             toyo_data.index = toyo_data.index + 1
             if toyo_num != 3:
                 toyoworkpath2 = "z:\\Working\\"+self.toyo_blk_list[toyo_num]+"\\ExperimentStatusReport.dat"
-                toyo_data2 = pd.read_csv(toyoworkpath2, sep=",", engine="c", encoding="CP949", on_bad_lines='skip')
-                toyo_data2 = toyo_data2.iloc[:, [0, 8, 5, 21, 15, 6, 7, 9, 3]]
+                toyo_data2 = toyo_status_read(toyoworkpath2, [0, 8, 5, 21, 15, 6, 7, 9, 3],
+                                              ["num"] * 9, "CP949",
+                                              header=True, strip_comma=False)
                 toyo_data2.index = toyo_data2.index + 1
                 toyo_data2.columns = ['chno', 'use', 'testname', 'folder', 'temp', 'cyc1', 'cyc2', 'cyc3', 'vol']
-            toyo_data["chno"] = toyo_data["chno"].astype(int)
-            toyo_data["use"] = toyo_data["use"].astype(int)
             toyo_data["day"] = toyo_data['testname'].apply(self.split_value0)
             toyo_data["part"] = toyo_data['testname'].apply(self.split_value1)
             toyo_data["name"] = toyo_data['testname'].apply(self.split_value2)
@@ -11281,10 +12720,10 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         #32:DC_RATIO 	33:C_PDO/A_PDO-MAX_V-MIN_V-MAX_CUR 	34:VID 	35:PID 	36:XID 	37:VOLTAGE PACK MAIN 	38:CURRENT NOW MAIN
         #39:CYCLE 	40:OCV 	41:RAW SOC 	42:CAPACITY MAX 	43:WRL_MODE 
 
-        batterydump1 = pd.read_csv(battery_dump_path + "//battery_dump1", sep=",", on_bad_lines='skip')
-        batterydump2 = pd.read_csv(battery_dump_path + "//battery_dump2", sep=",", on_bad_lines='skip')
-        batterydump1 = batterydump1.iloc[:, [0, 1, 2, 5, 6, 7, 8, 11, 14, 15, 29, 38, 39, 40, 41]]
-        batterydump2 = batterydump2.iloc[:, [0, 1, 2, 5, 6, 7, 8, 11, 14, 15, 29, 38, 39, 40, 41]]
+        batterydump1 = schema_read_csv(battery_dump_path + "//battery_dump1", CYCLER_SCHEMA["battery_dump"], sep=",",
+                                       on_bad_lines='skip')
+        batterydump2 = schema_read_csv(battery_dump_path + "//battery_dump2", CYCLER_SCHEMA["battery_dump"], sep=",",
+                                       on_bad_lines='skip')
         batterydump1.columns = ['Time_temp', 'Vol', 'Curr', 'SOC', 'T_bat', 'T_usb', 'T_chg', 'T_lrp', 'battery_status', 'direct_charger_status',
                                'sys_avg_current', 'cycle', 'ocv', 'SOCraw', 'cap_max']
         batterydump2.columns = ['Time_temp', 'Vol', 'Curr', 'SOC', 'T_bat', 'T_usb', 'T_chg', 'T_lrp', 'battery_status', 'direct_charger_status',
@@ -11781,8 +13220,12 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         # 39:CNT,  40:ectSOC,  41:RSOC,  42:SOC_RE,  43:SOC_EDV,  44:RSOH,  45:SOH,  46:AnodePotential,  47:SOH_dR,  48:SOH_CA,  49:SOH_X,
         # 50:SC_VALUE,  51:SC_SCORE,  52:SC_Grade,  53:SC_V_Acc,  54:SC_V_Avg,  55:avg_I_ISC,  56:avg_R_ISC,  57:avg_R_ISC_min,  58:LUT_VOLT0,
         # 59:LUT_VOLT1,  60:LUT_VOLT2,  61:LUT_VOLT3,  62:T_move,  63:OCV, 
-        Profile = pd.read_csv(datafilepath, sep=",", on_bad_lines='skip', skiprows = 1,  encoding="UTF-8")
-        if Profile.iloc[0,0] == "Time":
+        Profile = schema_read_csv(datafilepath, CYCLER_SCHEMA["ect_log"], sep=",", on_bad_lines='skip', skiprows = 1,
+                                  encoding="UTF-8")
+        # header가 schema column과 다르면 (header 앞에 다른 줄이 있는 log 등) schema 없이 전체 column 읽기
+        if not ECT_LOG_COLUMNS.issubset({re.sub('[^A-Za-z0-9_]+', '', str(column)) for column in Profile.columns}):
+            Profile = pd.read_csv(datafilepath, sep=",", on_bad_lines='skip', skiprows = 1, encoding="UTF-8")
+        if (len(Profile) != 0) and (Profile.iloc[0,0] == "Time"):
             Profile = pd.read_csv(datafilepath, sep=",", skiprows = 1, on_bad_lines='skip')
         Profile.columns = Profile.columns.str.replace('[^A-Za-z0-9_]+', '', regex=True)
         Profile = Profile[['Time', 'voltage_nowmV', 'CtypeEtcChargCur', 'CurrentAvg', 'TemperatureBA', 'Level', 'ectSOC',
@@ -11797,16 +13240,8 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         cycmax = int(Profile.Cyc.max())
         if self.realcyc.isChecked() == 0 and state == "profile":
             if cycmin != cycmax:
-                # 'Unplugged' 또는 ' NONE'에서 'AC' 또는 ' PDIC_APDO'로 전환되는 지점을 찾습니다.
-                plug_change = (
-                    (Profile['Type'].shift(1).isin([" Discharging"])) &
-                    (Profile['Type'].isin([" Charging", " Full"]))
-                )
-                # 'Battery_Cycle'의 초기값을 설정합니다.
-                Profile['Cyc'] = cycmin
-                # 전환 지점에서 1씩 증가하는 값을 누적합으로 계산하여 적용합니다.
-                # cumsum() 함수는 True(1)인 값의 누적합을 효율적으로 계산합니다.
-                Profile['Cyc'] += plug_change.cumsum()
+                # ' Discharging'에서 ' Charging' 또는 ' Full'로 전환되는 지점마다 cycle 증가
+                Profile['Cyc'] = plug_cycle_count(Profile['Type'], cycmin, [" Discharging"], [" Charging", " Full"])
         cycmax = int(Profile.Cyc.max())
         if not Profile.empty:
             # 시간 확인
@@ -12580,6 +14015,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         plt.tight_layout(pad=1, w_pad=1, h_pad=1)
         plt.close()
 
+    @background_flow
     def dvdq_fitting_button(self):
         global writer
         ca_mat_filepath = str(self.ca_mat_dvdq_path.text())
@@ -12634,52 +14070,31 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
             an_slip_ini = float(self.an_slip_ini.text())
         # 열화 상태 고려 및 LL 산포에 따른 보정치 추가
         self.fittingdegree = self.fittingdegree * 1.2
-        if self.ca_mass_ini_fix.isChecked():
-            ca_mass_min = ca_mass_ini
-            ca_mass_max = ca_mass_ini
-        else:
-            ca_mass_min = ca_mass_ini * (1 - 0.1 / self.fittingdegree)
-            ca_mass_max = ca_mass_ini * (1 + 0.1 / self.fittingdegree)
-        if self.ca_slip_ini_fix.isChecked():
-            ca_slip_min = ca_slip_ini
-            ca_slip_max = ca_slip_ini
-        else:
-            ca_slip_min = ca_slip_ini - (full_cell_max_cap * (0.05 / self.fittingdegree))
-            ca_slip_max = ca_slip_ini + (full_cell_max_cap * (0.05 / self.fittingdegree))
-        if self.an_mass_ini_fix.isChecked():
-            an_mass_min = an_mass_ini
-            an_mass_max = an_mass_ini
-        else:
-            an_mass_min = an_mass_ini * (1 - 0.1 / self.fittingdegree)
-            an_mass_max = an_mass_ini * (1 + 0.1 / self.fittingdegree)
-        if self.an_slip_ini_fix.isChecked():
-            an_slip_min = an_slip_ini
-            an_slip_max = an_slip_ini
-        else:
-            an_slip_min = an_slip_ini - (full_cell_max_cap * (0.05 / self.fittingdegree))
-            an_slip_max = an_slip_ini + (full_cell_max_cap * (0.05 / self.fittingdegree))
-        # 목적함수 초기화 실행
+        ini_params = (ca_mass_ini, ca_slip_ini, an_mass_ini, an_slip_ini)
+        fixed = (self.ca_mass_ini_fix.isChecked(), self.ca_slip_ini_fix.isChecked(), self.an_mass_ini_fix.isChecked(),
+                 self.an_slip_ini_fix.isChecked())
+        # 목적함수 초기화 실행 - 재시작별 후보군을 process로 분산 평가, 개선될 때만 화면 갱신
         min_params = None
-        for i in range(int(self.dvdq_test_no.text())):
-            ca_mass, ca_slip, an_mass, an_slip = generate_params(ca_mass_min, ca_mass_max, ca_slip_min, ca_slip_max, an_mass_min, an_mass_max,
-                                                                 an_slip_min, an_slip_max)
-            simul_full = generate_simulation_full(ca_ccv_raw, an_ccv_raw, real_raw, ca_mass, ca_slip, an_mass, an_slip, full_cell_max_cap,
-                                                  dvdq_min_cap, full_period)
-            # 지정 영역에서만 rms 산정
-            simul_full = simul_full.loc[(simul_full["full_cap"] > int(
-                self.dvdq_start_soc.text())) & (simul_full["full_cap"] < int(self.dvdq_end_soc.text()))]
-            simul_diff = np.subtract(simul_full.full_dvdq, simul_full.real_dvdq)
-            simul_diff[np.isnan(simul_diff)] = 0
-            simul_rms = np.sqrt(np.mean(simul_diff ** 2))
-            if simul_rms < self.min_rms:
-                self.min_rms = simul_rms
-                min_params = (ca_mass, ca_slip, an_mass, an_slip)
-                self.dvdq_rms.setText(str(self.min_rms * 100))
-                self.ca_mass_ini.setText(str(min_params[0]))
-                self.ca_slip_ini.setText(str(min_params[1]))
-                self.an_mass_ini.setText(str(min_params[2]))
-                self.an_slip_ini.setText(str(min_params[3]))
-            self.progressBar.setValue(int(int(i)/int(self.dvdq_test_no.text())*100))
+        reference = dvdq_fit_reference(ca_ccv_raw, an_ccv_raw, real_raw, full_cell_max_cap, dvdq_min_cap, full_period,
+                                       int(self.dvdq_start_soc.text()), int(self.dvdq_end_soc.text()))
+        shown_rms = self.min_rms
+        def dvdq_fit_progress(done, restarts, params, simul_rms):
+            nonlocal shown_rms
+            if params is not None and simul_rms < shown_rms:
+                shown_rms = simul_rms
+                self.run_in_gui(self.dvdq_rms.setText, str(shown_rms * 100))
+            self.set_progress(done/restarts*100)
+        fit_params, fit_rms = yield functools.partial(dvdq_restart_population_fit, reference, ini_params, fixed, full_cell_max_cap,
+                                                      self.fittingdegree, int(self.dvdq_test_no.text()),
+                                                      callback=dvdq_fit_progress, cancel=self.cancel_token)
+        if fit_params is not None and fit_rms < self.min_rms:
+            self.min_rms = fit_rms
+            min_params = fit_params
+            self.dvdq_rms.setText(str(self.min_rms * 100))
+            self.ca_mass_ini.setText(str(min_params[0]))
+            self.ca_slip_ini.setText(str(min_params[1]))
+            self.an_mass_ini.setText(str(min_params[2]))
+            self.an_slip_ini.setText(str(min_params[3]))
         if min_params is not None:
             simul_full = generate_simulation_full(ca_ccv_raw, an_ccv_raw, real_raw, min_params[0], min_params[1],
                                                     min_params[2], min_params[3], full_cell_max_cap, dvdq_min_cap, full_period)
@@ -12759,6 +14174,85 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                     simul_full.to_excel(writer, sheet_name="dvdq", index=False)
                     writer.close()
     
+    def dvdq_batch_graph(self, batch_result, tab_name):
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(nrows=2, ncols=2, figsize=(8, 8))
+        tab = QtWidgets.QWidget()
+        tab_layout = QtWidgets.QVBoxLayout(tab)
+        canvas = FigureCanvas(fig)
+        toolbar = NavigationToolbar(canvas, None)
+        # 양/음극 mass (LAM), slip (LLI), 용량, rms 사이클 추이
+        ax1.plot(batch_result.Cyc, batch_result.ca_mass, "o-", color = "r")
+        ax1.plot(batch_result.Cyc, batch_result.an_mass, "o-", color = "b")
+        ax1.legend(["양극 mass", "음극 mass"])
+        ax2.plot(batch_result.Cyc, batch_result.ca_slip, "o-", color = "r")
+        ax2.plot(batch_result.Cyc, batch_result.an_slip, "o-", color = "b")
+        ax2.legend(["양극 Slip", "음극 Slip"])
+        ax3.plot(batch_result.Cyc, batch_result.ca_cap, "o-", color = "r")
+        ax3.plot(batch_result.Cyc, batch_result.an_cap, "o-", color = "b")
+        ax3.plot(batch_result.Cyc, batch_result.full_cap, "o-", color = "k")
+        ax3.legend(["양극 총용량", "음극 총용량", "셀 총용량"])
+        ax4.plot(batch_result.Cyc, batch_result.rms, "o-", color = "g")
+        ax4.legend(["RMS (%)"])
+        for graph_ax, ylabel in zip((ax1, ax2, ax3, ax4), ("mass", "Slip", "Capacity", "RMS (%)")):
+            graph_base_parameter(graph_ax, "Cycle", ylabel)
+        fig.suptitle(tab_name, fontsize= 12)
+        tab_layout.addWidget(toolbar)
+        tab_layout.addWidget(canvas)
+        self.dvdq_simul_tab.addTab(tab, tab_name)
+        self.dvdq_simul_tab.setCurrentWidget(tab)
+        plt.tight_layout(pad=1, w_pad=1, h_pad=1)
+        plt.close()
+
+    @background_flow
+    def dvdq_batch_button(self):
+        """채널 1개의 여러 사이클 방전 Profile에 동일한 양/음극 소재 Profile을 fitting해 열화 mode 추이 산정"""
+        global writer
+        ca_mat_filepath = str(self.ca_mat_dvdq_path.text())
+        an_mat_filepath = str(self.an_mat_dvdq_path.text())
+        if not (os.path.isfile(ca_mat_filepath) and os.path.isfile(an_mat_filepath)):
+            self.dvdq_material_button()
+            ca_mat_filepath = str(self.ca_mat_dvdq_path.text())
+            an_mat_filepath = str(self.an_mat_dvdq_path.text())
+        ca_ccv_raw = pd.read_csv(ca_mat_filepath, sep="\t")
+        an_ccv_raw = pd.read_csv(an_mat_filepath, sep="\t")
+        ca_ccv_raw.columns = ["ca_cap", "ca_volt"]
+        an_ccv_raw.columns = ["an_cap", "an_volt"]
+        root = Tk()
+        root.withdraw()
+        raw_file_path = filedialog.askdirectory(initialdir="d://", title="사이클별 dVdQ 분석 채널 폴더 선택")
+        if not raw_file_path:
+            return
+        raw_file_path = os.path.normpath(raw_file_path)
+        # 사이클 범위 (시작 끝 간격)
+        cycle_range = list(map(int, self.dvdq_batch_cycle.text().split()))
+        cycles = range(cycle_range[0], cycle_range[1] + 1, cycle_range[2] if len(cycle_range) > 2 else 1)
+        firstCrate, mincapacity = self.cyc_ini_set()[:2]
+        self.progressBar.setValue(0)
+        profiles = yield functools.partial(dvdq_batch_profiles, raw_file_path, cycles, mincapacity, firstCrate,
+                                           cancel=self.cancel_token)
+        if not profiles:
+            self.progressBar.setValue(100)
+            return
+        # 각 parameter 초기값 (빈 칸은 첫 사이클 용량 기준 기본값)
+        ini_params = tuple(float(ini.text()) if ini.text() != "" else None
+                           for ini in (self.ca_mass_ini, self.ca_slip_ini, self.an_mass_ini, self.an_slip_ini))
+        fixed = (self.ca_mass_ini_fix.isChecked(), self.ca_slip_ini_fix.isChecked(), self.an_mass_ini_fix.isChecked(),
+                 self.an_slip_ini_fix.isChecked())
+        batch_result = yield functools.partial(dvdq_cycle_batch_fit, ca_ccv_raw, an_ccv_raw, profiles,
+                                               int(self.dvdq_full_smoothing_no.text()), int(self.dvdq_start_soc.text()),
+                                               int(self.dvdq_end_soc.text()), ini_params, fixed, int(self.dvdq_test_no.text()),
+                                               callback=lambda done, total: self.set_progress(done/total*100),
+                                               cancel=self.cancel_token)
+        if not batch_result.empty:
+            self.dvdq_batch_graph(batch_result, raw_file_path.split(os.sep)[-1])
+            if self.saveok.isChecked():
+                save_file_name = filedialog.asksaveasfilename(initialdir="D://", title="Save File Name", defaultextension=".xlsx")
+                if save_file_name != '':
+                    writer = pd.ExcelWriter(save_file_name, engine="xlsxwriter")
+                    batch_result.to_excel(writer, sheet_name="dvdq_cycle", index=False)
+                    writer.close()
+        self.progressBar.setValue(100)
+
     def load_cycparameter_button(self):
         cyc_filepaths = filedialog.askopenfilenames(initialdir="d://cycparameter//",
                                                     title="불러올 02C, 05C 사이클 parameter 데이터를 순차적으로 선택")
@@ -13107,6 +14601,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
             # 객체가 존재할 경우 값 설정
             if hasattr(self, widget_name):
                 getattr(self, widget_name).setText(f"{value:.5f}")  # 소수점 5자리까지 표시
+        self.eu_fit = None
 
     def eu_load_cycparameter_button(self):
         # 파일 선택 대화상자 열기
@@ -13125,6 +14620,8 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 # "02C" 컬럼 데이터 추출
                 col_data = parameter_df["02C"]
                 
+                # 불러온 parameter는 공분산 없음
+                self.eu_fit = None
                 # 각 매개변수를 텍스트박스에 설정 (과학적 표기법 방지)
                 self.aTextEdit_eu.setText(f"{col_data.iloc[0]:.15f}")
                 self.bTextEdit_eu.setText(f"{col_data.iloc[1]:.15f}")
@@ -13159,7 +14656,13 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         with open(save_file_name, 'w') as f:
             f.write('\n')
             df.to_csv(f, sep='\t', index=False, header=True)
-        err_msg("저장", "저장되었습니다.") 
+        # Monte-Carlo simulation 용 공분산 (parameter file 옆에 _covariance로 저장, simulation에서 선택 시 parameter 폴더로 복사)
+        if self.eu_fit is not None:
+            cov_file_name = "d:/para_" + namelist[0] + "_covariance.txt"
+            simul_mc_write_covariance(cov_file_name, self.eu_fit[1])
+            err_msg("저장", "저장되었습니다.\n공분산: " + cov_file_name)
+        else:
+            err_msg("저장", "저장되었습니다.\n(fitting 결과가 없어 공분산은 저장하지 않음)")
         output_para_fig(self.figsaveok, "fig_" + namelist[0])
 
     def eu_fitting_confirm_button(self):
@@ -13316,6 +14819,7 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 self.eTextEdit_eu.setText(str(round(popt[5], 50)))
                 self.fTextEdit_eu.setText(str(round(popt[6], 50)))
                 self.fdTextEdit_eu.setText(str(round(popt[7], 50)))
+                self.eu_fit = [popt, pcov]
                 if self.fix_swelling_eu.isChecked():
                     dfall_23 = dfall[dfall["t"] == 296]
                     dfall_35 = dfall[dfall["t"] == 308]
@@ -13351,6 +14855,8 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 result_para = pd.DataFrame({"para": popt})
                 if self.saveok.isChecked() and save_file_name:
                     result_para.to_excel(writer, sheet_name="parameter", index=False)
+                    # Monte-Carlo simulation 용 parameter 공분산
+                    pd.DataFrame(pcov).to_excel(writer, sheet_name="covariance", index=False)
                     result.to_excel(writer, sheet_name=str(namelist[-2][:30]), index=False)
                 tab_layout.addWidget(toolbar)
                 tab_layout.addWidget(canvas)
@@ -13766,6 +15272,34 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         self.tab_delete(self.real_cycle_simul_tab)
         self.tab_no = 0
     
+    def simul_mc_covariance(self, dirname, sizes):
+        """
+        Monte-Carlo parameter 공분산 (SIMUL_MC_COVARIANCE, parameter 폴더 기준)
+        폴더에 없으면 EU fitting에서 저장한 para_*_covariance.txt를 직접 선택 → 다음 실행용으로 parameter 폴더에 복사
+        끝까지 없는 항목은 parameter 고정 (산포 없음) 경고
+        """
+        cov_set = {}
+        missing = []
+        for cov_key, cov_file, cov_title in SIMUL_MC_COVARIANCE:
+            cov_path = dirname + "//" + cov_file
+            cov = simul_mc_read_covariance(cov_path, sizes[cov_key]) if os.path.isfile(cov_path) else None
+            if cov is None:
+                cov_pick = filedialog.askopenfilename(initialdir="d://", title=cov_title + " parameter 공분산 선택 (취소 시 고정)")
+                if cov_pick:
+                    cov = simul_mc_read_covariance(cov_pick, sizes[cov_key])
+                    if cov is not None:
+                        try:
+                            simul_mc_write_covariance(cov_path, cov)
+                        except OSError:
+                            pass
+            if cov is None:
+                missing.append(cov_title)
+            cov_set[cov_key] = cov
+        if missing:
+            err_msg("Monte-Carlo 공분산 없음", ", ".join(missing) + " parameter는 산포 없이 고정해서 계산합니다.")
+        return cov_set
+
+    @background_flow
     def simulation_confirm_button(self):
         def BaseEquation(a_par, b_par, fd, b1_par, c_par, d_par, e_par, f_par, temp_par, so_par, x):
             return np.exp(a_par * temp_par + b_par) * (x * fd) ** b1_par + np.exp( c_par * temp_par + d_par) * (x * fd) ** (
@@ -13784,6 +15318,13 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
             return (1 - BaseEquation(a_par2, b_par2, storage1_cap_simul_fd, b1_par2, c_par2, d_par2, e_par2, f_par2, storage_temp1, (-1) * soh, x))
         def stgirparameter2(x):
             return BaseEquation(a_par4, b_par4, storage1_dcir_simul_fd, b1_par4, c_par4, d_par4, e_par4, f_par4, storage_temp1, soir, x)
+        # 역함수 조회표 (parameter, fd, 온도 조합별로 한 번만 생성)
+        inverse_tables = {}
+        def inverse_table(par, fd, temp):
+            key = (par, float(fd), temp)
+            if key not in inverse_tables:
+                inverse_tables[key] = simul_inverse_table(par, fd, temp)
+            return inverse_tables[key]
         # parameter 계산 및 fd 산정
         root = Tk()
         root.withdraw()
@@ -13864,6 +15405,12 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
         d_par4 = float(self.dTextEdit_4.text())
         e_par4 = float(self.eTextEdit_4.text())
         f_par4 = float(self.fTextEdit_4.text())
+        par1 = (a_par1, b_par1, b1_par1, c_par1, d_par1, e_par1, f_par1)
+        par2 = (a_par2, b_par2, b1_par2, c_par2, d_par2, e_par2, f_par2)
+        par3 = (a_par3, b_par3, b1_par3, c_par3, d_par3, e_par3, f_par3)
+        par4 = (a_par4, b_par4, b1_par4, c_par4, d_par4, e_par4, f_par4)
+        result_columns = ["cycle", "time", "storagecycle", "degree_cycle_cap", "degree_storage1_cap", "degree_storage2_cap",
+                          "degree_cycle_dcir", "degree_storage1_dcir", "degree_storage2_dcir", "SOH", "rSOH", "SOIR"]
         # 입력 condition
         all_input_data_path = filedialog.askopenfilenames(initialdir = dirname, title="Choose Test files")
         # while self.real_cycle_simul_tab.count() > 0:
@@ -13924,20 +15471,11 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
             storagecycle = 0
             stgcountratio = float(self.txt_storageratio.text())
             stgcountratio2 = float(self.txt_storageratio2.text())
-            result = pd.DataFrame(
-                {"cycle": 0,
-                "time": 0,
-                "storagecycle": 0,
-                "degree_cycle_cap": 0,
-                "degree_storage1_cap": 0,
-                "degree_storage2_cap": 0,
-                "degree_cycle_dcir": 0,
-                "degree_storage1_dcir": 0,
-                "degree_storage2_dcir": 0,
-                "SOH": 1,
-                "rSOH": 1,
-                "SOIR": 0},
-                index=[0])
+            # 결과 배열 미리 할당 (사이클/저장1/저장2 3 step x 최대 100000회)
+            result_data = np.zeros((3 * 100000 + 1, len(result_columns)))
+            result_data[0, result_columns.index("SOH")] = 1
+            result_data[0, result_columns.index("rSOH")] = 1
+            result_count = 1
             for i in range(0, 100000):
                 if self.nolonglife.isChecked():
                     # 장수명 미적용
@@ -13998,10 +15536,8 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 # 충전, 방전 기준으로 시간 산정
                 time = usedcap/cycle_crate/24 + usedcap/cycle_dcrate/24 + time
                 # 수명-역으로 값을 찾는 수식
-                inverse_cycle_cap_soh = root_scalar(cyccapparameter, bracket=[0, 500000], method='brentq')
-                inverse_cycle_dcir_soh = root_scalar(cycirparameter, bracket=[0, 500000], method='brentq')
-                solve_inverse_cycle_cap_soh = inverse_cycle_cap_soh.root
-                solve_inverse_cycle_dcir_soh = inverse_cycle_dcir_soh.root
+                solve_inverse_cycle_cap_soh = simul_inverse(inverse_table(par1, cycle_cap_simul_fd, cycle_temp), 1 - soh, cyccapparameter)
+                solve_inverse_cycle_dcir_soh = simul_inverse(inverse_table(par3, cycle_dcir_simul_fd, cycle_temp), soir, cycirparameter)
                 if np.isnan(solve_inverse_cycle_cap_soh):
                     solve_inverse_cycle_cap_soh = 0
                     solve_inverse_cycle_dcir_soh = 0
@@ -14011,26 +15547,14 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 soh = soh - degree_cycle_cap
                 rsoh = soh * para_rsoh
                 soir = soir + degree_cycle_dcir
-                cycle_result = pd.DataFrame(
-                    {"cycle": cycle,
-                    "time": time,
-                    "storagecycle": storagecycle,
-                    "degree_cycle_cap": degree_cycle_cap,
-                    "degree_storage1_cap": degree_storage1_cap,
-                    "degree_storage2_cap": degree_storage2_cap,
-                    "degree_cycle_dcir": degree_cycle_dcir,
-                    "degree_storage1_dcir": degree_storage1_dcir,
-                    "degree_storage2_dcir": degree_storage2_dcir,
-                    "SOH": soh,
-                    "rSOH": rsoh,
-                    "SOIR": soir},
-                    index=[3 * i + 1])
-                result = pd.concat([result, cycle_result])
+                result_data[result_count] = (cycle, time, storagecycle, degree_cycle_cap, degree_storage1_cap, degree_storage2_cap,
+                                             degree_cycle_dcir, degree_storage1_dcir, degree_storage2_dcir, soh, rsoh, soir)
+                result_count = result_count + 1
                 # 저장 1차-역으로 값을 찾는 수식
-                inverse_storage1_cap_soh = root_scalar(stgcapparameter2, bracket=[0, 500000], method='brentq')
-                inverse_storage1_dcir_soh = root_scalar(stgirparameter2, bracket=[0, 500000], method='brentq')
-                solve_inverse_storage1_cap_soh = inverse_storage1_cap_soh.root
-                solve_inverse_storage1_dcir_soh = inverse_storage1_dcir_soh.root
+                solve_inverse_storage1_cap_soh = simul_inverse(inverse_table(par2, storage1_cap_simul_fd, storage_temp1), 1 - soh,
+                                                               stgcapparameter2)
+                solve_inverse_storage1_dcir_soh = simul_inverse(inverse_table(par4, storage1_dcir_simul_fd, storage_temp1), soir,
+                                                                stgirparameter2)
                 if np.isnan(solve_inverse_storage1_cap_soh):
                     solve_inverse_storage1_cap_soh = 0
                     solve_inverse_storage1_dcir_soh = 0
@@ -14047,26 +15571,14 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 soh = soh - degree_storage1_cap
                 rsoh = soh * para_rsoh
                 soir = soir + degree_storage1_dcir
-                storage1_result = pd.DataFrame(
-                    {"cycle": cycle,
-                    "time": time,
-                    "storagecycle": storagecycle,
-                    "degree_cycle_cap": degree_cycle_cap,
-                    "degree_storage1_cap": degree_storage1_cap,
-                    "degree_storage2_cap": degree_storage2_cap,
-                    "degree_cycle_dcir": degree_cycle_dcir,
-                    "degree_storage1_dcir": degree_storage1_dcir,
-                    "degree_storage2_dcir": degree_storage2_dcir,
-                    "SOH": soh,
-                    "rSOH": rsoh,
-                    "SOIR": soir},
-                    index=[3 * i + 2])
-                result = pd.concat([result, storage1_result])
+                result_data[result_count] = (cycle, time, storagecycle, degree_cycle_cap, degree_storage1_cap, degree_storage2_cap,
+                                             degree_cycle_dcir, degree_storage1_dcir, degree_storage2_dcir, soh, rsoh, soir)
+                result_count = result_count + 1
                 # 저장 2차-역으로 값을 찾는 수식
-                inverse_storage2_cap_soh = root_scalar(stgcapparameter, bracket=[0, 500000], method='brentq')
-                inverse_storage2_dcir_soh = root_scalar(stgirparameter, bracket=[0, 500000], method='brentq')
-                solve_inverse_storage2_cap_soh = inverse_storage2_cap_soh.root
-                solve_inverse_storage2_dcir_soh = inverse_storage2_dcir_soh.root
+                solve_inverse_storage2_cap_soh = simul_inverse(inverse_table(par2, storage2_cap_simul_fd, storage_temp2), 1 - soh,
+                                                               stgcapparameter)
+                solve_inverse_storage2_dcir_soh = simul_inverse(inverse_table(par4, storage2_dcir_simul_fd, storage_temp2), soir,
+                                                                stgirparameter)
                 if np.isnan(solve_inverse_storage2_cap_soh):
                     solve_inverse_storage2_cap_soh = 0
                     solve_inverse_storage2_dcir_soh = 0
@@ -14083,25 +15595,13 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 soh = soh - degree_storage2_cap
                 rsoh = soh * para_rsoh
                 soir = soir + degree_storage2_dcir
-                storage2_result = pd.DataFrame(
-                    {"cycle": cycle,
-                    "time": time,
-                    "storagecycle": storagecycle,
-                    "degree_cycle_cap": degree_cycle_cap,
-                    "degree_storage1_cap": degree_storage1_cap,
-                    "degree_storage2_cap": degree_storage2_cap,
-                    "degree_cycle_dcir": degree_cycle_dcir,
-                    "degree_storage1_dcir": degree_storage1_dcir,
-                    "degree_storage2_dcir": degree_storage2_dcir,
-                    "SOH": soh,
-                    "rSOH": rsoh,
-                    "SOIR": soir},
-                    index=[3 * i + 3])
-                result = pd.concat([result, storage2_result])
+                result_data[result_count] = (cycle, time, storagecycle, degree_cycle_cap, degree_storage1_cap, degree_storage2_cap,
+                                             degree_cycle_dcir, degree_storage1_dcir, degree_storage2_dcir, soh, rsoh, soir)
+                result_count = result_count + 1
                 if soh < 0.75 or np.isnan(soh) or cycle > self.xscale:
                     break
                 self.progressBar.setValue(int((1 - soh)/0.5 * 100))
-            
+            result = pd.DataFrame(result_data[:result_count], columns=result_columns)
             # tab 그래프 추가
             result.cycdeg_sum = 1 - result.degree_cycle_cap.cumsum()/3
             result.cycir_sum = result.degree_cycle_dcir.cumsum()/3
@@ -14142,6 +15642,38 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
                 graph_simulation(axe5, result.time, result.cycir_sum, 'r-', 'DCIR_cyc', self.xscale, 0, 0.08, 'day', 'Swelling')
                 graph_simulation(axe5, result.time, result.stgir_sum1, 'g-', 'DCIR_stg1', self.xscale, 0, 0.08, 'day', 'Swelling')
                 graph_simulation(axe5, result.time, result.stgir_sum2, 'm-', 'DCIR_stg2', self.xscale, 0, 0.08, 'day', 'Swelling')
+            # Monte-Carlo - 사용 조건/parameter 산포를 준 가상 사용자 전체를 배열로 동시 계산 후 percentile band 표시
+            if self.chk_montecarlo.isChecked():
+                mc_users = int(self.txt_mc_users.text())
+                rng = np.random.default_rng(SIMUL_MC_SEED)
+                mc_base = {"cycle_crate": cycle_crate, "cycle_dcrate": cycle_dcrate, "cycle_dod": cycle_dod, "usedcap": usedcap,
+                           "storage_rest1": storage_rest1, "storage_rest2": storage_rest2, "cycle_soc": cycle_soc,
+                           "storage_soc1": storage_soc1, "storage_soc2": storage_soc2, "cycle_temp": cycle_temp,
+                           "storage_temp1": storage_temp1, "storage_temp2": storage_temp2}
+                mc_conditions = simul_mc_conditions(mc_base, float(self.txt_mc_spread.text()), float(self.txt_mc_soc.text()),
+                                                    float(self.txt_mc_temp.text()), mc_users, rng)
+                mc_par_set = {"cycle_cap": par1, "storage_cap": par2, "cycle_dcir": par3, "storage_dcir": par4}
+                cov_set = self.simul_mc_covariance(dirname, {key: len(par) for key, par in mc_par_set.items()})
+                mc_pars = {key: simul_mc_parameters(par, cov_set[key], mc_users, rng) for key, par in mc_par_set.items()}
+                mc_cyc_cap = (df_cyc.Crate[0], df_cyc.Crate[1], df_cyc.SOC[0], df_cyc.SOC[1], df_cyc.DOD[0], df_cyc.DOD[1], df_cyc.fd[0])
+                mc_cyc_dcir = (df_cyc2.Crate[0], df_cyc2.Crate[1], df_cyc2.SOC[0], df_cyc2.SOC[1], df_cyc2.DOD[0], df_cyc2.DOD[1],
+                               df_cyc2.fd[0])
+                mc = yield functools.partial(simul_monte_carlo, mc_pars, mc_conditions, mc_cyc_cap, mc_cyc_dcir,
+                                             (df_stg.iloc[0, 0], df_stg.iloc[1, 0]), (df_stg2.iloc[0, 0], df_stg2.iloc[1, 0]),
+                                             long_cycle, long_cycle_vol, real_cap, self.hhp_longlife.isChecked(), self.xscale,
+                                             stgcountratio, stgcountratio2, cancel=self.cancel_token)
+                mc_bands = simul_mc_bands(mc)
+                mc_low = "_p" + str(SIMUL_MC_PERCENTILES[0])
+                mc_mid = "_p" + str(SIMUL_MC_PERCENTILES[1])
+                mc_high = "_p" + str(SIMUL_MC_PERCENTILES[-1])
+                axe4.fill_between(mc_bands.time, mc_bands["SOH" + mc_low], mc_bands["SOH" + mc_high], color='b', alpha=0.15,
+                                  label='Cell' + mc_low + mc_high)
+                axe4.plot(mc_bands.time, mc_bands["SOH" + mc_mid], 'b--', label='Cell' + mc_mid)
+                axe4.legend()
+                axe5.fill_between(mc_bands.time, mc_bands["SOIR" + mc_low], mc_bands["SOIR" + mc_high], color='b', alpha=0.15,
+                                  label='Swelling' + mc_low + mc_high)
+                axe5.plot(mc_bands.time, mc_bands["SOIR" + mc_mid], 'b--', label='Swelling' + mc_mid)
+                axe5.legend()
             plt.tight_layout(pad=1, w_pad=1, h_pad=1)
             if input_data_path != "":
                 filename = input_data_path.split(".t")[-2].split("/")[-1].split("\\")[-1]
@@ -14154,6 +15686,8 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
             plt.tight_layout(pad=1, w_pad=1, h_pad=1)
             if self.saveok.isChecked():
                 result.to_excel("simul" + filename, index=False)
+                if self.chk_montecarlo.isChecked():
+                    mc_bands.to_excel("simul_mc" + filename, index=False)
                 output_fig(self.figsaveok, "fig" + filename)
         plt.tight_layout(pad=1, w_pad=1, h_pad=1)
         self.progressBar.setValue(100)
@@ -14467,6 +16001,8 @@ class WindowClass(QtWidgets.QMainWindow, Ui_sitool):
 
 # UI 실행
 if __name__ == "__main__":
+    # 실행 파일(exe)에서 dVdQ fitting process pool 사용
+    multiprocessing.freeze_support()
     # HiDPI 스케일링을 명시적으로 비활성화합니다.
     # os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '0'
     # os.environ['QT_SCALE_FACTOR'] = '1.0'
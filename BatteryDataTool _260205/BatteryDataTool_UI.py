@@ -2689,6 +2689,42 @@ class Ui_sitool(object):
         self.dvdq_rms.setObjectName("dvdq_rms")
         self.horizontalLayout_151.addWidget(self.dvdq_rms)
         self.verticalLayout_22.addLayout(self.horizontalLayout_151)
+        self.horizontalLayout_191 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_191.setObjectName("horizontalLayout_191")
+        self.cycxlabel_63 = QtWidgets.QLabel(parent=self.dvdq)
+        self.cycxlabel_63.setMinimumSize(QtCore.QSize(150, 34))
+        self.cycxlabel_63.setMaximumSize(QtCore.QSize(150, 34))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.cycxlabel_63.setFont(font)
+        self.cycxlabel_63.setObjectName("cycxlabel_63")
+        self.horizontalLayout_191.addWidget(self.cycxlabel_63)
+        self.dvdq_batch_cycle = QtWidgets.QLineEdit(parent=self.dvdq)
+        self.dvdq_batch_cycle.setMinimumSize(QtCore.QSize(180, 34))
+        self.dvdq_batch_cycle.setMaximumSize(QtCore.QSize(180, 34))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        font.setBold(False)
+        font.setWeight(50)
+        self.dvdq_batch_cycle.setFont(font)
+        self.dvdq_batch_cycle.setObjectName("dvdq_batch_cycle")
+        self.horizontalLayout_191.addWidget(self.dvdq_batch_cycle)
+        self.dvdq_batch = QtWidgets.QPushButton(parent=self.dvdq)
+        self.dvdq_batch.setMinimumSize(QtCore.QSize(310, 34))
+        self.dvdq_batch.setMaximumSize(QtCore.QSize(310, 34))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        font.setBold(True)
+        font.setWeight(75)
+        self.dvdq_batch.setFont(font)
+        self.dvdq_batch.setObjectName("dvdq_batch")
+        self.horizontalLayout_191.addWidget(self.dvdq_batch)
+        self.verticalLayout_22.addLayout(self.horizontalLayout_191)
         self.line_15 = QtWidgets.QFrame(parent=self.dvdq)
         self.line_15.setMinimumSize(QtCore.QSize(656, 3))
         self.line_15.setMaximumSize(QtCore.QSize(656, 3))
@@ -4192,6 +4228,87 @@ class Ui_sitool(object):
         self.txt_storageratio2.setObjectName("txt_storageratio2")
         self.horizontalLayout_62.addWidget(self.txt_storageratio2)
         self.verticalLayout_37.addLayout(self.horizontalLayout_62)
+        self.horizontalLayout_192 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_192.setObjectName("horizontalLayout_192")
+        self.chk_montecarlo = QtWidgets.QCheckBox(parent=self.FitTab)
+        self.chk_montecarlo.setMinimumSize(QtCore.QSize(100, 20))
+        self.chk_montecarlo.setMaximumSize(QtCore.QSize(100, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.chk_montecarlo.setFont(font)
+        self.chk_montecarlo.setObjectName("chk_montecarlo")
+        self.horizontalLayout_192.addWidget(self.chk_montecarlo)
+        self.label_17 = QtWidgets.QLabel(parent=self.FitTab)
+        self.label_17.setMinimumSize(QtCore.QSize(60, 20))
+        self.label_17.setMaximumSize(QtCore.QSize(60, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.label_17.setFont(font)
+        self.label_17.setObjectName("label_17")
+        self.horizontalLayout_192.addWidget(self.label_17)
+        self.txt_mc_users = QtWidgets.QLineEdit(parent=self.FitTab)
+        self.txt_mc_users.setMinimumSize(QtCore.QSize(45, 20))
+        self.txt_mc_users.setMaximumSize(QtCore.QSize(45, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.txt_mc_users.setFont(font)
+        self.txt_mc_users.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.txt_mc_users.setObjectName("txt_mc_users")
+        self.horizontalLayout_192.addWidget(self.txt_mc_users)
+        self.label_18 = QtWidgets.QLabel(parent=self.FitTab)
+        self.label_18.setMinimumSize(QtCore.QSize(55, 20))
+        self.label_18.setMaximumSize(QtCore.QSize(55, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.label_18.setFont(font)
+        self.label_18.setObjectName("label_18")
+        self.horizontalLayout_192.addWidget(self.label_18)
+        self.txt_mc_spread = QtWidgets.QLineEdit(parent=self.FitTab)
+        self.txt_mc_spread.setMinimumSize(QtCore.QSize(30, 20))
+        self.txt_mc_spread.setMaximumSize(QtCore.QSize(30, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.txt_mc_spread.setFont(font)
+        self.txt_mc_spread.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.txt_mc_spread.setObjectName("txt_mc_spread")
+        self.horizontalLayout_192.addWidget(self.txt_mc_spread)
+        self.label_19 = QtWidgets.QLabel(parent=self.FitTab)
+        self.label_19.setMinimumSize(QtCore.QSize(100, 20))
+        self.label_19.setMaximumSize(QtCore.QSize(100, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.label_19.setFont(font)
+        self.label_19.setObjectName("label_19")
+        self.horizontalLayout_192.addWidget(self.label_19)
+        self.txt_mc_soc = QtWidgets.QLineEdit(parent=self.FitTab)
+        self.txt_mc_soc.setMinimumSize(QtCore.QSize(40, 20))
+        self.txt_mc_soc.setMaximumSize(QtCore.QSize(40, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.txt_mc_soc.setFont(font)
+        self.txt_mc_soc.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.txt_mc_soc.setObjectName("txt_mc_soc")
+        self.horizontalLayout_192.addWidget(self.txt_mc_soc)
+        self.txt_mc_temp = QtWidgets.QLineEdit(parent=self.FitTab)
+        self.txt_mc_temp.setMinimumSize(QtCore.QSize(30, 20))
+        self.txt_mc_temp.setMaximumSize(QtCore.QSize(30, 20))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.txt_mc_temp.setFont(font)
+        self.txt_mc_temp.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.txt_mc_temp.setObjectName("txt_mc_temp")
+        self.horizontalLayout_192.addWidget(self.txt_mc_temp)
+        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout_192.addItem(spacerItem13)
+        self.verticalLayout_37.addLayout(self.horizontalLayout_192)
         self.horizontalLayout_21 = QtWidgets.QHBoxLayout()
         self.horizontalLayout_21.setObjectName("horizontalLayout_21")
         self.cycxlabel_53 = QtWidgets.QLabel(parent=self.FitTab)
@@ -5078,8 +5195,8 @@ class Ui_sitool(object):
         self.DODTextEdit.setObjectName("DODTextEdit")
         self.horizontalLayout_20.addWidget(self.DODTextEdit)
         self.verticalLayout_24.addLayout(self.horizontalLayout_20)
-        spacerItem13 = QtWidgets.QSpacerItem(143, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_24.addItem(spacerItem13)
+        spacerItem14 = QtWidgets.QSpacerItem(143, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_24.addItem(spacerItem14)
         self.horizontalLayout_25.addLayout(self.verticalLayout_24)
         self.verticalLayout_25 = QtWidgets.QVBoxLayout()
         self.verticalLayout_25.setObjectName("verticalLayout_25")
@@ -5233,8 +5350,8 @@ class Ui_sitool(object):
         self.RestTextEdit_2.setObjectName("RestTextEdit_2")
         self.horizontalLayout_22.addWidget(self.RestTextEdit_2)
         self.verticalLayout_26.addLayout(self.horizontalLayout_22)
-        spacerItem14 = QtWidgets.QSpacerItem(143, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_26.addItem(spacerItem14)
+        spacerItem15 = QtWidgets.QSpacerItem(143, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_26.addItem(spacerItem15)
         self.horizontalLayout_25.addLayout(self.verticalLayout_26)
         self.verticalLayout_28 = QtWidgets.QVBoxLayout()
         self.verticalLayout_28.setObjectName("verticalLayout_28")
@@ -5301,8 +5418,8 @@ class Ui_sitool(object):
         self.RestTextEdit.setObjectName("RestTextEdit")
         self.horizontalLayout_24.addWidget(self.RestTextEdit)
         self.verticalLayout_28.addLayout(self.horizontalLayout_24)
-        spacerItem15 = QtWidgets.QSpacerItem(142, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
-        self.verticalLayout_28.addItem(spacerItem15)
+        spacerItem16 = QtWidgets.QSpacerItem(142, 44, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.verticalLayout_28.addItem(spacerItem16)
         self.horizontalLayout_25.addLayout(self.verticalLayout_28)
         self.verticalLayout_10.addLayout(self.horizontalLayout_25)
         self.line_2 = QtWidgets.QFrame(parent=self.SimGroupConst)
@@ -5611,9 +5728,18 @@ class Ui_sitool(object):
         self.figsaveok.setFont(font)
         self.figsaveok.setObjectName("figsaveok")
         self.horizontalLayout_13.addWidget(self.figsaveok)
+        self.task_cancel = QtWidgets.QPushButton(parent=self.layoutWidget)
+        self.task_cancel.setMinimumSize(QtCore.QSize(80, 30))
+        self.task_cancel.setMaximumSize(QtCore.QSize(80, 30))
+        font = QtGui.QFont()
+        font.setFamily("맑은 고딕")
+        font.setPointSize(9)
+        self.task_cancel.setFont(font)
+        self.task_cancel.setObjectName("task_cancel")
+        self.horizontalLayout_13.addWidget(self.task_cancel)
         self.progressBar = QtWidgets.QProgressBar(parent=self.layoutWidget)
-        self.progressBar.setMinimumSize(QtCore.QSize(1400, 30))
-        self.progressBar.setMaximumSize(QtCore.QSize(1400, 30))
+        self.progressBar.setMinimumSize(QtCore.QSize(1314, 30))
+        self.progressBar.setMaximumSize(QtCore.QSize(1314, 30))
         font = QtGui.QFont()
         font.setFamily("맑은 고딕")
         font.setPointSize(9)
@@ -5872,6 +5998,9 @@ class Ui_sitool(object):
         self.cycxlabel_15.setText(_translate("sitool", "실행 횟수"))
         self.dvdq_test_no.setText(_translate("sitool", "100"))
         self.cycxlabel_26.setText(_translate("sitool", "RMS (%)"))
+        self.cycxlabel_63.setText(_translate("sitool", "사이클 (시작 끝 간격)"))
+        self.dvdq_batch_cycle.setText(_translate("sitool", "1 1000 100"))
+        self.dvdq_batch.setText(_translate("sitool", "사이클별 dVdQ Batch Fitting"))
         self.dvdq_ini_reset.setText(_translate("sitool", "초기치 Reset"))
         self.mat_dvdq_btn.setText(_translate("sitool", "1) 소재 결과 Load"))
         self.pro_dvdq_btn.setText(_translate("sitool", "2) 실험 결과 Load"))
@@ -5958,6 +6087,14 @@ class Ui_sitool(object):
         self.txt_storageratio.setText(_translate("sitool", "0"))
         self.label_16.setText(_translate("sitool", "저장 Count2 (hr/cycle) (>32도)"))
         self.txt_storageratio2.setText(_translate("sitool", "0"))
+        self.chk_montecarlo.setText(_translate("sitool", "Monte-Carlo"))
+        self.label_17.setText(_translate("sitool", "사용자 수"))
+        self.txt_mc_users.setText(_translate("sitool", "2000"))
+        self.label_18.setText(_translate("sitool", "조건 산포(%)"))
+        self.txt_mc_spread.setText(_translate("sitool", "10"))
+        self.label_19.setText(_translate("sitool", "SOC/온도 산포"))
+        self.txt_mc_soc.setText(_translate("sitool", "0.02"))
+        self.txt_mc_temp.setText(_translate("sitool", "3"))
         self.cycxlabel_53.setText(_translate("sitool", "Parameter 경로"))
         self.chk_cell_cycle.setText(_translate("sitool", "Cell수명"))
         self.chk_set_cycle.setText(_translate("sitool", "Set수명"))
@@ -6049,6 +6186,7 @@ class Ui_sitool(object):
         self.saveok.setText(_translate("sitool", "데이터 저장"))
         self.ect_saveok.setText(_translate("sitool", "ECT용 데이터 저장"))
         self.figsaveok.setText(_translate("sitool", "그림 저장"))
+        self.task_cancel.setText(_translate("sitool", "취소"))
 
 
 if __name__ == "__main__":